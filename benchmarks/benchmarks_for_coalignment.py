@@ -0,0 +1,32 @@
+import os
+
+import numpy as np
+
+import astropy.units as u
+
+import sunpy.data.test
+import sunpy.map
+from sunpy.image.coalignment import apply_shifts, calculate_match_template_shift
+
+
+class CoalignmentSuite:
+    """
+    Benchmarks for calculating and applying the shifts that coalign a
+    sequence of maps, with the template matching and the phase correlation
+    methods.
+    """
+    params = ['match_template', 'phase_correlation']
+    param_names = ['method']
+
+    def setup(self, method):
+        smap = sunpy.map.Map(os.path.join(sunpy.data.test.rootdir, 'aia_171_level1.fits'))
+        smap = smap.resample((512, 512)*u.pix)
+        self._sequence = sunpy.map.Map([smap] * 10, sequence=True)
+        self._shifts = np.linspace(0, 5, 10) * u.pix
+
+    def time_calculate_match_template_shift(self, method):
+        calculate_match_template_shift(self._sequence, method=method)
+
+    def time_apply_shifts(self, method):
+        shift_method = 'fourier' if method == 'phase_correlation' else 'spline'
+        apply_shifts(self._sequence, self._shifts, -self._shifts, method=shift_method)
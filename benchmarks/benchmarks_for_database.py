@@ -0,0 +1,57 @@
+from datetime import datetime, timedelta
+
+from sunpy.database import Database, attrs
+from sunpy.database.tables import DatabaseEntry, FitsHeaderEntry
+from sunpy.net import attrs as a
+
+
+def _entries(start, number):
+    time = datetime(2020, 1, 1)
+    return [DatabaseEntry(fileid=f'file{i}', observation_time_start=time + timedelta(seconds=i),
+                          observation_time_end=time + timedelta(seconds=i+1),
+                          instrument='AIA', wavemin=17.1, wavemax=17.1,
+                          fits_header_entries=[FitsHeaderEntry('EXPTIME', '2.0')])
+            for i in range(start, start + number)]
+
+
+class DatabaseSuite:
+    """
+    Benchmarks for adding entries to a database which already holds entries.
+    """
+    def setup(self):
+        self._database = Database('sqlite:///:memory:')
+        self._database.add_many(_entries(0, 5000))
+        self._database.commit()
+        self._new_entries = _entries(5000, 5000)
+
+    def time_add_many(self):
+        self._database.add_many(self._new_entries)
+        self._database.commit()
+
+
+class DatabaseSearchSuite:
+    """
+    Benchmarks for searching a database with a compound query, and with
+    queries on the FITS header entries.
+    """
+    def setup(self):
+        self._database = Database('sqlite:///:memory:', promoted_header_keys=['EXPTIME'])
+        self._database.add_many(_entries(0, 20000))
+        self._database.commit()
+        self._query = ((a.Time('2020-01-01 01:00', '2020-01-01 02:00') | attrs.Tag('foo'))
+                       & a.Instrument('AIA') & ~attrs.Starred())
+
+    def time_search(self):
+        self._database.search(self._query)
+
+    def time_search_limit(self):
+        self._database.search(self._query, limit=10)
+
+    def time_iter_search_first(self):
+        next(self._database.iter_search(self._query, page_size=10))
+
+    def time_search_header_entry(self):
+        self._database.search(attrs.FitsHeaderEntry('EXPTIME', '1.0'))
+
+    def time_search_header_range(self):
+        self._database.search(attrs.FitsHeaderRange('EXPTIME', 0, 1))
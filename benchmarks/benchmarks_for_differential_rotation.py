@@ -0,0 +1,27 @@
+import os
+
+import astropy.units as u
+
+import sunpy.data.test
+import sunpy.map
+from sunpy.physics.differential_rotation import differential_rotate, differential_rotate_sequence
+
+
+class DifferentialRotationSuite:
+    """
+    Benchmarks for differentially rotating a stack of maps to a common time,
+    one map at a time and all together.
+    """
+    def setup(self):
+        smap = sunpy.map.Map(os.path.join(sunpy.data.test.rootdir, 'aia_171_level1.fits'))
+        smap = smap.resample((512, 512)*u.pix)
+        self._maps = [sunpy.map.Map(smap.data, dict(smap.meta, **{'date-obs': (smap.date + i*12*u.s).isot}))
+                      for i in range(10)]
+        self._time = smap.date + 1*u.day
+
+    def time_differential_rotate(self):
+        for smap in self._maps:
+            differential_rotate(smap, time=self._time)
+
+    def time_differential_rotate_sequence(self):
+        differential_rotate_sequence(self._maps, time=self._time)
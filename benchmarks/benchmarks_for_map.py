@@ -29,3 +29,60 @@ class PeakMemorySuite:
 
     def peakmem_sunpy_map(self):
         sunpy.map.Map(self._map)
+
+
+class WCSSuite:
+    """
+    Benchmarks for constructing the WCS of a map, both when it has to be
+    built from the metadata and when it can be taken from the WCS cache.
+    """
+    def setup(self):
+        self._map = sunpy.map.Map(sunpy.data.sample.AIA_171_IMAGE)
+
+    def time_wcs_uncached(self):
+        sunpy.map.mapbase._wcs_cache.clear()
+        sunpy.map.Map(self._map.data, self._map.meta).wcs
+
+    def time_wcs_cached(self):
+        sunpy.map.Map(self._map.data, self._map.meta).wcs
+
+    def time_wcs_sequence(self):
+        sunpy.map.mapbase._wcs_cache.clear()
+        maps = [sunpy.map.Map(self._map.data, self._map.meta) for _ in range(10)]
+        for m in sunpy.map.Map(maps, sequence=True):
+            m.wcs
+
+
+class CutoutSuite:
+    """
+    Benchmarks for cutting a small region out of a 4k x 4k FITS file, by
+    reading the whole file and by only reading the region.
+    """
+    def setup(self):
+        import os
+        import tempfile
+
+        import numpy as np
+
+        import astropy.units as u
+
+        smap = sunpy.map.Map(sunpy.data.sample.AIA_171_IMAGE).resample([4096, 4096] * u.pix)
+        self._dir = tempfile.TemporaryDirectory()
+        self._path = os.path.join(self._dir.name, 'aia_4k.fits')
+        sunpy.map.Map(smap.data.astype(np.float32), smap.meta).save(self._path)
+        self._region = [[2000, 2000], [2255, 2255]] * u.pix
+
+    def teardown(self):
+        self._dir.cleanup()
+
+    def time_submap_after_read(self):
+        sunpy.map.Map(self._path).submap(self._region[0], top_right=self._region[1])
+
+    def time_read_region(self):
+        sunpy.map.Map(self._path, region=self._region)
+
+    def peakmem_submap_after_read(self):
+        sunpy.map.Map(self._path).submap(self._region[0], top_right=self._region[1])
+
+    def peakmem_read_region(self):
+        sunpy.map.Map(self._path, region=self._region)
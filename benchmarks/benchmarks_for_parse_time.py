@@ -1,3 +1,4 @@
+import numpy as np
 
 from sunpy.time import parse_time
 
@@ -20,3 +21,39 @@ class MemSuite:
 class PeakMemorySuite:
     def peakmem_parse_time(self):
         t = parse_time('1995-12-31 23:59:60')
+
+
+class BulkSuite:
+    """
+    Benchmarks for parsing large lists and arrays of time strings which all
+    have the same format, and arrays of `numpy.datetime64`.
+    """
+    params = [10**5, 10**6]
+    param_names = ['size']
+
+    def setup(self, size):
+        times = np.datetime64('2010-01-01T00:00:00') + np.arange(size) * np.timedelta64(1500, 'ms')
+        self._isot = np.datetime_as_string(times, unit='ms').tolist()
+        self._sunpy_format = [t.replace('-', '/').replace('T', ' ')[:19] for t in self._isot]
+        self._datetime64 = times
+
+    def time_parse_time_isot_list(self, size):
+        parse_time(self._isot)
+
+    def time_parse_time_sunpy_format_list(self, size):
+        parse_time(self._sunpy_format)
+
+    def time_parse_time_sunpy_format_array(self, size):
+        parse_time(np.array(self._sunpy_format))
+
+    def time_parse_time_datetime64(self, size):
+        parse_time(self._datetime64)
+
+
+class RepeatedSuite:
+    """
+    Benchmark for parsing the same time string many times.
+    """
+    def time_parse_time_repeated(self):
+        for _ in range(1000):
+            parse_time('2012/08/01 12:34:56')
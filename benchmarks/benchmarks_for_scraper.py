@@ -0,0 +1,42 @@
+from datetime import datetime, timedelta
+
+from sunpy.time import TimeRange
+from sunpy.util.scraper import Scraper, _extract_hrefs
+
+
+class LinkExtractionSuite:
+    """
+    Benchmarks for extracting the links from the HTML listing of a directory
+    with many files.
+    """
+    def setup(self):
+        rows = [f'<tr><td><a href="aia_lev1_171a_2020_01_01t00_{i // 60:02}_{i % 60:02}z.fits">'
+                f'aia_lev1_171a_2020_01_01t00_{i // 60:02}_{i % 60:02}z.fits</a></td>'
+                f'<td align="right">2020-01-01 01:00</td><td align="right">12M</td></tr>'
+                for i in range(10000)]
+        self._page = '<html><body><table>{}</table></body></html>'.format('\n'.join(rows))
+
+    def time_extract_hrefs(self):
+        _extract_hrefs(self._page)
+
+
+class FileMatchingSuite:
+    """
+    Benchmarks for selecting the files of a large directory listing which
+    follow a pattern and are within a time range.
+    """
+    params = [False, True]
+    param_names = ['extractor']
+
+    def setup(self, extractor):
+        pattern = 'http://example.com/%Y/%m/%d/aia_lev1_171a_%Y_%m_%dt%H_%M_%Sz.fits'
+        self._scraper = Scraper(pattern)
+        if extractor:
+            self._scraper.extractor = ('http://example.com/{:4d}/{:2d}/{:2d}/aia_lev1_171a_'
+                                       '{year:4d}_{month:2d}_{day:2d}t{hour:2d}_{minute:2d}_{second:2d}z.fits')
+        start = datetime(2020, 1, 1)
+        self._urls = [(start + timedelta(seconds=12*i)).strftime(pattern) for i in range(20000)]
+        self._timerange = TimeRange('2020-01-01 06:00', '2020-01-01 18:00')
+
+    def time_files_in_timerange(self, extractor):
+        self._scraper._files_in_timerange(self._urls, self._timerange)
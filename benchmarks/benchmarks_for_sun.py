@@ -0,0 +1,53 @@
+import numpy as np
+
+import astropy.units as u
+from astropy.coordinates import SkyCoord
+from astropy.time import Time
+
+from sunpy.coordinates import frames, sun
+from sunpy.coordinates.ephemeris import ephemeris_cache
+
+
+class EphemerisSuite:
+    """
+    Benchmarks for the Sun-specific quantities and transformations which use
+    the positions of the Sun and the Earth, at repeated observation times.
+    """
+    def setup(self):
+        self._time = Time('2020-01-01') + np.arange(100) * u.hour
+        self._coord = SkyCoord(0*u.deg, 0*u.deg, frame=frames.HeliographicStonyhurst,
+                               obstime=self._time[0])
+        ephemeris_cache.warm(self._time)
+
+    def time_L0_B0(self):
+        for time in self._time[:10]:
+            sun.L0(time)
+            sun.B0(time)
+
+    def time_hgs_to_hgs(self):
+        for time in self._time[:10]:
+            self._coord.transform_to(frames.HeliographicStonyhurst(obstime=time))
+
+    def time_earth_distance_array(self):
+        sun.earth_distance(self._time)
+
+
+class CarringtonRotationSuite:
+    """
+    Benchmarks for labelling ten years of times with their Carrington rotation
+    numbers, and for the reverse, with the exact and the table methods.
+    """
+    params = ['exact', 'table']
+    param_names = ['method']
+
+    def setup(self, method):
+        self._time = Time('2010-01-01') + np.linspace(0, 3650, 10000) * u.day
+        self._crot = np.linspace(2090, 2220, 10000)
+        # Compute the table outside of the timed functions
+        sun.carrington_rotation_number(self._time, method='table')
+
+    def time_carrington_rotation_number(self, method):
+        sun.carrington_rotation_number(self._time, method=method)
+
+    def time_carrington_rotation_time(self, method):
+        sun.carrington_rotation_time(self._crot, method=method)
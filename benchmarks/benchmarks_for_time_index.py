@@ -0,0 +1,27 @@
+import numpy as np
+
+import astropy.units as u
+
+from sunpy.time import offsets_to_datetime64, parse_time
+
+
+class TimeIndexSuite:
+    """
+    Benchmarks for building the time index of a day of data, with the number
+    of samples in the daily files of RHESSI (4 s), GOES/XRS (2 s), SDO/EVE
+    (0.25 s) and PROBA2/LYRA (0.05 s), and for parsing it back into a
+    `~astropy.time.Time`.
+    """
+    params = [21600, 43200, 345600, 1728000]
+    param_names = ['samples']
+
+    def setup(self, samples):
+        self._epoch = parse_time('2016-12-31 00:00')
+        self._offsets = np.linspace(0, 86400, samples, endpoint=False) * u.s
+        self._index = offsets_to_datetime64(self._epoch, self._offsets)
+
+    def time_offsets_to_datetime64(self, samples):
+        offsets_to_datetime64(self._epoch, self._offsets)
+
+    def time_parse_time_datetime64(self, samples):
+        parse_time(self._index)
@@ -2,6 +2,11 @@ import os
 import logging
 import tempfile
 import importlib
+import threading
+from pathlib import Path
+from unittest.mock import patch
+from contextlib import ExitStack
+from http.server import ThreadingHTTPServer
 
 import pytest
 
@@ -52,6 +57,48 @@ def tmp_config_dir(request):
     astropy.config.paths.set_temp_cache._temp_path = None
 
 
+@pytest.fixture(scope='session', autouse=True)
+def tmp_remote_caches(request):
+    """
+    Globally keep the listings of remote archives and the information about
+    JSOC series, which are cached between searches, in a tmp dir.
+    """
+    from sunpy.data.data_manager.listing_cache import ListingCache
+    from sunpy.net.jsoc.series_cache import SeriesCache
+
+    with tempfile.TemporaryDirectory() as tmpdir, ExitStack() as stack:
+        caches = {}
+        for target, cache in [('sunpy.util.scraper.listing_cache', ListingCache(Path(tmpdir) / 'listings.db')),
+                              ('sunpy.net.jsoc.jsoc.series_cache', SeriesCache(Path(tmpdir) / 'jsoc_series.db'))]:
+            try:
+                stack.enter_context(patch(target, cache))
+            except ImportError:
+                # The optional dependencies of the module are not installed
+                continue
+            caches[target.rsplit('.', 1)[1]] = cache
+        yield caches
+
+
+@pytest.fixture()
+def listing_cache(tmp_remote_caches):
+    """
+    Provide the listing cache used by the scraper, emptied for the test.
+    """
+    cache = tmp_remote_caches['listing_cache']
+    cache.clear()
+    return cache
+
+
+@pytest.fixture()
+def series_cache(tmp_remote_caches):
+    """
+    Provide the cache of the information about JSOC series, emptied for the test.
+    """
+    cache = tmp_remote_caches['series_cache']
+    cache.clear()
+    return cache
+
+
 @pytest.fixture()
 def sunpy_cache(mocker, tmp_path):
     """
@@ -84,6 +131,31 @@ def sunpy_cache(mocker, tmp_path):
     yield func
 
 
+@pytest.fixture()
+def http_server():
+    """
+    Provide a way to serve requests from a local HTTP server, which is shut
+    down after the test.
+
+    Called with a `http.server.BaseHTTPRequestHandler` subclass, it starts
+    a `http.server.ThreadingHTTPServer` using that handler and returns it,
+    with its root URL as ``url``.
+    """
+    servers = []
+
+    def func(handler):
+        server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        server.daemon_threads = True
+        server.url = f'http://127.0.0.1:{server.server_address[1]}/'
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+    yield func
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
 @pytest.fixture()
 def undo_config_dir_patch():
     """
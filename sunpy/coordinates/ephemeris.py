@@ -1,6 +1,9 @@
 """
 Ephemeris calculations using SunPy coordinate frames
 """
+import threading
+from collections import OrderedDict
+
 import numpy as np
 
 import astropy.units as u
@@ -11,12 +14,14 @@ from astropy.coordinates import (
     SkyCoord,
     get_body_barycentric,
     get_body_barycentric_posvel,
+    solar_system_ephemeris,
 )
 from astropy.coordinates.representation import (
     CartesianDifferential,
     CartesianRepresentation,
     SphericalRepresentation,
 )
+from astropy.time import Time
 
 from sunpy import log
 from sunpy.time import parse_time
@@ -28,7 +33,153 @@ __author__ = "Albert Y. Shih"
 __email__ = "ayshih@gmail.com"
 
 __all__ = ['get_body_heliographic_stonyhurst', 'get_earth',
-           'get_horizons_coord']
+           'get_horizons_coord', 'EphemerisCache', 'ephemeris_cache']
+
+
+class EphemerisCache:
+    """
+    A bounded cache of the barycentric positions of the Sun and the Earth,
+    keyed on observation time.
+
+    The frame transformations that involve the Sun-Earth line, and the
+    functions that use `get_earth`, look up the positions here instead of
+    evaluating the solar-system ephemeris for every call. The cache used by
+    sunpy is `sunpy.coordinates.ephemeris.ephemeris_cache`.
+
+    Parameters
+    ----------
+    maxsize : `int`, optional
+        The maximum number of distinct times to hold. The least recently
+        used times are evicted first. Time arrays with more elements than
+        this bypass the cache.
+    resolution : `~astropy.units.Quantity`, optional
+        The times are quantised to multiples of this interval, and the
+        positions are evaluated at the quantised time, so nearby times share
+        a cache entry. The default of zero only shares entries between
+        identical times.
+
+    Notes
+    -----
+    The cache is keyed on the time, its scale and the name of the current
+    `~astropy.coordinates.solar_system_ephemeris`. Times which have a
+    ``location`` bypass the cache, because their TDB time depends on it.
+
+    Examples
+    --------
+    Precompute the positions for a series of observation times before
+    transforming coordinates at those times
+
+    >>> import astropy.units as u
+    >>> from astropy.time import Time
+    >>> from sunpy.coordinates.ephemeris import ephemeris_cache
+    >>> ephemeris_cache.warm(Time('2020-01-01') + range(10) * u.hour)
+    """
+
+    def __init__(self, maxsize=10000, resolution=0*u.s):
+        self.maxsize = maxsize
+        self.resolution = resolution
+        self._dict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._dict)
+
+    def clear(self):
+        """
+        Empty the cache.
+        """
+        with self._lock:
+            self._dict.clear()
+
+    @add_common_docstring(**_variables_for_parse_time_docstring())
+    def warm(self, time):
+        """
+        Evaluate and store the positions for all of the given times.
+
+        Parameters
+        ----------
+        time : {parse_time_types}
+            The times, in a parse_time-compatible format.
+        """
+        self.positions(parse_time(time))
+
+    def _keys(self, time):
+        """
+        Return the cache keys of the elements of a time array, and the times
+        at which to evaluate the positions for them.
+        """
+        ephemeris = solar_system_ephemeris.get()
+        jd1 = np.ravel(time.jd1)
+        jd2 = np.ravel(time.jd2)
+        resolution = self.resolution.to_value(u.day)
+        if resolution > 0:
+            # Count the intervals from J2000 to keep the full precision
+            steps = np.round(((jd1 - 2451545.0) + jd2) / resolution)
+            jd1 = np.full_like(steps, 2451545.0)
+            jd2 = steps * resolution
+            keys = [(ephemeris, time.scale, resolution, step) for step in steps.tolist()]
+        else:
+            keys = [(ephemeris, time.scale, pair) for pair in zip(jd1.tolist(), jd2.tolist())]
+        return keys, jd1, jd2
+
+    def positions(self, time):
+        """
+        Return the barycentric positions of the Sun and the Earth.
+
+        Parameters
+        ----------
+        time : `~astropy.time.Time`
+            The times at which to return the positions.
+
+        Returns
+        -------
+        sun, earth : `~astropy.coordinates.CartesianRepresentation`
+            The positions, in the shape of ``time``.
+        """
+        sun, earth = self._xyz(time)
+        return (CartesianRepresentation(sun, unit=u.AU, xyz_axis=-1, copy=False),
+                CartesianRepresentation(earth, unit=u.AU, xyz_axis=-1, copy=False))
+
+    def _xyz(self, time):
+        """
+        Return the barycentric positions of the Sun and the Earth in AU, as
+        arrays with a trailing axis of length 3.
+        """
+        if time.location is not None or not 0 < time.size <= self.maxsize:
+            return tuple(np.moveaxis(get_body_barycentric(body, time).xyz.to_value(u.AU), 0, -1)
+                         for body in ('sun', 'earth'))
+
+        keys, jd1, jd2 = self._keys(time)
+        with self._lock:
+            values = [self._dict.get(key) for key in keys]
+
+        missing = {}
+        for i, (key, value) in enumerate(zip(keys, values)):
+            if value is None:
+                missing.setdefault(key, i)
+        if missing:
+            index = list(missing.values())
+            missing_time = Time(jd1[index], jd2[index], format='jd', scale=time.scale)
+            sun = get_body_barycentric('sun', missing_time).xyz.to_value(u.AU)
+            earth = get_body_barycentric('earth', missing_time).xyz.to_value(u.AU)
+            computed = dict(zip(missing, np.concatenate([sun, earth]).T))
+            values = [computed[key] if value is None else value for key, value in zip(keys, values)]
+
+        with self._lock:
+            for key, value in zip(keys, values):
+                self._dict[key] = value
+                self._dict.move_to_end(key)
+            while len(self._dict) > self.maxsize:
+                self._dict.popitem(last=False)
+
+        xyz = np.stack(values).reshape(time.shape + (2, 3))
+        return xyz[..., 0, :], xyz[..., 1, :]
+
+
+ephemeris_cache = EphemerisCache()
+"""
+The `EphemerisCache` used by sunpy for the positions of the Sun and the Earth.
+"""
 
 
 @add_common_docstring(**_variables_for_parse_time_docstring())
@@ -185,7 +336,19 @@ def get_earth(time='now', *, include_velocity=False):
      (d_lon, d_lat, d_distance) in (arcsec / s, arcsec / s, km / s)
         (0.0424104, -0.00279484, 0.2496851)>
     """
-    earth = get_body_heliographic_stonyhurst('earth', time=time, include_velocity=include_velocity)
+    if include_velocity:
+        earth = get_body_heliographic_stonyhurst('earth', time=time, include_velocity=True)
+    else:
+        # Import here to avoid a circular import
+        from .transformations import _affine_params_hcrs_to_hgs
+
+        # Rotate the Sun-Earth vector, which is the Earth's position in HCRS, to HGS
+        obstime = parse_time(time)
+        matrix, _ = _affine_params_hcrs_to_hgs(obstime, obstime)
+        sun, earth = ephemeris_cache._xyz(obstime)
+        earth_hgs = np.einsum('...ij,...j->...i', matrix, earth - sun)
+        earth = HeliographicStonyhurst(CartesianRepresentation(earth_hgs, unit=u.AU, xyz_axis=-1),
+                                       obstime=obstime)
 
     # Explicitly set the longitude to 0
     earth_repr = SphericalRepresentation(0*u.deg, earth.lat, earth.radius)
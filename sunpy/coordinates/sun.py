@@ -16,7 +16,7 @@ from astropy.coordinates import (
     Latitude,
     Longitude,
     SkyCoord,
-    get_body_barycentric,
+    solar_system_ephemeris,
 )
 from astropy.coordinates.builtin_frames.utils import get_jd12
 from astropy.coordinates.representation import CartesianRepresentation, SphericalRepresentation
@@ -29,7 +29,7 @@ from sunpy.sun import constants
 from sunpy.time import parse_time
 from sunpy.time.time import _variables_for_parse_time_docstring
 from sunpy.util.decorators import add_common_docstring
-from .ephemeris import get_earth
+from .ephemeris import ephemeris_cache, get_earth
 from .frames import HeliographicStonyhurst
 from .transformations import _SOLAR_NORTH_POLE_HCRS, _SUN_DETILT_MATRIX
 
@@ -91,8 +91,56 @@ def sky_position(t='now', equinox_of_date=True):
     return ra, dec
 
 
+# The reference Julian date (TT) of the grid for method='table', and the grid step in days
+_CARRINGTON_TABLE_EPOCH = 2451545.0
+_CARRINGTON_TABLE_STEP = 1.
+# The number of grid points in each segment of the table, which is computed when first needed
+_CARRINGTON_TABLE_SEGMENT = 366
+_carrington_table_segments = {}
+
+
+def _carrington_rotation_table(index):
+    """
+    Return the Carrington rotation numbers at the given points of the table grid.
+
+    The table is computed with `carrington_rotation_number` one segment of the grid at a time, for
+    the segments that contain the requested points, and kept for the current solar-system ephemeris.
+    """
+    ephemeris = solar_system_ephemeris.get()
+    segment, offset = np.divmod(index, _CARRINGTON_TABLE_SEGMENT)
+    values = np.empty(index.shape)
+    for i in np.unique(segment):
+        key = (ephemeris, i)
+        if key not in _carrington_table_segments:
+            grid = (i * _CARRINGTON_TABLE_SEGMENT + np.arange(_CARRINGTON_TABLE_SEGMENT)) * _CARRINGTON_TABLE_STEP
+            time = Time(_CARRINGTON_TABLE_EPOCH, grid, format='jd', scale='tt')
+            _carrington_table_segments[key] = carrington_rotation_number(time)
+        in_segment = segment == i
+        values[in_segment] = _carrington_table_segments[key][offset[in_segment]]
+    return values
+
+
+def _carrington_rotation_number_table(days):
+    """
+    Interpolate the Carrington rotation number at a number of TT days from the table epoch.
+
+    This uses four-point Lagrange interpolation of the tabulated values.
+    """
+    position = days / _CARRINGTON_TABLE_STEP
+    index = np.floor(position).astype(int)
+    s = position - index
+    weights = [-s * (s - 1) * (s - 2) / 6, (s + 1) * (s - 1) * (s - 2) / 2,
+               -(s + 1) * s * (s - 2) / 2, (s + 1) * s * (s - 1) / 6]
+    return sum(weight * _carrington_rotation_table(index + i - 1) for i, weight in enumerate(weights))
+
+
+def _check_carrington_method(method):
+    if method not in ('exact', 'table'):
+        raise ValueError("method must be one of 'exact' or 'table'.")
+
+
 @u.quantity_input
-def carrington_rotation_time(crot, longitude: u.deg = None):
+def carrington_rotation_time(crot, longitude: u.deg = None, method='exact'):
     """
     Return the time of a given Carrington rotation.
 
@@ -114,6 +162,13 @@ def carrington_rotation_time(crot, longitude: u.deg = None):
         Carrington longitude(s), which must be > 0 degrees and <= 360 degrees.
         If provided, ``crot`` must be strictly integral.
 
+    method : {'exact', 'table'}, optional
+        If ``'table'``, invert a table of Carrington rotation numbers rather than calculating
+        the rotation number of each time exactly, which is much faster for large arrays.  See
+        `carrington_rotation_number` for the accuracy of the table.  The table is inverted to
+        convergence, so the round-trip from this method to `carrington_rotation_number` with
+        ``method='table'`` has absolute errors of < 1 millisecond.  Defaults to ``'exact'``.
+
     Returns
     -------
     `astropy.time.Time`
@@ -128,7 +183,10 @@ def carrington_rotation_time(crot, longitude: u.deg = None):
     <Time object: scale='utc' format='iso' value=2003-02-27 02:52:57.315>
     >>> carrington_rotation_time(2000, 270*u.deg)
     <Time object: scale='utc' format='iso' value=2003-02-27 02:52:57.315>
+    >>> carrington_rotation_time(2000.25, method='table')
+    <Time object: scale='utc' format='iso' value=2003-02-27 02:52:57.373>
     """
+    _check_carrington_method(method)
     crot = crot << u.one
     if longitude is not None:
         if not u.allclose(crot%1, 0):
@@ -147,6 +205,17 @@ def carrington_rotation_time(crot, longitude: u.deg = None):
         # Correct the estimate using a linear fraction of the Carrington rotation period
         return estimate + (dcrot * constants.mean_synodic_period)
 
+    if method == 'table':
+        # The table is cheap to evaluate, so iterate the same correction to convergence
+        period = constants.mean_synodic_period.to_value(u.day)
+        crot = crot.to_value(u.one)
+        days = (estimate.tt.jd1 - _CARRINGTON_TABLE_EPOCH) + estimate.tt.jd2
+        for _ in range(5):
+            days = days + (crot - _carrington_rotation_number_table(days)) * period
+        t = Time(_CARRINGTON_TABLE_EPOCH, days, scale='tt', format='jd').utc
+        t.format = 'iso'
+        return t
+
     # Perform two iterations of the correction to achieve sub-second accuracy
     estimate = refine(estimate)
     estimate = refine(estimate)
@@ -156,7 +225,7 @@ def carrington_rotation_time(crot, longitude: u.deg = None):
 
 
 @add_common_docstring(**_variables_for_parse_time_docstring())
-def carrington_rotation_number(t='now'):
+def carrington_rotation_number(t='now', method='exact'):
     """
     Return the Carrington rotation number.  Each whole rotation number marks when the Sun's prime
     meridian coincides with the central meridian as seen from Earth, with the first rotation
@@ -166,9 +235,29 @@ def carrington_rotation_number(t='now'):
     ----------
     t : {parse_time_types}
         Time to use in a parse-time-compatible format
+    method : {{'exact', 'table'}}, optional
+        If ``'exact'``, calculate the rotation number from the Carrington longitude of the disk
+        center at each time.  If ``'table'``, interpolate a table of exact rotation numbers on a
+        grid with a spacing of one day, which is much faster for large arrays.  The interpolated
+        rotation numbers differ from the exact values by < 4e-10, i.e., < 1 millisecond of solar
+        rotation.  Each year of the table is calculated and kept the first time that it is needed.
+        Defaults to ``'exact'``.
+
+    Examples
+    --------
+    >>> from sunpy.coordinates.sun import carrington_rotation_number
+    >>> carrington_rotation_number('2003-02-27 02:52:57.315')  # doctest: +FLOAT_CMP
+    2000.249999975626
+    >>> carrington_rotation_number('2003-02-27 02:52:57.315', method='table')  # doctest: +FLOAT_CMP
+    2000.2499999755048
     """
+    _check_carrington_method(method)
     time = parse_time(t)
 
+    if method == 'table':
+        days = (time.tt.jd1 - _CARRINGTON_TABLE_EPOCH) + time.tt.jd2
+        return _carrington_rotation_number_table(np.asarray(days))[()]
+
     # Estimate the Carrington rotation number by dividing the time that has elapsed since
     # JD 2398167.4 (late in the day on 1853 Nov 9), see Astronomical Algorithms (Meeus 1998, p.191),
     # by the mean synodic period (27.2753 days)
@@ -584,20 +673,22 @@ def L0(time='now',
       `(link) <http://asa.hmnao.com/static/files/sun_rotation_change.pdf>`__
     """
     obstime = parse_time(time)
-    earth = get_earth(obstime)
+    sun, earth = ephemeris_cache.positions(obstime)
+    sun_earth = earth - sun
 
     # Calculate the de-tilt longitude of the Earth
-    dlon_earth = _detilt_lon(earth)
+    dlon_earth = sun_earth.transform(_SUN_DETILT_MATRIX).represent_as(SphericalRepresentation).lon.to('deg')
+    earth_distance = sun_earth.norm()
 
     # Calculate the distance to the nearest point on the Sun's surface
-    distance = earth.radius - constants.radius if nearest_point else earth.radius
+    distance = earth_distance - constants.radius if nearest_point else earth_distance
 
     # Apply a correction for aberration due to Earth motion
     # This expression is an approximation to reduce computations (e.g., it does not account for the
     # inclination of the Sun's rotation axis relative to the ecliptic), but the estimated error is
     # <0.2 arcseconds
     if aberration_correction:
-        dlon_earth -= 20.496*u.arcsec * 1*u.AU / earth.radius
+        dlon_earth -= 20.496*u.arcsec * 1*u.AU / earth_distance
 
     # Antedate the observation time to account for light travel time for the Sun-Earth distance
     antetime = (obstime - distance / speed_of_light) if light_travel_time_correction else obstime
@@ -650,7 +741,8 @@ def earth_distance(time='now'):
         The Sun-Earth distance
     """
     obstime = parse_time(time)
-    vector = get_body_barycentric('earth', obstime) - get_body_barycentric('sun', obstime)
+    sun, earth = ephemeris_cache.positions(obstime)
+    vector = earth - sun
     return Distance(vector.norm())
 
 
@@ -1,14 +1,21 @@
 
+import numpy as np
 import pytest
 from hypothesis import HealthCheck, given, settings
 
 import astropy.units as u
 from astropy.constants import c as speed_of_light
-from astropy.coordinates import SkyCoord, solar_system_ephemeris
+from astropy.coordinates import SkyCoord, get_body_barycentric, solar_system_ephemeris
 from astropy.tests.helper import assert_quantity_allclose
 from astropy.time import Time
 
-from sunpy.coordinates.ephemeris import get_body_heliographic_stonyhurst, get_earth, get_horizons_coord
+from sunpy.coordinates import ephemeris
+from sunpy.coordinates.ephemeris import (
+    EphemerisCache,
+    get_body_heliographic_stonyhurst,
+    get_earth,
+    get_horizons_coord,
+)
 from .strategies import times
 
 
@@ -163,3 +170,56 @@ def test_consistency_with_horizons(use_DE440s, obstime):
     e1 = get_body_heliographic_stonyhurst('mars', obstime)
     e2 = get_horizons_coord('Mars barycenter', obstime)
     assert_quantity_allclose(e2.separation_3d(e1), 0*u.km, atol=500*u.m)
+
+
+def test_ephemeris_cache():
+    cache = EphemerisCache(maxsize=5)
+    times = Time('2020-01-01') + np.arange(4) * u.hour
+    cache.warm(times)
+    assert len(cache) == 4
+
+    sun, earth = cache.positions(times[::-1].reshape(2, 2))
+    assert sun.shape == (2, 2)
+    assert_quantity_allclose(earth.xyz[:, 0, 0], get_body_barycentric('earth', times[3]).xyz,
+                             rtol=1e-14)
+    assert_quantity_allclose(sun.xyz[:, 1, 1], get_body_barycentric('sun', times[0]).xyz,
+                             rtol=1e-14)
+
+    # Only the two least recently used times are evicted
+    cache.warm(times[0] + [1, 2, 3] * u.day)
+    assert len(cache) == 5
+    assert all(key in cache._dict for key in cache._keys(times[:2])[0])
+    assert not any(key in cache._dict for key in cache._keys(times[2:])[0])
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_ephemeris_cache_resolution():
+    cache = EphemerisCache(resolution=1*u.min)
+    time = Time('2020-01-01 00:00:10') + [0, 5, 30] * u.s
+    sun, earth = cache.positions(time)
+    assert len(cache) == 2
+    assert sun[0] == sun[1]
+    assert_quantity_allclose(earth[0].xyz, get_body_barycentric('earth', Time('2020-01-01')).xyz,
+                             rtol=1e-14)
+    assert_quantity_allclose(earth[2].xyz, get_body_barycentric('earth', Time('2020-01-01 00:01')).xyz,
+                             rtol=1e-14)
+
+
+def test_ephemeris_cache_skips_ephemeris(mocker):
+    time = Time('2021-03-04 05:06:07')
+    ephemeris.ephemeris_cache.warm(time)
+    expected = get_earth(time)
+
+    mocked = mocker.patch('sunpy.coordinates.ephemeris.get_body_barycentric',
+                          wraps=get_body_barycentric)
+    earth = get_earth(time)
+    SkyCoord(0*u.deg, 0*u.deg, frame='heliographic_stonyhurst', obstime=time).hcrs
+    mocked.assert_not_called()
+    assert_quantity_allclose(earth.lat, expected.lat)
+    assert_quantity_allclose(earth.radius, expected.radius)
+
+    # Times with a location bypass the cache
+    get_earth(Time(time, location=earth.transform_to('itrs').earth_location))
+    mocked.assert_called()
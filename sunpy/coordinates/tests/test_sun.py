@@ -519,3 +519,33 @@ def test_carrington_rotation_str():
     # Check that by default a human parseable string is returned
     t = sun.carrington_rotation_time(2210)
     assert str(t) == '2018-10-26 20:48:16.137'
+
+
+def test_carrington_rotation_number_table():
+    t = Time('1990-01-01') + np.linspace(0, 30*365, 50) * u.day
+    exact = sun.carrington_rotation_number(t)
+    table = sun.carrington_rotation_number(t.reshape(5, 10), method='table')
+    assert table.shape == (5, 10)
+    # Stated precision in the docstring is 4e-10 rotations
+    assert_allclose(table.ravel(), exact, rtol=0, atol=4e-10)
+
+    assert np.isscalar(sun.carrington_rotation_number(t[0], method='table'))
+
+
+def test_carrington_rotation_time_table():
+    crot = np.array([1860, 2000.25, 2242.9])
+    t = sun.carrington_rotation_time(crot, method='table')
+    assert t.format == 'iso'
+    # The exact method has errors of < 0.11 seconds
+    assert_quantity_allclose((t - sun.carrington_rotation_time(crot)).to(u.s), 0*u.s, atol=0.11*u.s)
+    assert sun.carrington_rotation_time(2000, 270*u.deg, method='table') == t[1]
+
+    # Stated precision in the docstring is 1 millisecond for the round trip
+    assert_allclose(sun.carrington_rotation_number(t, method='table'), crot, rtol=0, atol=4e-10)
+
+
+def test_carrington_rotation_method_err():
+    with pytest.raises(ValueError, match="method must be one of 'exact' or 'table'."):
+        sun.carrington_rotation_number('2010-01-01', method='spline')
+    with pytest.raises(ValueError, match="method must be one of 'exact' or 'table'."):
+        sun.carrington_rotation_time(2000, method='spline')
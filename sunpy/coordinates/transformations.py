@@ -21,14 +21,7 @@ import numpy as np
 
 import astropy.units as u
 from astropy.constants import c as speed_of_light
-from astropy.coordinates import (
-    HCRS,
-    ICRS,
-    BaseCoordinateFrame,
-    ConvertError,
-    HeliocentricMeanEcliptic,
-    get_body_barycentric,
-)
+from astropy.coordinates import HCRS, ICRS, BaseCoordinateFrame, ConvertError, HeliocentricMeanEcliptic
 from astropy.coordinates.baseframe import frame_transform_graph
 from astropy.coordinates.builtin_frames import make_transform_graph_docs
 from astropy.coordinates.builtin_frames.utils import get_jd12
@@ -45,6 +38,7 @@ from astropy.time import Time
 
 from sunpy import log
 from sunpy.sun import constants
+from .ephemeris import ephemeris_cache
 from .frames import (
     _J2000,
     GeocentricEarthEquatorial,
@@ -521,24 +515,27 @@ def _rotation_matrix_reprs_to_xz_about_z(representations):
     XZ plane.
     """
     A = representations.to_cartesian()
+    return _rotation_matrix_xy_to_xz_about_z(A.x.value, A.y.to_value(A.x.unit))
 
-    # Zero out the Z components
-    # (The additional transpose operations are to handle both scalar and array inputs)
-    A_no_z = CartesianRepresentation((A.xyz.T * [1, 1, 0]).T)
-
-    # Rotate the resulting vector to the X axis
-    x_axis = CartesianRepresentation(1, 0, 0)
-    matrix = _rotation_matrix_reprs_to_reprs(A_no_z, x_axis)
 
-    return matrix
+def _rotation_matrix_xy_to_xz_about_z(x, y):
+    """
+    Return one or more matrices for rotating vectors with the given X and Y components around the Z
+    axis onto the half of the XZ plane with positive X.
+    """
+    rho = np.hypot(x, y)
+    cos, sin = x / rho, y / rho
+    zero, one = np.zeros_like(cos), np.ones_like(cos)
+    return np.stack([np.stack([cos, sin, zero], axis=-1),
+                     np.stack([-sin, cos, zero], axis=-1),
+                     np.stack([zero, zero, one], axis=-1)], axis=-2)
 
 
 def _sun_earth_icrf(time):
     """
     Return the Sun-Earth vector for ICRF-based frames.
     """
-    sun_pos_icrs = get_body_barycentric('sun', time)
-    earth_pos_icrs = get_body_barycentric('earth', time)
+    sun_pos_icrs, earth_pos_icrs = ephemeris_cache.positions(time)
     return earth_pos_icrs - sun_pos_icrs
 
 
@@ -569,28 +566,28 @@ def _affine_params_hcrs_to_hgs(hcrs_time, hgs_time):
     """
     # Determine the Sun-Earth vector in ICRS
     # Since HCRS is ICRS with an origin shift, this is also the Sun-Earth vector in HCRS
-    sun_pos_icrs = get_body_barycentric('sun', hgs_time)
-    earth_pos_icrs = get_body_barycentric('earth', hgs_time)
+    # The positions are plain arrays in AU to keep this function fast for repeated calls
+    sun_pos_icrs, earth_pos_icrs = ephemeris_cache._xyz(hgs_time)
     sun_earth = earth_pos_icrs - sun_pos_icrs
 
     # De-tilt the Sun-Earth vector to the frame with the Sun's rotation axis parallel to the Z axis
-    sun_earth_detilt = sun_earth.transform(_SUN_DETILT_MATRIX)
+    sun_earth_detilt = sun_earth @ _SUN_DETILT_MATRIX.T
 
     # Rotate the Sun-Earth vector about the Z axis so that it lies in the XZ plane
-    rot_matrix = _rotation_matrix_reprs_to_xz_about_z(sun_earth_detilt)
+    rot_matrix = _rotation_matrix_xy_to_xz_about_z(sun_earth_detilt[..., 0], sun_earth_detilt[..., 1])
 
     total_matrix = rot_matrix @ _SUN_DETILT_MATRIX
 
     # All of the above is calculated for the HGS observation time
     # If the HCRS observation time is different, calculate the translation in origin
     if not _ignore_sun_motion and np.any(hcrs_time != hgs_time):
-        sun_pos_old_icrs = get_body_barycentric('sun', hcrs_time)
+        sun_pos_old_icrs, _ = ephemeris_cache._xyz(hcrs_time)
         offset_icrf = sun_pos_icrs - sun_pos_old_icrs
     else:
         offset_icrf = sun_pos_icrs * 0  # preserves obstime shape
 
-    offset = offset_icrf.transform(total_matrix)
-    return total_matrix, offset
+    offset = np.einsum('...ij,...j->...i', total_matrix, offset_icrf)
+    return total_matrix, CartesianRepresentation(offset, unit=u.AU, xyz_axis=-1, copy=False)
 
 
 @frame_transform_graph.transform(FunctionTransformWithFiniteDifference,
@@ -5,6 +5,7 @@ from sunpy import config
 from sunpy.data._sample import download_sample_data
 from sunpy.data.data_manager.cache import Cache
 from sunpy.data.data_manager.downloader import ParfiveDownloader
+from sunpy.data.data_manager.listing_cache import ListingCache
 from sunpy.data.data_manager.manager import DataManager
 from sunpy.data.data_manager.storage import SqliteStorage
 from sunpy.util.config import CACHE_DIR
@@ -25,5 +26,9 @@ cache = Cache(
     CACHE_DIR,
     expiry=int(config.get('downloads', 'cache_expiry')) * u.day
 )
+listing_cache = ListingCache(
+    CACHE_DIR + '/listings.db',
+    expiry=int(config.get('downloads', 'cache_expiry')) * u.day
+)
 
-__all__ = ["download_sample_data", "manager", "cache"]
+__all__ = ["download_sample_data", "manager", "cache", "listing_cache"]
@@ -1,4 +1,5 @@
 from sunpy.data.data_manager.cache import Cache
 from sunpy.data.data_manager.downloader import ParfiveDownloader
+from sunpy.data.data_manager.listing_cache import ListingCache
 from sunpy.data.data_manager.manager import DataManager
-from sunpy.data.data_manager.storage import SqliteStorage
+from sunpy.data.data_manager.storage import ExpiringSqliteStorage, SqliteStorage
@@ -0,0 +1,100 @@
+"""
+A cache of the listings of remote archive directories.
+"""
+from datetime import datetime
+
+import astropy.units as u
+
+from sunpy.data.data_manager.storage import ExpiringSqliteStorage
+
+__all__ = ['ListingCache']
+
+
+class ListingCache:
+    """
+    ListingCache stores the file listings of remote archive directories, so
+    that `~sunpy.util.scraper.Scraper` does not have to list them again.
+
+    A directory which covers a period of time that ended long ago does not
+    change any more, so its listing is kept for longer than the listing of a
+    directory which covers a recent period. The listing of a directory which
+    covers the current time, or which does not cover any particular period of
+    time, is not stored at all.
+
+    Parameters
+    ----------
+    path : `str` or `pathlib.Path`
+        Path to the sqlite database file.
+    expiry : `astropy.units.Quantity`, optional
+        How long the listings of the directories which cover a period that
+        ended more than 30 days ago are kept. Defaults to 10 days.
+    """
+    # How long a listing is kept, for directories whose period ended less
+    # than the given time ago
+    TTLS = ((1*u.day, 10*u.min),
+            (7*u.day, 1*u.hour),
+            (30*u.day, 1*u.day))
+
+    def __init__(self, path, expiry=10*u.day):
+        self._storage = ExpiringSqliteStorage(path, 'listings')
+        self._expiry = expiry
+
+    def ttl(self, end):
+        """
+        How long to keep the listing of a directory.
+
+        Parameters
+        ----------
+        end : `datetime.datetime` or `None`
+            The end of the period the directory covers, in UTC, or `None` if
+            it does not cover a particular period of time.
+
+        Returns
+        -------
+        `astropy.units.Quantity`
+            Zero if the listing should not be stored.
+        """
+        if end is None:
+            return 0*u.s
+        age = (datetime.utcnow() - end).total_seconds() * u.s
+        if age <= 0*u.s:
+            return 0*u.s
+        for max_age, ttl in self.TTLS:
+            if age < max_age:
+                return ttl
+        return self._expiry
+
+    def find(self, urls):
+        """
+        Find the stored listings of the given directories.
+
+        Parameters
+        ----------
+        urls : `list` of `str`
+            The URLs of the directories.
+
+        Returns
+        -------
+        `dict`
+            The listings, which are lists of file names, keyed by URL, of
+            those of the directories which have an unexpired listing.
+        """
+        return self._storage.find(urls)
+
+    def store(self, listings):
+        """
+        Store the listings of directories.
+
+        Parameters
+        ----------
+        listings : iterable of `tuple`
+            The URL, the listing as a list of file names, and the end of the
+            period of time (see ``ttl``) of each directory.
+        """
+        self._storage.store((url, listing, self.ttl(end)) for url, listing, end in listings)
+
+    def clear(self):
+        """
+        Remove all the stored listings.
+        """
+        self._storage.clear()
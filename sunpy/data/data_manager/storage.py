@@ -1,17 +1,22 @@
 """
 Storage module contains the abstract implementation of storage
 for `sunpy.data.data_manager.Cache` and a concrete implementation
-using sqlite.
+using sqlite, as well as a sqlite store of values which expire.
 """
+import json
+import time
 import sqlite3
 from abc import ABCMeta, abstractmethod
 from pathlib import Path
 from contextlib import contextmanager
 
+import astropy.units as u
+
 __all__ = [
     'StorageProviderBase',
     'SqliteStorage',
     'InMemStorage',
+    'ExpiringSqliteStorage',
 ]
 
 
@@ -175,3 +180,103 @@ class SqliteStorage(StorageProviderBase):
         with self.connection(commit=True) as conn:
             conn.execute(f'''INSERT INTO {self._table_name}
                              VALUES ({placeholder})''', list(values))
+
+
+class ExpiringSqliteStorage:
+    """
+    This provides a sqlite backend for storing values by key, each of which
+    is kept for a given time.
+
+    The values are stored as JSON, so they have to be serializable to it.
+    The directory of the database file is only created when the database is
+    first used.
+
+    Parameters
+    ----------
+    path: `str` or `pathlib.Path`
+        Path to the database file.
+    table_name: `str`
+        Name of the table the values are stored in.
+    """
+
+    def __init__(self, path, table_name):
+        self._db_path = Path(path)
+        self._table_name = table_name
+
+    @contextmanager
+    def connection(self, commit=False):
+        """
+        A context manager which provides an easy way to handle db connections.
+
+        Parameters
+        ----------
+        commit: `bool`
+            Whether to commit after succesful execution of db command.
+        """
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self._db_path))
+        conn.execute(f'''CREATE TABLE IF NOT EXISTS {self._table_name}
+                         (key text PRIMARY KEY, value text, expires real)''')
+        try:
+            yield conn
+            if commit:
+                conn.commit()
+        finally:
+            conn.close()
+
+    def find(self, keys):
+        """
+        Find the unexpired values stored under the given keys.
+
+        Parameters
+        ----------
+        keys: `list` of `str`
+            The keys to look up.
+
+        Returns
+        -------
+        `dict`
+            The values, keyed by key, of those of the keys which have an
+            unexpired value.
+        """
+        values = {}
+        with self.connection() as conn:
+            # Stay below the SQLite limit on the number of bound parameters
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                placeholder = ','.join('?' * len(chunk))
+                rows = conn.execute(f'''SELECT key, value FROM {self._table_name}
+                                        WHERE expires > ? AND key IN ({placeholder})''',
+                                    [time.time()] + list(chunk))
+                values.update((key, json.loads(value)) for key, value in rows)
+        return values
+
+    def store(self, items):
+        """
+        Store values, replacing any values already stored under their keys.
+
+        The values which have expired are removed at the same time.
+
+        Parameters
+        ----------
+        items: iterable of `tuple`
+            The key, the value and how long to keep the value, as an
+            `astropy.units.Quantity`, of each item. Items which are to be kept
+            for no time at all are not stored.
+        """
+        now = time.time()
+        rows = [(key, json.dumps(value), now + ttl.to_value(u.s))
+                for key, value, ttl in items if ttl > 0*u.s]
+        if not rows:
+            return
+        with self.connection(commit=True) as conn:
+            conn.execute(f'DELETE FROM {self._table_name} WHERE expires <= ?', (now,))
+            conn.executemany(f'''INSERT OR REPLACE INTO {self._table_name}
+                                 VALUES (?, ?, ?)''', rows)
+
+    def clear(self):
+        """
+        Remove all the stored values.
+        """
+        with self.connection(commit=True) as conn:
+            conn.execute(f'DELETE FROM {self._table_name}')
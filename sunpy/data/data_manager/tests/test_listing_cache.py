@@ -0,0 +1,41 @@
+import time
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+import astropy.units as u
+
+from sunpy.data.data_manager.listing_cache import ListingCache
+
+
+@pytest.fixture
+def listing_cache(tmp_path):
+    return ListingCache(tmp_path / 'listings.db')
+
+
+def test_listing_cache_ttl(listing_cache):
+    now = datetime.utcnow()
+    assert listing_cache.ttl(None) == 0 * u.s
+    assert listing_cache.ttl(now + timedelta(hours=1)) == 0 * u.s
+    assert listing_cache.ttl(now - timedelta(hours=1)) == 10 * u.min
+    assert listing_cache.ttl(now - timedelta(days=3)) == 1 * u.hour
+    assert listing_cache.ttl(now - timedelta(days=10)) == 1 * u.day
+    assert listing_cache.ttl(now - timedelta(days=400)) == 10 * u.day
+
+
+def test_listing_cache_store(listing_cache):
+    now = datetime.utcnow()
+    listing_cache.store([('http://a/old/', ['x.fits'], now - timedelta(days=400)),
+                         ('http://a/recent/', ['y.fits'], now - timedelta(hours=1)),
+                         ('http://a/today/', ['z.fits'], now + timedelta(hours=1)),
+                         ('http://a/undated/', ['w.fits'], None)])
+    urls = ['http://a/old/', 'http://a/recent/', 'http://a/today/', 'http://a/undated/']
+    assert listing_cache.find(urls) == {'http://a/old/': ['x.fits'], 'http://a/recent/': ['y.fits']}
+
+    # Expired listings are not found
+    with patch('sunpy.data.data_manager.storage.time.time', return_value=time.time() + 3600):
+        assert listing_cache.find(urls) == {'http://a/old/': ['x.fits']}
+
+    listing_cache.clear()
+    assert listing_cache.find(urls) == {}
@@ -1,5 +1,12 @@
+import time
+from unittest.mock import patch
+
 import pytest
 
+import astropy.units as u
+
+from sunpy.data.data_manager.storage import ExpiringSqliteStorage
+
 
 def test_find_by_key_success(sqlstorage):
     test_details = {
@@ -41,3 +48,24 @@ def test_delete(sqlstorage):
     sqlstorage.delete_by_key('file_hash', 'hash1')
     details = sqlstorage.find_by_key('file_hash', 'hash1')
     assert details is None
+
+
+def test_expiring_storage(tmp_path):
+    storage = ExpiringSqliteStorage(tmp_path / 'new' / 'expiring.db', 'items')
+    # The directory is only created once the storage is used
+    assert not (tmp_path / 'new').exists()
+    assert storage.find(['a', 'b']) == {}
+
+    storage.store([('a', [1, 2], 1*u.hour), ('b', {'c': 3}, 1*u.day), ('d', 4, 0*u.s)])
+    assert storage.find(['a', 'b', 'd']) == {'a': [1, 2], 'b': {'c': 3}}
+
+    # Expired values are not found
+    with patch('sunpy.data.data_manager.storage.time.time', return_value=time.time() + 7200):
+        assert storage.find(['a', 'b']) == {'b': {'c': 3}}
+        # Storing removes the expired values
+        storage.store([('e', 5, 1*u.hour)])
+    with storage.connection() as conn:
+        assert sorted(key for key, in conn.execute('SELECT key FROM items')) == ['b', 'e']
+
+    storage.clear()
+    assert storage.find(['a', 'b']) == {}
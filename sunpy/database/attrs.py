@@ -8,7 +8,7 @@ from sunpy.net.attr import Attr, AttrAnd, AttrOr, AttrWalker, Range, SimpleAttr,
 from sunpy.time import parse_time
 
 __all__ = [
-    'Starred', 'Tag', 'Path', 'DownloadTime', 'FitsHeaderEntry', 'walker']
+    'Starred', 'Tag', 'Path', 'DownloadTime', 'FitsHeaderEntry', 'FitsHeaderRange', 'walker']
 
 # This frozenset has been hardcoded to denote VSO attributes that are
 # currently supported, on derdon's request.
@@ -149,28 +149,61 @@ class FitsHeaderEntry(Attr):
             '~' if self.inverted else '', self.key, self.value)
 
 
+class FitsHeaderRange(Attr):
+    """
+    Match the entries which have a numeric value of the given FITS header key
+    between ``min`` and ``max`` (inclusive).
+
+    Only the keys which the database was opened with in its
+    ``promoted_header_keys`` have their numeric values stored, see
+    `sunpy.database.Database`.
+    """
+    type_name = "fitsheaderrange"
+
+    def __init__(self, key, min, max, inverted=False):
+        self.key = key
+        self.min = min
+        self.max = max
+        self.inverted = inverted
+
+    def __invert__(self):
+        return self.__class__(self.key, self.min, self.max, True)
+
+    def collides(self, other):  # pragma: no cover
+        return False
+
+    def __repr__(self):
+        return '<{}FitsHeaderRange({!r}, {!r}, {!r})>'.format(
+            '~' if self.inverted else '', self.key, self.min, self.max)
+
+
 walker = AttrWalker()
 
 
-@walker.add_creator(AttrOr)
+# The appliers compile an attribute tree into a single SQLAlchemy clause, so
+# that the whole tree is evaluated by the database in one query.
+@walker.add_creator(AttrAnd, AttrOr, ValueAttr)
 def _create(wlk, root, session):
-    entries = [set(wlk.create(attr, session)) for attr in root.attrs]
-    return list(set.union(*entries))
+    return session.query(DatabaseEntry).filter(wlk.apply(root)).all()
 
 
-@walker.add_creator(AttrAnd)
-def _create(wlk, root, session):
-    entries = [set(wlk.create(attr, session)) for attr in root.attrs]
-    return list(set.intersection(*entries))
+@walker.add_applier(AttrOr)
+def _apply(wlk, root):
+    return or_(*[wlk.apply(attr) for attr in root.attrs])
+
+
+@walker.add_applier(AttrAnd)
+def _apply(wlk, root):
+    return and_(*[wlk.apply(attr) for attr in root.attrs])
 
 
 def _inverter_helper(query, inverted):
     return not_(query) if inverted else query
 
 
-@walker.add_creator(ValueAttr)
-def _create(wlk, root, session):
-    query = session.query(DatabaseEntry)
+@walker.add_applier(ValueAttr)
+def _apply(wlk, root):
+    criteria = []
     for key, value in root.attrs.items():
         # `key[1]` is here the `inverted` attribute of the tag. That means
         # that if it is True, the given tag must not be included in the
@@ -180,50 +213,56 @@ def _create(wlk, root, session):
         if typ == Tag.type_name:
             criterion = TableTag.name.in_(value)
             base_query = DatabaseEntry.tags.any(criterion)
-            query = query.filter(_inverter_helper(base_query, inverted))
+            criteria.append(_inverter_helper(base_query, inverted))
 
         elif typ == FitsHeaderEntry.type_name:
             key, val = value
-            key_criterion = TableFitsHeaderEntry.key == key
-            value_criterion = TableFitsHeaderEntry.value == val
-            base_query = and_(
-                DatabaseEntry.fits_header_entries.any(key_criterion),
-                DatabaseEntry.fits_header_entries.any(value_criterion))
-            query = query.filter(_inverter_helper(base_query, inverted))
+            # The key and the value have to be on the same header entry
+            base_query = DatabaseEntry.fits_header_entries.any(and_(
+                TableFitsHeaderEntry.key == key,
+                TableFitsHeaderEntry.value == val))
+            criteria.append(_inverter_helper(base_query, inverted))
+
+        elif typ == FitsHeaderRange.type_name:
+            key, min_, max_ = value
+            base_query = DatabaseEntry.fits_header_entries.any(and_(
+                TableFitsHeaderEntry.key == key,
+                TableFitsHeaderEntry.numeric_value.between(min_, max_)))
+            criteria.append(_inverter_helper(base_query, inverted))
 
         elif typ == DownloadTime.type_name:
             start, end = value
             base_query = DatabaseEntry.download_time.between(start, end)
-            query = query.filter(_inverter_helper(base_query, inverted))
+            criteria.append(_inverter_helper(base_query, inverted))
 
         elif typ == Path.type_name:
             path, = value
             base_query = _inverter_helper(DatabaseEntry.path == path, inverted)
             if inverted:
                 base_query = or_(base_query, DatabaseEntry.path == None)  # NOQA
-            query = query.filter(base_query)
+            criteria.append(base_query)
 
         elif typ == core_attrs.Wavelength.type_name:
             wavemin, wavemax, waveunit = value
-            query = query.filter(and_(
+            criteria.append(and_(
                 DatabaseEntry.wavemin >= wavemin,
                 DatabaseEntry.wavemax <= wavemax))
 
         elif typ == core_attrs.Time.type_name:
             start, end, _ = value
-            query = query.filter(and_(
+            criteria.append(and_(
                 DatabaseEntry.observation_time_start < end,
                 DatabaseEntry.observation_time_end > start))
 
         elif typ in (SUPPORTED_SIMPLE_VSO_ATTRS | SUPPORTED_NONVSO_ATTRS):
             query_value, = value
-            query = query.filter_by(**{typ: query_value})
+            criteria.append(getattr(DatabaseEntry, typ) == query_value)
 
         else:
             raise NotImplementedError(
                 f"The attribute {typ!r} is not yet supported to query a database.")
 
-    return query.all()
+    return and_(*criteria)
 
 
 def _convert_decorator(specify_invertible=False):
@@ -286,6 +325,12 @@ def _convert(attr):
     return attr.key, attr.value, attr.inverted
 
 
+@walker.add_converter(FitsHeaderRange)
+@_convert_decorator(specify_invertible=True)
+def _convert(attr):
+    return attr.key, attr.min, attr.max, attr.inverted
+
+
 @walker.add_converter(SimpleAttr)
 @_convert_decorator()
 def _convert(attr):
@@ -4,12 +4,12 @@
 # the Google Summer of Code (2013).
 
 import os.path
-import operator
 import itertools
 from datetime import datetime
 from contextlib import contextmanager
+from collections import defaultdict
 
-from sqlalchemy import create_engine, exists
+from sqlalchemy import create_engine, exists, func, inspect, text
 from sqlalchemy.orm import scoped_session, sessionmaker
 from sqlalchemy.orm.exc import ObjectDeletedError
 
@@ -25,6 +25,10 @@ from sunpy.net.attr import and_
 from sunpy.net.hek2vso import H2VClient
 from sunpy.net.vso import VSOClient
 
+# The maximum number of values in the IN clause of a single query, which keeps
+# each query below the SQLite limit on the number of bound parameters
+_QUERY_CHUNK_SIZE = 500
+
 __authors__ = ['Simon Liedtke', 'Rajul Srivastava']
 __emails__ = [
     'liedtke.simon@googlemail.com',
@@ -32,6 +36,17 @@ __emails__ = [
 ]
 
 
+def _numeric_value(value):
+    """
+    Return the given FITS header value as a float, or None if it is not a
+    number.
+    """
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
 class EntryNotFoundError(Exception):
     """This exception is raised if a database entry cannot be found by its
     unique ID.
@@ -225,6 +240,13 @@ class Database:
         is raised. If `None` (the default), attempting to add an entry without knowing
         the wavelength unit results in a
         :exc:`sunpy.database.tables.WaveunitNotFoundError`.
+    promoted_header_keys : iterable of `str`, optional
+        FITS header keys, e.g. ``['WAVELNTH', 'EXPTIME', 'QUALITY']``, whose
+        values are also stored as numbers in a typed and indexed column, so
+        that they can be searched with
+        :class:`sunpy.database.attrs.FitsHeaderRange`. The header entries of
+        these keys which are already saved are updated when the database is
+        opened.
     """
     """
     Attributes
@@ -245,6 +267,9 @@ class Database:
     default_waveunit : str
         See "Parameters" section.
 
+    promoted_header_keys : frozenset of str
+        See "Parameters" section.
+
     Methods
     -------
     set_cache_size(cache_size)
@@ -294,7 +319,7 @@ class Database:
     """
 
     def __init__(self, url=None, CacheClass=LRUCache, cache_size=float('inf'),
-                 default_waveunit=None):
+                 default_waveunit=None, promoted_header_keys=None):
         if url is None:
             url = sunpy.config.get('database', 'url')
         self._engine = create_engine(url)
@@ -307,6 +332,7 @@ class Database:
                 self.default_waveunit = units.Unit(default_waveunit)
             except ValueError:
                 raise tables.WaveunitNotConvertibleError(default_waveunit)
+        self.promoted_header_keys = frozenset(promoted_header_keys or ())
         self._enable_history = True
 
         class Cache(CacheClass):
@@ -320,6 +346,7 @@ class Database:
                 except TypeError:
                     this[1] = value
         self._create_tables()
+        self._promote_saved_header_values()
         self._cache = Cache(cache_size)
         for entry in self:
             self._cache[entry.id] = entry
@@ -373,6 +400,55 @@ class Database:
         """
         metadata = tables.Base.metadata
         metadata.create_all(self._engine, checkfirst=checkfirst)
+        # Tables created by older versions of sunpy do not have all the
+        # indexes, and create_all does not add indexes to existing tables
+        inspector = inspect(self._engine)
+        for table in metadata.sorted_tables:
+            # They also lack the columns which have been added since
+            existing = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in existing:
+                    preparer = self._engine.dialect.identifier_preparer
+                    column_type = column.type.compile(self._engine.dialect)
+                    with self._engine.begin() as connection:
+                        connection.execute(text(f'ALTER TABLE {preparer.format_table(table)} '
+                                                f'ADD COLUMN {preparer.format_column(column)} {column_type}'))
+            existing = {index['name'] for index in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name not in existing:
+                    index.create(self._engine)
+
+    def _promote_header_values(self, database_entries):
+        """
+        Store the numeric values of the promoted header keys of the given
+        entries in the ``numeric_value`` column of their header entries.
+        """
+        if not self.promoted_header_keys:
+            return
+        for database_entry in database_entries:
+            for header_entry in database_entry.fits_header_entries:
+                if header_entry.key in self.promoted_header_keys:
+                    header_entry.numeric_value = _numeric_value(header_entry.value)
+
+    def _promote_saved_header_values(self):
+        """
+        Store the numeric values of the promoted header keys of the entries
+        which were saved before the keys were promoted.
+        """
+        if not self.promoted_header_keys:
+            return
+        FitsHeaderEntry = tables.FitsHeaderEntry
+        header_entries = self.session.query(FitsHeaderEntry).filter(
+            FitsHeaderEntry.key.in_(sorted(self.promoted_header_keys)),
+            FitsHeaderEntry.numeric_value.is_(None))
+        updated = False
+        for header_entry in header_entries:
+            numeric_value = _numeric_value(header_entry.value)
+            if numeric_value is not None:
+                header_entry.numeric_value = numeric_value
+                updated = True
+        if updated:
+            self.session.commit()
 
     def commit(self):
         """Flush pending changes and commit the current transaction. This is a
@@ -547,7 +623,7 @@ class Database:
 
     def search(self, *query, **kwargs):
         """
-        search(*query[, sortby])
+        search(*query[, sortby, limit, offset])
         Send the given query to the database and return a list of
         database entries that satisfy all of the given attributes.
 
@@ -564,6 +640,8 @@ class Database:
 
             - :class:`sunpy.database.attrs.FitsHeaderEntry`
 
+            - :class:`sunpy.database.attrs.FitsHeaderRange`
+
         An important difference to the VSO attributes is that these attributes
         may also be used in negated form using the tilde ~ operator.
 
@@ -578,6 +656,12 @@ class Database:
             sort by the start of the observation. See the attributes of
             :class:`sunpy.database.tables.DatabaseEntry` for a list of all
             possible values.
+        limit : `int`, optional
+            The maximum number of entries to return. By default all matching
+            entries are returned.
+        offset : `int`, optional
+            The number of sorted entries to skip before the first returned
+            entry. Defaults to 0.
 
         Returns
         -------
@@ -589,7 +673,13 @@ class Database:
         ------
         TypeError
             if no attribute is given or if some keyword argument other than
-            'sortby' is given.
+            'sortby', 'limit' or 'offset' is given.
+
+        Notes
+        -----
+        The attributes are compiled into a single SQL query, so that the
+        filtering, sorting, limit and offset are all done by the database and
+        only the returned entries are loaded.
 
         Examples
         --------
@@ -599,22 +689,90 @@ class Database:
         >>> database.search(~attrs.Starred(), attrs.Tag('foo') | attrs.Tag('bar'))   # doctest: +SKIP
 
         """
-        if not query:
-            raise TypeError('at least one attribute required')
         sortby = kwargs.pop('sortby', 'observation_time_start')
+        limit = kwargs.pop('limit', None)
+        offset = kwargs.pop('offset', None)
         if kwargs:
             k, v = kwargs.popitem()
             raise TypeError(f'unexpected keyword argument {k!r}')
 
-        db_entries = walker.create(and_(*query), self.session)
+        return self._search_query(query, sortby).limit(limit).offset(offset).all()
 
-        # If any of the DatabaseEntry-s lack the sorting attribute, the
-        # sorting key should fall back to 'id', orherwise it fails with
-        # TypeError on py3
-        if any([getattr(entry, sortby) is None for entry in db_entries]):
-            sortby = 'id'
+    def iter_search(self, *query, **kwargs):
+        """
+        iter_search(*query[, sortby, page_size])
+        Lazily iterate over the database entries that match the given query.
+
+        This accepts the same attributes as :meth:`search`, but instead of
+        loading all matching entries at once they are fetched from the
+        database in pages of ``page_size`` entries as the iteration proceeds.
 
-        return sorted(db_entries, key=operator.attrgetter(sortby))
+        Parameters
+        ----------
+        query : `list`
+            A variable number of attributes that are chained together via the
+            boolean AND operator. The | operator may be used between attributes
+            to express the boolean OR operator.
+        sortby : `str`, optional
+            The column by which to sort the returned entries. The default is to
+            sort by the start of the observation.
+        page_size : `int`, optional
+            The number of entries fetched from the database at a time.
+            Defaults to 1000.
+
+        Yields
+        ------
+        `sunpy.database.tables.DatabaseEntry`
+            The entries that satisfy all of the given attributes.
+
+        Raises
+        ------
+        TypeError
+            if no attribute is given or if some keyword argument other than
+            'sortby' or 'page_size' is given.
+
+        Examples
+        --------
+        >>> for entry in database.iter_search(attrs.Tag('foo'), page_size=100):  # doctest: +SKIP
+        ...     print(entry.path)
+
+        """
+        sortby = kwargs.pop('sortby', 'observation_time_start')
+        page_size = kwargs.pop('page_size', 1000)
+        if kwargs:
+            k, v = kwargs.popitem()
+            raise TypeError(f'unexpected keyword argument {k!r}')
+        if page_size < 1:
+            raise ValueError('page_size must be a positive integer')
+
+        db_query = self._search_query(query, sortby)
+        return self._iter_pages(db_query, page_size)
+
+    @staticmethod
+    def _iter_pages(db_query, page_size):
+        for offset in itertools.count(0, page_size):
+            page = db_query.limit(page_size).offset(offset).all()
+            yield from page
+            if len(page) < page_size:
+                return
+
+    def _search_query(self, query, sortby):
+        """
+        Compile the given attributes into a single sorted SQLAlchemy query
+        of the matching database entries.
+        """
+        if not query:
+            raise TypeError('at least one attribute required')
+        db_query = self.session.query(tables.DatabaseEntry).filter(
+            walker.apply(and_(*query)))
+
+        # If any of the DatabaseEntry-s lack the sorting attribute, the
+        # sorting key should fall back to 'id'. The id is also used to break
+        # ties so that the order, and hence the pages, are deterministic.
+        column = getattr(tables.DatabaseEntry, sortby)
+        if self.session.query(db_query.filter(column.is_(None)).exists()).scalar():
+            column = tables.DatabaseEntry.id
+        return db_query.order_by(column, tables.DatabaseEntry.id)
 
     def get_entry_by_id(self, entry_id):
         """
@@ -724,10 +882,90 @@ class Database:
             raise EntryAlreadyUnstarredError(database_entry)
         self.edit(database_entry, starred=False)
 
+    def _find_added_entries(self, database_entries):
+        """
+        Return those of the given entries which are equal to an entry that is
+        already saved in the database.
+
+        Equal entries share their ``fileid``, ``path`` and
+        ``observation_time_start``, so the saved entries which could be equal
+        are found with indexed queries on these columns, and only those are
+        compared with the given entries.
+        """
+        DatabaseEntry = tables.DatabaseEntry
+        keys = {(entry.fileid, entry.path, entry.observation_time_start)
+                for entry in database_entries}
+        fileids = sorted({fileid for fileid, _, _ in keys if fileid is not None})
+        paths = sorted({path for fileid, path, _ in keys if fileid is None and path is not None})
+
+        conditions = [DatabaseEntry.fileid.in_(fileids[i:i + _QUERY_CHUNK_SIZE])
+                      for i in range(0, len(fileids), _QUERY_CHUNK_SIZE)]
+        conditions += [DatabaseEntry.fileid.is_(None) & DatabaseEntry.path.in_(paths[i:i + _QUERY_CHUNK_SIZE])
+                       for i in range(0, len(paths), _QUERY_CHUNK_SIZE)]
+        if any(fileid is None and path is None for fileid, path, _ in keys):
+            conditions.append(DatabaseEntry.fileid.is_(None) & DatabaseEntry.path.is_(None))
+
+        candidate_ids = defaultdict(list)
+        key_columns = (DatabaseEntry.id, DatabaseEntry.fileid, DatabaseEntry.path,
+                       DatabaseEntry.observation_time_start)
+        for condition in conditions:
+            for entry_id, *key in self.session.query(*key_columns).filter(condition):
+                candidate_ids[tuple(key)].append(entry_id)
+
+        added = []
+        for database_entry in database_entries:
+            key = (database_entry.fileid, database_entry.path,
+                   database_entry.observation_time_start)
+            if key in candidate_ids:
+                candidates = self.session.query(DatabaseEntry).filter(
+                    DatabaseEntry.id.in_(candidate_ids[key]))
+                if any(database_entry == candidate for candidate in candidates):
+                    added.append(database_entry)
+        return added
+
+    def _assign_ids(self, database_entries):
+        """
+        Number the new entries, and their FITS header entries and key
+        comments, after the largest ID in their table.
+
+        This matches the IDs that the database would assign, but with all the
+        primary keys known in advance, SQLAlchemy inserts the new rows of
+        each table with a single ``executemany``.
+
+        This is only done for SQLite databases, in a transaction which first
+        takes the write lock of the database, so that no other connection can
+        add rows before this transaction ends. Other databases assign the IDs
+        themselves when the rows are inserted, as several processes may be
+        adding entries at the same time.
+        """
+        if self._engine.dialect.name != 'sqlite':
+            return
+        connection = self.session.connection()
+        # pysqlite begins a transaction, which takes the write lock, only before
+        # the first write, so one that has begun already holds the lock
+        if not connection.connection.connection.in_transaction:
+            connection.execute(text('BEGIN IMMEDIATE'))
+        fits_header_entries = [header_entry for entry in database_entries
+                               for header_entry in entry.fits_header_entries]
+        fits_key_comments = [key_comment for entry in database_entries
+                             for key_comment in entry.fits_key_comments]
+        for table, rows in [(tables.DatabaseEntry, database_entries),
+                            (tables.FitsHeaderEntry, fits_header_entries),
+                            (tables.FitsKeyComment, fits_key_comments)]:
+            new_rows = [row for row in rows if row.id is None]
+            if new_rows:
+                (max_id,), = self.session.query(func.max(table.id))
+                for row_id, row in enumerate(new_rows, start=(max_id or 0) + 1):
+                    row.id = row_id
+
     def add_many(self, database_entries, ignore_already_added=False):
         """Add a row of database entries "at once". If this method is used,
         only one entry is saved in the undo history.
 
+        Entries which are already saved in the database are found with indexed
+        queries rather than by comparing every entry with the whole table, and
+        the new rows are inserted in batches when the session is flushed.
+
         Parameters
         ----------
         database_entries : list
@@ -738,13 +976,16 @@ class Database:
             See Database.add
 
         """
+        database_entries = list(database_entries)
+        if not ignore_already_added:
+            added = self._find_added_entries(database_entries)
+            if added:
+                raise EntryAlreadyAddedError(added[0])
+        self._assign_ids(database_entries)
+        self._promote_header_values(database_entries)
+
         cmds = CompositeOperation()
         for database_entry in database_entries:
-            # use list(self) instead of simply self because __contains__ checks
-            # for existence in the database and not only all attributes except
-            # ID.
-            if database_entry in list(self) and not ignore_already_added:
-                raise EntryAlreadyAddedError(database_entry)
             cmd = commands.AddEntry(self.session, database_entry)
             if self._enable_history:
                 cmds.add(cmd)
@@ -774,6 +1015,7 @@ class Database:
         """
         if database_entry in self and not ignore_already_added:
             raise EntryAlreadyAddedError(database_entry)
+        self._promote_header_values([database_entry])
         add_entry_cmd = commands.AddEntry(self.session, database_entry)
         if self._enable_history:
             self._command_manager.do(add_entry_cmd)
@@ -910,7 +1152,8 @@ class Database:
                       ignore_already_added)
 
     def add_from_dir(self, path, recursive=False, pattern='*',
-                     ignore_already_added=False, time_string_parse_format=None):
+                     ignore_already_added=False, time_string_parse_format=None,
+                     header_keys=None):
         """
         Search the given directory for FITS files and use their FITS headers
         to add new entries to the database. Note that one entry in the database
@@ -946,24 +1189,19 @@ class Database:
             `~astropy.time.Time.strptime` if `sunpy.time.parse_time` is unable to
             automatically read the ``date-obs`` metadata.
 
+        header_keys : iterable of str, optional
+            Only store these FITS header keys, which are read with a fast
+            header scan. See :func:`sunpy.database.tables.entries_from_file`.
+
         """
-        cmds = CompositeOperation()
         entries = tables.entries_from_dir(
             path, recursive, pattern, self.default_waveunit,
-            time_string_parse_format=time_string_parse_format)
-        for database_entry, filepath in entries:
-            if database_entry in list(self) and not ignore_already_added:
-                raise EntryAlreadyAddedError(database_entry)
-            cmd = commands.AddEntry(self.session, database_entry)
-            if self._enable_history:
-                cmds.add(cmd)
-            else:
-                cmd()
-            self._cache.append(database_entry)
-        if cmds:
-            self._command_manager.do(cmds)
+            time_string_parse_format=time_string_parse_format,
+            header_keys=header_keys)
+        self.add_many((database_entry for database_entry, filepath in entries),
+                      ignore_already_added)
 
-    def add_from_file(self, file, ignore_already_added=False):
+    def add_from_file(self, file, ignore_already_added=False, header_keys=None):
         """Generate as many database entries as there are FITS headers in the
         given file and add them to the database.
 
@@ -977,9 +1215,13 @@ class Database:
         ignore_already_added : bool, optional
             See :meth:`sunpy.database.Database.add`.
 
+        header_keys : iterable of str, optional
+            Only store these FITS header keys, which are read with a fast
+            header scan. See :func:`sunpy.database.tables.entries_from_file`.
+
         """
         self.add_many(
-            tables.entries_from_file(file, self.default_waveunit),
+            tables.entries_from_file(file, self.default_waveunit, header_keys=header_keys),
             ignore_already_added)
 
     def edit(self, database_entry, **kwargs):
@@ -7,7 +7,7 @@ import fnmatch
 from datetime import datetime
 
 import numpy as np
-from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, Integer, String, Table
+from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, Index, Integer, String, Table
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
@@ -107,11 +107,18 @@ class JSONDump(Base):
 
 class FitsHeaderEntry(Base):
     __tablename__ = 'fitsheaderentries'
+    # Header queries match the key and the value, or the numeric value of a
+    # promoted key, of a single row, see sunpy.database.attrs
+    __table_args__ = (Index('ix_fitsheaderentries_key_value', 'key', 'value'),
+                      Index('ix_fitsheaderentries_key_numeric_value', 'key', 'numeric_value'),
+                      Index('ix_fitsheaderentries_dbentry_id', 'dbentry_id'))
 
     dbentry_id = Column(Integer, ForeignKey('data.id'))
     id = Column(Integer, primary_key=True)
     key = Column(String, nullable=False)
     value = Column(String)
+    # Only set for the keys promoted by Database(promoted_header_keys=...)
+    numeric_value = Column(Float)
 
     def __init__(self, key, value):
         self.key = key
@@ -136,6 +143,7 @@ class FitsHeaderEntry(Base):
 
 class FitsKeyComment(Base):
     __tablename__ = 'fitskeycomments'
+    __table_args__ = (Index('ix_fitskeycomments_dbentry_id', 'dbentry_id'),)
 
     dbentry_id = Column(Integer, ForeignKey('data.id'))
     id = Column(Integer, primary_key=True)
@@ -249,6 +257,9 @@ class DatabaseEntry(DatabaseEntryType, Base):
 
     """
     __tablename__ = 'data'
+    # The columns which are compared to find entries that are already saved,
+    # see Database.add_many
+    __table_args__ = (Index('ix_data_natural_key', 'fileid', 'path', 'observation_time_start'),)
 
     # FIXME: primary key is data provider + file ID + download_time!
     id = Column(Integer, primary_key=True)
@@ -591,8 +602,12 @@ def entries_from_fido_search_result(sr, default_waveunit=None):
                 yield DatabaseEntry._from_fido_search_result_block(block, default_waveunit)
 
 
+# The header keys used to fill in the attributes of a DatabaseEntry
+_ENTRY_HEADER_KEYS = ('INSTRUME', 'WAVELNTH', 'WAVEUNIT', 'DATE-OBS', 'DATE_OBS', 'DATE-END', 'DATE_END')
+
+
 def entries_from_file(file, default_waveunit=None,
-                      time_string_parse_format=''):
+                      time_string_parse_format='', header_keys=None):
     # Note: time_string_parse_format='' so that None won't be passed to Time.strptime
     # (which would make strptime freak out, if I remember correctly).
     """Use the headers of a FITS file to generate an iterator of
@@ -621,6 +636,12 @@ def entries_from_file(file, default_waveunit=None,
         `~astropy.time.Time.strptime` if `sunpy.time.parse_time` is unable to
         automatically read the ``date-obs`` metadata.
 
+    header_keys : iterable of str, optional
+        If given, only these keys (and the keys needed for the instrument,
+        wavelength and observation time) are read from the headers and saved
+        in ``fits_header_entries``. The headers are then read with the fast
+        header scanner of `sunpy.io.fits.scan_headers`.
+
     Raises
     ------
     sunpy.database.tables.WaveunitNotFoundError
@@ -651,7 +672,14 @@ def entries_from_file(file, default_waveunit=None,
     111
 
     """
-    headers = fits.get_header(file)
+    if header_keys is None:
+        headers = fits.get_header(file)
+    else:
+        keys = set(header_keys) | set(_ENTRY_HEADER_KEYS)
+        headers = fits.get_header(file, keys=keys)
+        # Drop headers without any of the keys, e.g. the empty primary
+        # header of a compressed file
+        headers = [header for header in headers if set(header) - {'KEYCOMMENTS'}]
 
     # This just checks for blank default headers
     # due to compression.
@@ -714,7 +742,8 @@ def entries_from_file(file, default_waveunit=None,
 
 
 def entries_from_dir(fitsdir, recursive=False, pattern='*',
-                     default_waveunit=None, time_string_parse_format=None):
+                     default_waveunit=None, time_string_parse_format=None,
+                     header_keys=None):
     """Search the given directory for FITS files and use the corresponding FITS
     headers to generate instances of :class:`DatabaseEntry`. FITS files are
     detected by reading the content of each file, the ``pattern`` argument may be
@@ -747,6 +776,9 @@ def entries_from_dir(fitsdir, recursive=False, pattern='*',
         `~astropy.time.Time.strptime` if `sunpy.time.parse_time` is unable to
         automatically read the ``date-obs`` metadata.
 
+    header_keys : iterable of str, optional
+        See :func:`sunpy.database.tables.entries_from_file`.
+
     Returns
     -------
     generator of (DatabaseEntry, str) pairs
@@ -778,7 +810,8 @@ def entries_from_dir(fitsdir, recursive=False, pattern='*',
             if filetype == 'fits':
                 for entry in entries_from_file(
                         path, default_waveunit,
-                        time_string_parse_format=time_string_parse_format
+                        time_string_parse_format=time_string_parse_format,
+                        header_keys=header_keys
                 ):
                     yield entry, path
         if not recursive:
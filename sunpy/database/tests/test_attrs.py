@@ -10,7 +10,7 @@ import pytest
 import astropy.units as u
 
 from sunpy.database import tables
-from sunpy.database.attrs import DownloadTime, FitsHeaderEntry, Path, Starred, Tag, walker
+from sunpy.database.attrs import DownloadTime, FitsHeaderEntry, FitsHeaderRange, Path, Starred, Tag, walker
 from sunpy.database.database import Database
 from sunpy.net import attrs as a
 from sunpy.net import vso
@@ -133,6 +133,12 @@ def test_fitsheaderentry_repr():
     assert repr(~header_entry) == "<~FitsHeaderEntry('key', 'value')>"
 
 
+def test_fitsheaderrange_repr():
+    header_range = FitsHeaderRange('EXPTIME', 1, 2.5)
+    assert repr(header_range) == "<FitsHeaderRange('EXPTIME', 1, 2.5)>"
+    assert repr(~header_range) == "<~FitsHeaderRange('EXPTIME', 1, 2.5)>"
+
+
 def test_walker_create_dummy(session):
     with pytest.raises(TypeError):
         walker.create(DummyAttr(), session)
@@ -403,6 +409,40 @@ def test_walker_create_fitsheader_inverted(session):
             id=9, path='/tmp', download_time=datetime(2005, 6, 15, 9))]
 
 
+def test_walker_create_fitsheader_same_entry(session):
+    entry = session.query(tables.DatabaseEntry).get(1)
+    entry.fits_header_entries.append(tables.FitsHeaderEntry('INSTRUME', 'AIA'))
+    entry.fits_header_entries.append(tables.FitsHeaderEntry('TELESCOP', 'EIT'))
+    session.commit()
+    # The key and the value are on different header entries of the first entry
+    entries = walker.create(FitsHeaderEntry('INSTRUME', 'EIT'), session)
+    assert [entry.id for entry in entries] == [10]
+    entries = walker.create(~FitsHeaderEntry('INSTRUME', 'EIT'), session)
+    assert [entry.id for entry in entries] == list(range(1, 10))
+
+
+@pytest.fixture
+def promoted_session():
+    database = Database('sqlite:///:memory:', promoted_header_keys=['EXPTIME'])
+    for i, exptime in enumerate([0.5, 1, 2, '2.5', 'unknown']):
+        database.add(tables.DatabaseEntry(fits_header_entries=[
+            tables.FitsHeaderEntry('EXPTIME', exptime),
+            tables.FitsHeaderEntry('WAVELNTH', i)]))
+    database.commit()
+    return database.session
+
+
+def test_walker_create_fitsheaderrange(promoted_session):
+    entries = walker.create(FitsHeaderRange('EXPTIME', 1, 2.5), promoted_session)
+    assert [entry.id for entry in entries] == [2, 3, 4]
+    entries = walker.create(~FitsHeaderRange('EXPTIME', 1, 2.5), promoted_session)
+    assert [entry.id for entry in entries] == [1, 5]
+
+
+def test_walker_create_fitsheaderrange_not_promoted(promoted_session):
+    assert walker.create(FitsHeaderRange('WAVELNTH', 0, 10), promoted_session) == []
+
+
 @pytest.mark.remote_data
 def test_walker_create_vso_instrument(vso_session):
     entries = walker.create(a.Instrument.rhessi, vso_session)
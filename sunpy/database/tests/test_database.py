@@ -7,6 +7,9 @@ import os
 import glob
 import shutil
 import os.path
+import sqlite3
+import datetime
+import itertools
 import configparser
 
 import pytest
@@ -419,6 +422,85 @@ def test_add_many_with_existing_entry(database):
         database.add_many([evil_entry])
 
 
+def test_add_many_finds_added_entries(database):
+    database.add_many([DatabaseEntry(fileid='a', instrument='EIT'),
+                       DatabaseEntry(path='/b.fits'),
+                       DatabaseEntry(fileid='c', path='/c.fits', hdu_index=0)])
+    database.commit()
+
+    # The same natural key, but not an equal entry
+    database.add_many([DatabaseEntry(fileid='a', instrument='AIA')])
+    assert len(database) == 4
+
+    duplicate = DatabaseEntry(path='/b.fits')
+    with pytest.raises(EntryAlreadyAddedError) as excinfo:
+        database.add_many([DatabaseEntry(fileid='d'), duplicate])
+    assert excinfo.value.database_entry is duplicate
+    assert len(database) == 4
+    assert database._find_added_entries([DatabaseEntry(fileid='c', path='/c.fits', instrument='AIA'),
+                                         DatabaseEntry(fileid='c')]) == []
+
+
+def test_add_many_batched(database):
+    database.add_many([DatabaseEntry(fileid=str(i)) for i in range(5)])
+    database.commit()
+
+    inserts = []
+
+    def listener(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith('INSERT'):
+            inserts.append((statement.split()[2], executemany))
+    sqlalchemy.event.listen(database._engine, 'before_cursor_execute', listener)
+
+    entries = [DatabaseEntry(fileid=str(i), fits_header_entries=[FitsHeaderEntry('KEY', 'VALUE')])
+               for i in range(5, 15)]
+    database.add_many(entries)
+    database.commit()
+    assert sorted(inserts) == [('data', True), ('fitsheaderentries', True)]
+    assert [entry.id for entry in entries] == list(range(6, 16))
+    assert len(database) == 15
+
+    # All the entries are one command in the undo history
+    database.undo()
+    assert len(database) == 5
+
+
+def test_add_many_write_lock(tmp_path):
+    path = tmp_path / 'lock.sqlite'
+    database = Database(f'sqlite:///{path}')
+    database.add_many([DatabaseEntry(fileid=str(i)) for i in range(3)])
+    # No other connection can write until the IDs that were assigned are saved
+    other = sqlite3.connect(str(path), timeout=0, isolation_level=None)
+    with pytest.raises(sqlite3.OperationalError, match='locked'):
+        other.execute('BEGIN IMMEDIATE')
+    database.commit()
+    other.execute('BEGIN IMMEDIATE')
+    other.execute('ROLLBACK')
+    other.close()
+
+
+def test_add_many_ids_assigned_by_database(mocker, database):
+    mocker.patch.object(database._engine.dialect, 'name', 'postgresql')
+    entries = [DatabaseEntry(fileid=str(i)) for i in range(3)]
+    database.add_many(entries)
+    assert [entry.id for entry in entries] == [None] * 3
+    database.commit()
+    assert [entry.id for entry in entries] == [1, 2, 3]
+    assert len(database) == 3
+
+
+def test_natural_key_index_added(tmp_path):
+    url = f'sqlite:///{tmp_path / "old.sqlite"}'
+    engine = Database(url)._engine
+    # Databases created by older versions of sunpy do not have the index
+    engine.execute('DROP INDEX ix_data_natural_key')
+    assert sqlalchemy.inspect(engine).get_indexes('data') == []
+
+    Database(url)
+    indexes = sqlalchemy.inspect(engine).get_indexes('data')
+    assert [index['name'] for index in indexes] == ['ix_data_natural_key']
+
+
 def test_add_entry(database):
     entry = DatabaseEntry()
     assert entry.id is None
@@ -930,6 +1012,111 @@ def test_query(filled_database):
         DatabaseEntry(id=10, tags=[bar])]
 
 
+def test_header_entry_indexes(database):
+    inspector = sqlalchemy.inspect(database._engine)
+    indexes = {index['name']: index['column_names']
+               for index in inspector.get_indexes('fitsheaderentries')}
+    assert indexes == {'ix_fitsheaderentries_key_value': ['key', 'value'],
+                       'ix_fitsheaderentries_key_numeric_value': ['key', 'numeric_value'],
+                       'ix_fitsheaderentries_dbentry_id': ['dbentry_id']}
+
+
+def test_promoted_header_keys(database):
+    database.promoted_header_keys = frozenset(['EXPTIME'])
+    database.add(DatabaseEntry(fits_header_entries=[FitsHeaderEntry('EXPTIME', 2.0),
+                                                    FitsHeaderEntry('INSTRUME', 'AIA')]))
+    database.add_many([DatabaseEntry(fits_header_entries=[FitsHeaderEntry('EXPTIME', 'nonsense')])])
+    database.commit()
+    header_entries = database.session.query(FitsHeaderEntry).order_by(FitsHeaderEntry.id)
+    assert [(entry.value, entry.numeric_value) for entry in header_entries] == [
+        ('2.0', 2.0), ('AIA', None), ('nonsense', None)]
+    assert [entry.id for entry in database.search(attrs.FitsHeaderRange('EXPTIME', 1, 3))] == [1]
+
+
+def test_promoted_header_keys_saved_entries(tmp_path):
+    url = f'sqlite:///{tmp_path / "old.sqlite"}'
+    database = Database(url)
+    database.add(DatabaseEntry(fits_header_entries=[FitsHeaderEntry('EXPTIME', 2.0)]))
+    database.commit()
+    assert database.search(attrs.FitsHeaderRange('EXPTIME', 1, 3)) == []
+
+    database = Database(url, promoted_header_keys=['EXPTIME'])
+    assert [entry.id for entry in database.search(attrs.FitsHeaderRange('EXPTIME', 1, 3))] == [1]
+
+
+def test_numeric_value_column_added(tmp_path):
+    url = f'sqlite:///{tmp_path / "old.sqlite"}'
+    engine = sqlalchemy.create_engine(url)
+    # Databases created by older versions of sunpy do not have the column
+    with engine.begin() as connection:
+        connection.execute(sqlalchemy.text('CREATE TABLE fitsheaderentries (dbentry_id INTEGER, '
+                                           'id INTEGER NOT NULL, key VARCHAR NOT NULL, '
+                                           'value VARCHAR, PRIMARY KEY (id))'))
+        connection.execute(sqlalchemy.text("INSERT INTO fitsheaderentries VALUES (1, 1, 'EXPTIME', '2.0')"))
+
+    database = Database(url, promoted_header_keys=['EXPTIME'])
+    inspector = sqlalchemy.inspect(database._engine)
+    columns = [column['name'] for column in inspector.get_columns('fitsheaderentries')]
+    assert 'numeric_value' in columns
+    assert database.session.query(FitsHeaderEntry).one().numeric_value == 2.0
+
+
+def test_query_single_select(filled_database):
+    selects = []
+
+    def listener(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith('SELECT'):
+            selects.append(statement)
+    sqlalchemy.event.listen(filled_database._engine, 'before_cursor_execute', listener)
+
+    entries = filled_database.search(
+        (attrs.Tag('foo') | attrs.Tag('bar')) & ~attrs.Starred(), sortby='id')
+    assert [entry.id for entry in entries] == [4, 5, 8, 10]
+    # One query to check the sort column for NULLs and one for the entries
+    assert len(selects) == 2
+    assert 'ORDER BY' in selects[-1]
+
+
+def test_query_limit_offset(filled_database):
+    entries = filled_database.search(~attrs.Starred(), sortby='id', limit=3)
+    assert [entry.id for entry in entries] == [1, 2, 3]
+    entries = filled_database.search(~attrs.Starred(), sortby='id', limit=3, offset=8)
+    assert [entry.id for entry in entries] == [9, 10]
+
+
+def test_query_sortby_fallback(database):
+    for start in ['2011-01-02', None, '2011-01-01']:
+        start = start and datetime.datetime.fromisoformat(start)
+        database.add(DatabaseEntry(observation_time_start=start))
+    database.commit()
+    # One entry lacks the sort column so the entries are sorted by id
+    assert [entry.id for entry in database.search(~attrs.Starred())] == [1, 2, 3]
+    database.remove(database.get_entry_by_id(2))
+    database.commit()
+    assert [entry.id for entry in database.search(~attrs.Starred())] == [3, 1]
+
+
+@pytest.mark.parametrize('page_size', [1, 3, 4, 100])
+def test_iter_search(filled_database, page_size):
+    entries = filled_database.iter_search(
+        attrs.Tag('foo') | attrs.Tag('bar'), sortby='id', page_size=page_size)
+    assert [entry.id for entry in entries] == [4, 5, 8, 10]
+
+
+def test_iter_search_lazy(filled_database):
+    entries = filled_database.iter_search(~attrs.Starred(), sortby='id', page_size=2)
+    assert [entry.id for entry in itertools.islice(entries, 3)] == [1, 2, 3]
+
+
+def test_iter_search_bad_arguments(filled_database):
+    with pytest.raises(TypeError):
+        filled_database.iter_search()
+    with pytest.raises(TypeError):
+        filled_database.iter_search(attrs.Starred(), foo=42)
+    with pytest.raises(ValueError):
+        filled_database.iter_search(attrs.Starred(), page_size=0)
+
+
 def test_fetch_missing_arg(database):
     with pytest.raises(TypeError):
         database.fetch()
@@ -322,6 +322,25 @@ def test_entries_from_file():
     assert entry.path == MQ_IMAGE
 
 
+def test_entries_from_file_header_keys():
+    # The header scanner never reads the (truncated) data unit, so does not warn
+    entries = list(entries_from_file(MQ_IMAGE, header_keys=['OBJECT', 'NAXIS1']))
+    assert len(entries) == 1
+    entry = entries[0]
+    assert entry.fits_header_entries == [
+        FitsHeaderEntry('NAXIS1', 1500),
+        FitsHeaderEntry('DATE_OBS', '2013-08-12T08:42:53.000'),
+        FitsHeaderEntry('DATE_END', '2013-08-12T08:42:53.000'),
+        FitsHeaderEntry('INSTRUME', 'Spectroheliograph'),
+        FitsHeaderEntry('OBJECT', 'FS'),
+        FitsHeaderEntry('WAVELNTH', 6563),
+        FitsHeaderEntry('WAVEUNIT', 'angstrom')]
+    assert entry.instrument == 'Spectroheliograph'
+    assert entry.observation_time_start == datetime(2013, 8, 12, 8, 42, 53)
+    assert round(entry.wavemin, 1) == 656.3
+    assert entry.path == MQ_IMAGE
+
+
 def test_entries_from_file_withoutwaveunit():
     # does not raise `WaveunitNotFoundError`, because no wavelength information
     # is present in this file
@@ -421,6 +440,18 @@ def test_entries_from_dir():
         FitsKeyComment('EXPTIME', 'in seconds')].sort()
 
 
+def test_entries_from_dir_header_keys():
+    entries = list(entries_from_dir(waveunitdir, time_string_parse_format='%d/%m/%Y',
+                                    header_keys=['TELESCOP']))
+    assert len(entries) == 4
+    for entry, filename in entries:
+        if filename.endswith('na120701.091058.fits'):
+            break
+    assert FitsHeaderEntry('TELESCOP', 'NRH') in entry.fits_header_entries
+    assert FitsHeaderEntry('OBJECT', 'FS') not in entry.fits_header_entries
+    assert entry.instrument == 'NRH2'
+
+
 def test_entries_from_dir_recursively_true():
     with pytest.warns(AstropyUserWarning, match='File may have been truncated'):
         entries = list(entries_from_dir(testdir, True,
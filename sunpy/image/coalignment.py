@@ -7,7 +7,9 @@ Which is partially inspired by the SSWIDL routine
 `tr_get_disp.pro <http://www.heliodocs.com/php/xdoc_print.php?file=$SSW/trace/idl/util/tr_get_disp.pro>`__.
 
 In this implementation, the template matching is handled via the scikit-image
-routine `skimage.feature.match_template`.
+routine `skimage.feature.match_template`.  Alternatively, the template can be
+located by phase correlation, with the subpixel location of the peak found
+with an upsampled discrete Fourier transform.
 
 References
 ----------
@@ -15,9 +17,13 @@ References
 * J.P. Lewis, Fast Template Matching, Vision Interface 95, Canadian Image
    Processing and Pattern Recognition Society, Quebec City, Canada, May 15-19,
    1995, p. 120-123 http://www.scribblethink.org/Work/nvisionInterface/vi95_lewis.pdf.
+* Manuel Guizar-Sicairos, Samuel T. Thurman, and James R. Fienup,
+   "Efficient subpixel image registration algorithms," Optics Letters 33,
+   156-158 (2008). https://doi.org/10.1364/OL.33.000156
 """
 import warnings
 from copy import deepcopy
+from itertools import groupby
 
 import numpy as np
 from scipy.ndimage.interpolation import shift
@@ -37,6 +43,13 @@ __all__ = ['calculate_shift', 'clip_edges', 'calculate_clipping',
            'calculate_match_template_shift']
 
 
+# The number of layers that are Fourier transformed together
+_FFT_CHUNK_SIZE = 16
+# The upsampling factor used to find the subpixel location of the peak of the
+# phase correlation
+_PHASE_CORRELATION_UPSAMPLING = 20
+
+
 def _default_fmap_function(data):
     """
     This function ensures that the data are floats.
@@ -312,8 +325,103 @@ def check_for_nonfinite_entries(layer_image, template_image):
                       'local mean.', SunpyUserWarning)
 
 
+class _PhaseCorrelator:
+    """
+    Locates a template in layers by phase correlation.
+
+    The Fourier transform of the template is calculated once, and the layers
+    are transformed in chunks.
+
+    Parameters
+    ----------
+    template : `numpy.ndarray`
+        A numpy array of size ``(N, M)``.
+    shape : `tuple`
+        The shape ``(ny, nx)`` of the layers, where ``N <= ny`` and ``M <= nx``.
+    """
+
+    def __init__(self, template, shape):
+        ny, nx = shape
+        ty, tx = template.shape
+        if ty > ny or tx > nx:
+            raise ValueError("The template must not be larger than the layers.")
+        self.shape = shape
+        # Only the positions of the template which lie entirely within the
+        # layer are considered, as for skimage.feature.match_template
+        self.valid = (ny - ty + 1, nx - tx + 1)
+
+        padded = np.zeros(shape)
+        padded[:ty, :tx] = template - np.mean(template)
+        self.template_fft = np.conj(np.fft.rfft2(padded))
+
+        # The weights of the columns of the half spectrum returned by rfft2 in
+        # the full spectrum
+        self.weights = np.full(self.template_fft.shape[1], 2.0)
+        self.weights[0] = 1
+        if nx % 2 == 0:
+            self.weights[-1] = 1
+
+    def __call__(self, layers):
+        """
+        Returns the ``(y, x)`` locations of the template in a stack of layers,
+        as an array of shape ``(2, len(layers))``.
+        """
+        layers = layers - np.mean(layers, axis=(-2, -1), keepdims=True)
+        cross_power = np.fft.rfft2(layers) * self.template_fft
+        # Whiten the cross power spectrum, leaving only the phase, which gives
+        # a sharp peak at the location of the template
+        phase = cross_power / np.maximum(np.abs(cross_power), np.finfo(float).tiny)
+        correlation = np.fft.irfft2(phase, s=self.shape)
+        correlation = correlation[:, :self.valid[0], :self.valid[1]]
+
+        locations = np.empty((2, len(layers)))
+        for i in range(len(layers)):
+            peak = np.unravel_index(np.argmax(correlation[i]), self.valid)
+            locations[:, i] = self._refine(cross_power[i], peak)
+        return locations
+
+    def _refine(self, cross_power, peak):
+        """
+        Find the subpixel location of a peak by evaluating the cross
+        correlation on an upsampled grid around it, which is done by matrix
+        multiplication with a discrete Fourier transform kernel.
+
+        The cross correlation is used rather than the phase correlation, as
+        the whitened spectrum gives too much weight to the noisy high
+        frequencies, which biases the subpixel location.
+        """
+        upsampling = _PHASE_CORRELATION_UPSAMPLING
+        size = int(np.ceil(1.5 * upsampling))
+        offsets = [p + (np.arange(size) - size // 2) / upsampling for p in peak]
+        kernel_y = np.exp(2j * np.pi * np.outer(offsets[0], np.fft.fftfreq(self.shape[0])))
+        kernel_x = np.exp(2j * np.pi * np.outer(offsets[1], np.fft.rfftfreq(self.shape[1])))
+        upsampled = (kernel_y @ (cross_power * self.weights) @ kernel_x.T).real
+        y, x = find_best_match_location(upsampled)
+        return (offsets[0][0] + y.to_value(u.pix) / upsampling,
+                offsets[1][0] + x.to_value(u.pix) / upsampling)
+
+
+def _chunks(sequence, size):
+    """
+    Split a sequence into consecutive chunks of at most ``size`` items.
+    """
+    return [sequence[i:i + size] for i in range(0, len(sequence), size)]
+
+
+def _fourier_shift(data, yshift, xshift):
+    """
+    Shift a stack of 2D arrays by subpixel amounts, by multiplying their
+    Fourier transforms by a phase ramp. The shifts wrap around the edges of
+    the arrays.
+    """
+    ny, nx = data.shape[-2:]
+    ramp = np.exp(-2j * np.pi * (np.fft.fftfreq(ny)[:, np.newaxis] * yshift[:, np.newaxis, np.newaxis] +
+                                 np.fft.rfftfreq(nx) * xshift[:, np.newaxis, np.newaxis]))
+    return np.fft.irfft2(np.fft.rfft2(data) * ramp, s=(ny, nx))
+
+
 @u.quantity_input
-def apply_shifts(mc, yshift: u.pix, xshift: u.pix, clip=True, **kwargs):
+def apply_shifts(mc, yshift: u.pix, xshift: u.pix, clip=True, method='spline', **kwargs):
     """
     Apply a set of pixel shifts to a `~sunpy.map.MapSequence`, and return a new
     `~sunpy.map.MapSequence`.
@@ -331,10 +439,17 @@ def apply_shifts(mc, yshift: u.pix, xshift: u.pix, clip=True, **kwargs):
     clip : `bool`, optional
         If `True` (default), then clip off "x", "y" edges of the maps in the sequence that are
         potentially affected by edges effects.
+    method : {'spline' | 'fourier'}, optional
+        If 'spline' (default), each map is shifted with `scipy.ndimage.shift`.
+        If 'fourier', the maps are shifted together by multiplying their
+        Fourier transforms by a phase ramp. The Fourier shift wraps data
+        around the edges of the maps, which are removed if ``clip`` is `True`,
+        and non-finite values spread over the whole of a map.
 
     Notes
     -----
-    All other keywords are passed to `scipy.ndimage.shift`.
+    All other keywords are passed to `scipy.ndimage.shift`, and can not be used
+    with the 'fourier' method.
 
     Returns
     -------
@@ -342,6 +457,12 @@ def apply_shifts(mc, yshift: u.pix, xshift: u.pix, clip=True, **kwargs):
         A `~sunpy.map.MapSequence` of the same shape as the input. All layers in
         the `~sunpy.map.MapSequence` have been shifted according the input shifts.
     """
+    if method not in ('spline', 'fourier'):
+        raise ValueError("method must be one of 'spline' or 'fourier'.")
+    if method == 'fourier' and kwargs:
+        raise TypeError("Keyword arguments for scipy.ndimage.shift can not be used "
+                        "with the 'fourier' method.")
+
     # New mapsequence will be constructed from this list
     new_mc = []
 
@@ -349,9 +470,22 @@ def apply_shifts(mc, yshift: u.pix, xshift: u.pix, clip=True, **kwargs):
     if clip:
         yclips, xclips = calculate_clipping(-yshift, -xshift)
 
+    if method == 'fourier':
+        # Shift consecutive maps with the same shape together
+        shifted = []
+        indices = np.arange(len(mc.maps))
+        for _, group in groupby(indices, key=lambda i: mc.maps[i].data.shape):
+            for chunk in _chunks(list(group), _FFT_CHUNK_SIZE):
+                shifted.extend(_fourier_shift(np.array([mc.maps[i].data for i in chunk]),
+                                              yshift[chunk].to_value(u.pix),
+                                              xshift[chunk].to_value(u.pix)))
+
     # Shift the data and construct the mapsequence
     for i, m in enumerate(mc):
-        shifted_data = shift(deepcopy(m.data), [yshift[i].value, xshift[i].value], **kwargs)
+        if method == 'fourier':
+            shifted_data = shifted[i]
+        else:
+            shifted_data = shift(deepcopy(m.data), [yshift[i].value, xshift[i].value], **kwargs)
         new_meta = deepcopy(m.meta)
         # Clip if required.  Use the submap function to return the appropriate
         # portion of the data.
@@ -371,8 +505,38 @@ def apply_shifts(mc, yshift: u.pix, xshift: u.pix, clip=True, **kwargs):
     return sunpy.map.Map(new_mc, sequence=True)
 
 
+def _phase_correlation_shifts(maps, template, func, workers, executor):
+    """
+    Calculate the pixel locations of a template in each of a list of maps by
+    phase correlation.
+    """
+    # Import here to avoid a circular import
+    from sunpy.map.map_factory import _get_executor
+
+    shape = maps[0].data.shape
+    if any(m.data.shape != shape for m in maps):
+        raise ValueError("All the layers must have the same shape to use phase correlation.")
+    correlator = _PhaseCorrelator(template, shape)
+
+    def locate(chunk):
+        layers = []
+        for m in chunk:
+            layer = func(m.data)
+            # Warn user if any NANs, Infs, etc are present in the layer or the template
+            check_for_nonfinite_entries(layer, template)
+            layers.append(layer)
+        return correlator(np.array(layers, dtype=float))
+
+    chunks = _chunks(maps, _FFT_CHUNK_SIZE)
+    with _get_executor(workers, executor) as pool:
+        locations = list(map(locate, chunks) if pool is None else pool.map(locate, chunks))
+    yshift, xshift = np.concatenate(locations, axis=1)
+    return yshift * u.pix, xshift * u.pix
+
+
 def calculate_match_template_shift(mc, template=None, layer_index=0,
-                                   func=_default_fmap_function):
+                                   func=_default_fmap_function, method='match_template',
+                                   workers=None, executor=None):
     """
     Calculate the arcsecond shifts necessary to co-register the layers in a
     `~sunpy.map.MapSequence` according to a template taken from that
@@ -407,7 +571,24 @@ def calculate_match_template_shift(mc, template=None, layer_index=0,
         logarithm or the square root. The function is of the form
         ``func = F(data)``. The default function ensures that the data are
         floats.
+    method : {'match_template' | 'phase_correlation'}, optional
+        If 'match_template' (default), the template is located in each layer
+        with `skimage.feature.match_template`. If 'phase_correlation', the
+        template is located by phase correlation, with the subpixel location
+        found with an upsampled Fourier transform. The Fourier transform of
+        the template is only calculated once, and the layers are processed in
+        chunks, which is much faster for large layers. All the layers must
+        have the same shape.
+    workers : `int`, optional
+        If set, process the chunks of layers concurrently using a thread pool
+        with this many threads. Only used by the 'phase_correlation' method.
+    executor : `concurrent.futures.Executor`, optional
+        If set, process the chunks of layers concurrently using this executor.
+        It is not shut down afterwards. Can not be used with ``workers``.
     """
+    if method not in ('match_template', 'phase_correlation'):
+        raise ValueError("method must be one of 'match_template' or 'phase_correlation'.")
+
     # Size of the data
     ny = mc.maps[layer_index].data.shape[0]
     nx = mc.maps[layer_index].data.shape[1]
@@ -436,17 +617,21 @@ def calculate_match_template_shift(mc, template=None, layer_index=0,
     xshift_arcseconds = np.zeros(nt) * u.arcsec
     yshift_arcseconds = np.zeros_like(xshift_arcseconds)
 
-    # Match the template and calculate shifts
-    for i, m in enumerate(mc.maps):
-        # Get the next 2-d data array
-        this_layer = func(m.data)
+    if method == 'phase_correlation':
+        yshift_keep, xshift_keep = _phase_correlation_shifts(mc.maps, tplate, func,
+                                                             workers, executor)
+    else:
+        # Match the template and calculate shifts
+        for i, m in enumerate(mc.maps):
+            # Get the next 2-d data array
+            this_layer = func(m.data)
 
-        # Calculate the y and x shifts in pixels
-        yshift, xshift = calculate_shift(this_layer, tplate)
+            # Calculate the y and x shifts in pixels
+            yshift, xshift = calculate_shift(this_layer, tplate)
 
-        # Keep shifts in pixels
-        yshift_keep[i] = yshift
-        xshift_keep[i] = xshift
+            # Keep shifts in pixels
+            yshift_keep[i] = yshift
+            xshift_keep[i] = xshift
 
     # Calculate shifts relative to the template layer
     yshift_keep = yshift_keep - yshift_keep[layer_index]
@@ -464,7 +649,9 @@ def calculate_match_template_shift(mc, template=None, layer_index=0,
 # Coalignment by matching a template
 def mapsequence_coalign_by_match_template(mc, template=None, layer_index=0,
                                           func=_default_fmap_function, clip=True,
-                                          shift=None, **kwargs):
+                                          shift=None, method='match_template',
+                                          shift_method='spline', workers=None, executor=None,
+                                          **kwargs):
     """
     Co-register the layers in a `~sunpy.map.MapSequence` according to a
     template taken from that `~sunpy.map.MapSequence`. This method REQUIRES
@@ -513,6 +700,18 @@ def mapsequence_coalign_by_match_template(mc, template=None, layer_index=0,
         `~sunpy.map.MapSequence`.  If a shift is passed in to the function, that
         shift is applied to the input `~sunpy.map.MapSequence` and the template
         matching algorithm is not used.
+    method : {'match_template' | 'phase_correlation'}, optional
+        The method used to locate the template, see
+        `sunpy.image.coalignment.calculate_match_template_shift`.
+    shift_method : {'spline' | 'fourier'}, optional
+        The method used to apply the shifts to the maps, see
+        `sunpy.image.coalignment.apply_shifts`. Defaults to 'spline'.
+    workers : `int`, optional
+        If set, locate the template using a thread pool with this many
+        threads. Only used by the 'phase_correlation' method.
+    executor : `concurrent.futures.Executor`, optional
+        If set, locate the template using this executor. It is not shut down
+        afterwards. Can not be used with ``workers``.
 
     Notes
     -----
@@ -532,6 +731,8 @@ def mapsequence_coalign_by_match_template(mc, template=None, layer_index=0,
     >>> coaligned_mc = mc_coalign(mc, template=sunpy_map)   # doctest: +SKIP
     >>> coaligned_mc = mc_coalign(mc, template=two_dimensional_ndarray)   # doctest: +SKIP
     >>> coaligned_mc = mc_coalign(mc, func=np.log)   # doctest: +SKIP
+    >>> coaligned_mc = mc_coalign(mc, method='phase_correlation')   # doctest: +SKIP
+    >>> coaligned_mc = mc_coalign(mc, method='phase_correlation', shift_method='fourier')   # doctest: +SKIP
     """
     # Number of maps
     nt = len(mc.maps)
@@ -543,7 +744,8 @@ def mapsequence_coalign_by_match_template(mc, template=None, layer_index=0,
     if shift is None:
         shifts = calculate_match_template_shift(mc, template=template,
                                                 layer_index=layer_index,
-                                                func=func)
+                                                func=func, method=method,
+                                                workers=workers, executor=executor)
         xshift_arcseconds = shifts['x']
         yshift_arcseconds = shifts['y']
     else:
@@ -556,4 +758,4 @@ def mapsequence_coalign_by_match_template(mc, template=None, layer_index=0,
         yshift_keep[i] = (yshift_arcseconds[i] / m.scale[1])
 
     # Apply the shifts and return the coaligned mapsequence
-    return apply_shifts(mc, -yshift_keep, -xshift_keep, clip=clip, **kwargs)
+    return apply_shifts(mc, -yshift_keep, -xshift_keep, clip=clip, method=shift_method, **kwargs)
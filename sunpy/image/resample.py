@@ -5,7 +5,29 @@ import numpy as np
 import scipy.interpolate
 import scipy.ndimage
 
-__all__ = ['resample', 'reshape_image_to_4d_superpixel']
+__all__ = ['resample', 'reshape_image_to_4d_superpixel', 'block_reduce']
+
+# The built-in reductions of block_reduce, these all reduce over several axes
+# at once, and so reduce each block in a single pass.
+_BLOCK_REDUCTIONS = {
+    'sum': np.sum,
+    'mean': np.mean,
+    'median': np.median,
+    'max': np.max,
+    'min': np.min,
+    'nansum': np.nansum,
+    'nanmean': np.nanmean,
+    'nanmedian': np.nanmedian,
+    'nanmax': np.nanmax,
+    'nanmin': np.nanmin,
+}
+_MASKED_BLOCK_REDUCTIONS = {
+    'sum': np.ma.sum,
+    'mean': np.ma.mean,
+    'median': np.ma.median,
+    'max': np.ma.max,
+    'min': np.ma.min,
+}
 
 
 def resample(orig, dimensions, method='linear', center=False, minusone=False):
@@ -51,120 +73,126 @@ def resample(orig, dimensions, method='linear', center=False, minusone=False):
     https://scipy-cookbook.readthedocs.io/items/Rebinning.html
     """
 
-    # Verify that number dimensions requested matches original shape
-    if len(dimensions) != orig.ndim:
-        raise UnequalNumDimensions("Number of dimensions must remain the same "
-                                   "when calling resample.")
-
-    # TODO: Will this be okay for integer (e.g. JPEG 2000) data?
-    if orig.dtype not in [np.float64, np.float32]:
-        orig = orig.astype(np.float64)
-
-    dimensions = np.asarray(dimensions, dtype=np.float64)
-    m1 = np.array(minusone, dtype=np.int64)  # array(0) or array(1)
-    offset = np.float64(center * 0.5)       # float64(0.) or float64(0.5)
-
-    # Resample data
-    if method == 'neighbor':
-        data = _resample_neighbor(orig, dimensions, offset, m1)
-    elif method in ['nearest', 'linear']:
-        data = _resample_nearest_linear(orig, dimensions, method,
-                                        offset, m1)
-    elif method == 'spline':
-        data = _resample_spline(orig, dimensions, offset, m1)
-    else:
-        raise UnrecognizedInterpolationMethod("Unrecognized interpolation "
-                                              "method requested.")
-
-    return data
-
-
-def _resample_nearest_linear(orig, dimensions, method, offset, m1):
-    """
-    Resample Map using either linear or nearest interpolation.
-
-    Parameters
-    ----------
-    orig : array-like
-        Original data.
-    dimensions : `tuple`
-        Dimensions of resampled data.
-    method : `str`
-        Interpolation method passed to `~scipy.interpolate.interp1d`
-    offset : `float`
-        Either 0 or 0.5, depending on whether interpolation is at the edge or
-        centers of bins.
-    m1 : 0 or 1
-        For ``orig.shape = (i,j)`` & new dimensions ``= (x,y)``, if set to `False`
-        (default) ``orig`` is resampled by factors of ``(i/x) * (j/y)``,
-        otherwise ``orig`` is resampled by ``(i-1)/(x-1) * (j-1)/(y-1)``.
-        This prevents extrapolation one element beyond bounds of input array.
-    """
-    old_coords = [np.arange(i, dtype=float) + offset for i in orig.shape]
-    scale = (orig.shape - m1) / (dimensions - m1)
-    new_coords = [(np.arange(dimensions[i], dtype=float) + offset) * scale[i] for i in
-                  range(len(dimensions))]
-
-    # first interpolation - for ndims = any
-    mint = scipy.interpolate.interp1d(old_coords[-1], orig, bounds_error=False,
-                                      fill_value='extrapolate', kind=method)
-
-    new_data = mint(new_coords[-1])
-
-    trorder = [orig.ndim - 1] + list(range(orig.ndim - 1))
-    for i in range(orig.ndim - 2, -1, -1):
-        new_data = new_data.transpose(trorder)
-        mint = scipy.interpolate.interp1d(old_coords[i], new_data,
-                                          bounds_error=False,
-                                          fill_value='extrapolate',
-                                          kind=method)
-        new_data = mint(new_coords[i])
-
-    if orig.ndim > 1:
-        # need one more transpose to return to original dimensions
-        new_data = new_data.transpose(trorder)
+    return _Resampler(orig.shape, dimensions, method=method,
+                      center=center, minusone=minusone)(orig)
 
-    return new_data
 
-
-def _resample_neighbor(orig, dimensions, offset, m1):
-    """
-    Resample Map using closest-value interpolation.
+class _Resampler:
     """
-    dimlist = []
-    dimensions = np.asarray(dimensions, dtype=int)
-
-    for i in range(orig.ndim):
-        base = np.indices(dimensions)[i]
-        dimlist.append((orig.shape[i] - m1) / (dimensions[i] - m1) *
-                       (base + offset) - offset)
-    cd = np.array(dimlist).round().astype(int)
+    Resamples arrays of a given shape to new dimension sizes.
 
-    return orig[tuple(list(cd))]
-
-
-def _resample_spline(orig, dimensions, offset, m1):
-    """
-    Resample Map using spline-based interpolation.
+    The interpolation grid is calculated once, so that it is shared by all the
+    arrays that are resampled. See `resample` for a description of the
+    parameters.
     """
-    nslices = [slice(0, j) for j in list(dimensions)]
-    newcoords = np.mgrid[nslices]
 
-    newcoords_dims = list(range(newcoords.ndim))
-
-    # make first index last
-    newcoords_dims.append(newcoords_dims.pop(0))
-    newcoords_tr = newcoords.transpose(newcoords_dims)
-
-    # makes a view that affects newcoords
-    newcoords_tr += offset
-
-    deltas = (np.asarray(orig.shape) - m1) / (dimensions - m1)
-    newcoords_tr *= deltas
-
-    newcoords_tr -= offset
-
-    return scipy.ndimage.map_coordinates(orig, newcoords)
+    def __init__(self, shape, dimensions, method='linear', center=False, minusone=False):
+        # Verify that number dimensions requested matches original shape
+        if len(dimensions) != len(shape):
+            raise UnequalNumDimensions("Number of dimensions must remain the same "
+                                       "when calling resample.")
+        if method not in ['neighbor', 'nearest', 'linear', 'spline']:
+            raise UnrecognizedInterpolationMethod("Unrecognized interpolation "
+                                                  "method requested.")
+        self.method = method
+
+        shape = np.asarray(shape)
+        dimensions = np.asarray(dimensions, dtype=np.float64)
+        m1 = np.array(minusone, dtype=np.int64)  # array(0) or array(1)
+        offset = np.float64(center * 0.5)       # float64(0.) or float64(0.5)
+
+        if method == 'neighbor':
+            self._indices = self._neighbor_indices(shape, dimensions, offset, m1)
+        elif method in ['nearest', 'linear']:
+            self._old_coords = [np.arange(i, dtype=float) + offset for i in shape]
+            scale = (shape - m1) / (dimensions - m1)
+            self._new_coords = [(np.arange(dimensions[i], dtype=float) + offset) * scale[i] for i in
+                                range(len(dimensions))]
+        else:
+            self._coords = self._spline_coords(shape, dimensions, offset, m1)
+
+    def __call__(self, orig):
+        # TODO: Will this be okay for integer (e.g. JPEG 2000) data?
+        if orig.dtype not in [np.float64, np.float32]:
+            orig = orig.astype(np.float64)
+
+        # Resample data
+        if self.method == 'neighbor':
+            return orig[self._indices]
+        elif self.method in ['nearest', 'linear']:
+            return self._resample_nearest_linear(orig)
+        else:
+            return scipy.ndimage.map_coordinates(orig, self._coords)
+
+    def _resample_nearest_linear(self, orig):
+        """
+        Resample using either linear or nearest interpolation.
+        """
+        old_coords = self._old_coords
+        new_coords = self._new_coords
+        method = self.method
+
+        # first interpolation - for ndims = any
+        mint = scipy.interpolate.interp1d(old_coords[-1], orig, bounds_error=False,
+                                          fill_value='extrapolate', kind=method)
+
+        new_data = mint(new_coords[-1])
+
+        trorder = [orig.ndim - 1] + list(range(orig.ndim - 1))
+        for i in range(orig.ndim - 2, -1, -1):
+            new_data = new_data.transpose(trorder)
+            mint = scipy.interpolate.interp1d(old_coords[i], new_data,
+                                              bounds_error=False,
+                                              fill_value='extrapolate',
+                                              kind=method)
+            new_data = mint(new_coords[i])
+
+        if orig.ndim > 1:
+            # need one more transpose to return to original dimensions
+            new_data = new_data.transpose(trorder)
+
+        return new_data
+
+    @staticmethod
+    def _neighbor_indices(shape, dimensions, offset, m1):
+        """
+        The indices of the closest values for closest-value interpolation.
+        """
+        dimlist = []
+        dimensions = np.asarray(dimensions, dtype=int)
+
+        for i in range(len(shape)):
+            base = np.indices(dimensions)[i]
+            dimlist.append((shape[i] - m1) / (dimensions[i] - m1) *
+                           (base + offset) - offset)
+        cd = np.array(dimlist).round().astype(int)
+
+        return tuple(list(cd))
+
+    @staticmethod
+    def _spline_coords(shape, dimensions, offset, m1):
+        """
+        The coordinates of the new array in the original array for
+        spline-based interpolation.
+        """
+        nslices = [slice(0, j) for j in list(dimensions)]
+        newcoords = np.mgrid[nslices]
+
+        newcoords_dims = list(range(newcoords.ndim))
+
+        # make first index last
+        newcoords_dims.append(newcoords_dims.pop(0))
+        newcoords_tr = newcoords.transpose(newcoords_dims)
+
+        # makes a view that affects newcoords
+        newcoords_tr += offset
+
+        deltas = (shape - m1) / (dimensions - m1)
+        newcoords_tr *= deltas
+
+        newcoords_tr -= offset
+
+        return newcoords
 
 
 def reshape_image_to_4d_superpixel(img, dimensions, offset):
@@ -238,6 +266,86 @@ def reshape_image_to_4d_superpixel(img, dimensions, offset):
                 int(offset[1]):int(offset[1] + nb * dimensions[1])]).reshape(na, dimensions[0], nb, dimensions[1])
 
 
+def block_reduce(data, dimensions, offset=(0, 0), func='sum', chunk_size=None):
+    """
+    Reduce non-overlapping blocks of pixels of an image, or of a stack of
+    images, to single values.
+
+    The blocks are taken from a strided view of ``data``, so the data are not
+    copied before being reduced.
+
+    Parameters
+    ----------
+    data : `numpy.ndarray`
+        An array of the form ``(..., y, x)``. Any leading axes, for example
+        the time axis of a data cube, are kept, and every image is reduced
+        in the same way. If ``data`` is a `numpy.ma.MaskedArray`, masked
+        pixels are ignored.
+    dimensions : array-like
+        A two element array-like object containing integers that describe the
+        block size in the ``(y, x)`` directions.
+    offset : array-like, optional
+        A two element array-like object containing integers that describe
+        where in the image the first block begins in the ``(y, x)``
+        directions.
+    func : `str` or callable, optional
+        The reduction applied to each block. One of ``'sum'``, ``'mean'``,
+        ``'median'``, ``'max'``, ``'min'``, or the NaN-ignoring variants
+        ``'nansum'``, ``'nanmean'``, ``'nanmedian'``, ``'nanmax'`` and
+        ``'nanmin'``. Otherwise, a function that takes an array as its first
+        argument and supports the ``axis`` keyword, which is applied along the
+        ``x`` axis of the blocks and then along their ``y`` axis.
+        Defaults to ``'sum'``.
+    chunk_size : `int`, optional
+        If given, the number of rows of blocks reduced at a time. This limits
+        the amount of data read at once from a `numpy.memmap`.
+
+    Returns
+    -------
+    `numpy.ndarray`
+        The reduced array, of the form ``(..., y, x)``.
+    """
+    masked = isinstance(data, np.ma.MaskedArray)
+    if isinstance(func, str):
+        if func not in _BLOCK_REDUCTIONS:
+            raise ValueError(f"func must be one of {', '.join(_BLOCK_REDUCTIONS)} or a function, "
+                             f"not '{func}'.")
+        if masked:
+            # Masked arrays have no NaN-ignoring reductions, so mask the NaNs instead
+            if func.startswith('nan'):
+                data = np.ma.masked_invalid(data)
+                func = func[3:]
+            reduction = _MASKED_BLOCK_REDUCTIONS[func]
+        else:
+            reduction = _BLOCK_REDUCTIONS[func]
+
+        def reduce(blocks):
+            return reduction(blocks, axis=(-3, -1))
+    else:
+        def reduce(blocks):
+            return func(func(blocks, axis=-1), axis=-2)
+
+    dimensions = [int(dim) for dim in dimensions]
+    offset = [int(off) for off in offset]
+    ny = (data.shape[-2] - offset[0]) // dimensions[0]
+    nx = (data.shape[-1] - offset[1]) // dimensions[1]
+    # Splitting an axis into two never copies the data, so this is a view
+    blocks = data[..., offset[0]:offset[0] + ny * dimensions[0],
+                  offset[1]:offset[1] + nx * dimensions[1]]
+    blocks = blocks.reshape(data.shape[:-2] + (ny, dimensions[0], nx, dimensions[1]))
+
+    if chunk_size is None or chunk_size >= ny:
+        return reduce(blocks)
+
+    chunk_size = int(chunk_size)
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer.")
+    chunks = [reduce(blocks[..., i:i + chunk_size, :, :, :])
+              for i in range(0, ny, chunk_size)]
+    concatenate = np.ma.concatenate if masked else np.concatenate
+    return concatenate(chunks, axis=-2)
+
+
 class UnrecognizedInterpolationMethod(ValueError):
     """
     Unrecognized interpolation method specified.
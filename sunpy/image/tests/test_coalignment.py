@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pytest
@@ -368,3 +369,89 @@ def test_apply_shifts(aia171_test_map):
                             order=2, mode='reflect')
     test_mc2 = apply_shifts(mc, astropy_displacements["y"], astropy_displacements["x"], clip=False)
     assert(np.all(test_mc1[1].data[:, -1] != test_mc2[1].data[:, -1]))
+
+
+def test_apply_shifts_fourier(aia171_test_map):
+    mc = Map([aia171_test_map, aia171_test_map], sequence=True)
+    yshift = [0, -10] * u.pix
+    xshift = [0, 3] * u.pix
+
+    # Integer shifts are exact, so give the same result as the spline shift
+    # once the edges have been clipped
+    test_mc1 = apply_shifts(mc, yshift, xshift, method='fourier')
+    test_mc2 = apply_shifts(mc, yshift, xshift)
+    for m1, m2 in zip(test_mc1, test_mc2):
+        assert m1.data.shape == m2.data.shape
+        assert_allclose(m1.data, m2.data, atol=1e-6 * np.max(m2.data))
+        assert m1.reference_pixel == m2.reference_pixel
+
+    # Subpixel shifts of a smooth image are exact
+    y, x = np.indices(aia171_test_map.data.shape)
+    gaussian = np.exp(-((x - 60)**2 + (y - 70)**2) / 50)
+    mc = Map([(gaussian, aia171_test_map.meta)] * 2, sequence=True)
+    test_mc = apply_shifts(mc, [0, 2.5] * u.pix, [0, -1.2] * u.pix, clip=False, method='fourier')
+    assert_allclose(test_mc[0].data, gaussian, atol=1e-10)
+    assert_allclose(test_mc[1].data, np.exp(-((x - 58.8)**2 + (y - 72.5)**2) / 50), atol=1e-10)
+
+    with pytest.raises(TypeError, match="can not be used"):
+        apply_shifts(mc, yshift, xshift, method='fourier', order=1)
+    with pytest.raises(ValueError, match="method must be one of"):
+        apply_shifts(mc, yshift, xshift, method='linear')
+
+
+def test_calculate_match_template_shift_phase_correlation(aia171_test_mc,
+                                                          aia171_mc_arcsec_displacements,
+                                                          aia171_test_map_layer_shape):
+    test_displacements = calculate_match_template_shift(aia171_test_mc, method='phase_correlation')
+    assert_allclose(test_displacements['x'], aia171_mc_arcsec_displacements['x'], rtol=5e-2, atol=0)
+    assert_allclose(test_displacements['y'], aia171_mc_arcsec_displacements['y'], rtol=5e-2, atol=0)
+
+    # The same shifts are found when the chunks are processed concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        concurrent_displacements = calculate_match_template_shift(
+            aia171_test_mc, method='phase_correlation', executor=executor)
+    assert_allclose(concurrent_displacements['x'], test_displacements['x'])
+    assert_allclose(concurrent_displacements['y'], test_displacements['y'])
+
+    ny, nx = aia171_test_map_layer_shape
+    with pytest.raises(ValueError, match="must not be larger"):
+        calculate_match_template_shift(aia171_test_mc, template=np.zeros((ny + 1, nx)),
+                                       method='phase_correlation')
+    with pytest.raises(ValueError, match="method must be one of"):
+        calculate_match_template_shift(aia171_test_mc, method='fft')
+
+
+def test_phase_correlation_subpixel(aia171_test_map):
+    # Shift the data in Fourier space, so that the shifts are known exactly
+    displacements = np.array([[0, 2.3, -4.7], [0, -1.25, 3.6]])
+    test_mc = apply_shifts(Map([aia171_test_map] * 3, sequence=True),
+                           displacements[0] * u.pix, displacements[1] * u.pix,
+                           clip=False, method='fourier')
+    test_displacements = calculate_match_template_shift(test_mc, method='phase_correlation')
+    assert_allclose(test_displacements['y'] / aia171_test_map.scale[1], displacements[0] * u.pix,
+                    atol=0.02)
+    assert_allclose(test_displacements['x'] / aia171_test_map.scale[0], displacements[1] * u.pix,
+                    atol=0.02)
+
+
+def test_mapsequence_coalign_by_phase_correlation(aia171_test_mc):
+    test_displacements = calculate_match_template_shift(aia171_test_mc, method='phase_correlation')
+    test_mc = mapsequence_coalign_by_match_template(aia171_test_mc, method='phase_correlation')
+    assert isinstance(test_mc, MapSequence)
+    assert test_mc[0].data.shape == test_mc[1].data.shape
+    for im, m in enumerate(aia171_test_mc):
+        for i_s, s in enumerate(['x', 'y']):
+            assert_allclose(aia171_test_mc[im].reference_pixel[i_s] - test_mc[im].reference_pixel[i_s],
+                            test_displacements[s][im] / m.scale[i_s],
+                            rtol=5e-2, atol=0)
+
+    # The shifts are applied with splines unless the Fourier shift is asked for
+    test_mc = mapsequence_coalign_by_match_template(aia171_test_mc, method='phase_correlation',
+                                                    clip=False, cval=np.nan)
+    assert np.all(np.isnan(test_mc[1].data[:, -1]))
+    expected = apply_shifts(aia171_test_mc, -test_displacements['y'] / aia171_test_mc[0].scale[1],
+                            -test_displacements['x'] / aia171_test_mc[0].scale[0],
+                            clip=False, method='fourier')
+    test_mc = mapsequence_coalign_by_match_template(aia171_test_mc, method='phase_correlation',
+                                                    shift_method='fourier', clip=False)
+    assert_allclose(test_mc[1].data, expected[1].data)
@@ -7,7 +7,7 @@ import astropy.units as u
 
 import sunpy.data.test
 import sunpy.map
-from sunpy.image.resample import reshape_image_to_4d_superpixel
+from sunpy.image.resample import block_reduce, reshape_image_to_4d_superpixel
 
 
 @pytest.fixture
@@ -91,3 +91,57 @@ def test_reshape(aia171_test_map, shape):
     im = reshape_image_to_4d_superpixel(aia171_test_map.data, d, o)
     assert im.shape == (_n(shape[0], o[0], d[0]), d[0],
                         _n(shape[1], o[1], d[1]), d[1])
+
+
+@pytest.mark.parametrize('func', ['sum', 'mean', 'median', 'max', 'min',
+                                  'nansum', 'nanmean', 'nanmedian', 'nanmax', 'nanmin'])
+def test_block_reduce(func):
+    data = np.random.default_rng(0).random((3, 37, 41))
+    data[0, 5, 5] = np.nan
+    expected = np.stack([
+        getattr(np, func)(reshape_image_to_4d_superpixel(image, (4, 5), (1, 2)), axis=(1, 3))
+        for image in data])
+
+    reduced = block_reduce(data, (4, 5), (1, 2), func=func)
+    assert reduced.shape == (3, 9, 7)
+    np.testing.assert_allclose(reduced, expected)
+    np.testing.assert_allclose(block_reduce(data, (4, 5), (1, 2), func=func, chunk_size=2),
+                               expected)
+    np.testing.assert_allclose(block_reduce(data[0], (4, 5), (1, 2), func=func), expected[0])
+
+
+def test_block_reduce_callable():
+    data = np.arange(36).reshape((6, 6))
+    expected = np.array([[14, 22, 30], [62, 70, 78], [110, 118, 126]])
+    np.testing.assert_equal(block_reduce(data, (2, 2), func=np.sum), expected)
+    np.testing.assert_equal(block_reduce(data, (2, 2), func=np.sum, chunk_size=1), expected)
+
+
+def test_block_reduce_masked():
+    data = np.ma.array(np.ones((4, 4)), mask=np.zeros((4, 4), dtype=bool))
+    data.mask[:2, :2] = True
+    data.mask[2, 2] = True
+    data[3, 3] = np.nan
+
+    reduced = block_reduce(data, (2, 2), func='sum')
+    assert reduced.mask.tolist() == [[True, False], [False, False]]
+    assert reduced[0, 1] == 4
+    assert np.isnan(reduced[1, 1])
+    assert block_reduce(data, (2, 2), func='nanmean', chunk_size=1)[1, 1] == 1
+    assert block_reduce(data, (2, 2), func='nansum')[1, 1] == 2
+
+
+def test_block_reduce_memmap(tmp_path):
+    data = np.lib.format.open_memmap(tmp_path / 'data.npy', mode='w+',
+                                     dtype=np.int16, shape=(2, 64, 64))
+    data[:] = 1
+    reduced = block_reduce(data, (8, 8), func='sum', chunk_size=3)
+    assert not isinstance(reduced, np.memmap)
+    np.testing.assert_equal(reduced, np.full((2, 8, 8), 64))
+
+
+def test_block_reduce_errors():
+    with pytest.raises(ValueError, match='func must be one of'):
+        block_reduce(np.ones((4, 4)), (2, 2), func='std')
+    with pytest.raises(ValueError, match='chunk_size must be a positive integer'):
+        block_reduce(np.ones((4, 4)), (2, 2), chunk_size=0)
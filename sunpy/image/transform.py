@@ -77,45 +77,78 @@ def affine_transform(image, rmatrix, order=3, scale=1.0, image_center=None,
     Then optionally it uses a bicubic convolution interpolation
     algorithm to map the original to target pixel values.
     """
-    rmatrix = rmatrix / scale
-    array_center = (np.array(image.shape)[::-1] - 1) / 2.0
-
-    # Make sure the image center is an array and is where it's supposed to be
-    if image_center is not None:
-        image_center = np.asanyarray(image_center)
-    else:
-        image_center = array_center
-
-    # Determine center of rotation based on use (or not) of the recenter keyword
-    if recenter:
-        rot_center = array_center
-    else:
-        rot_center = image_center
-
-    displacement = np.dot(rmatrix, rot_center)
-    shift = image_center - displacement
-    if not use_scipy:
-        try:
-            import skimage.transform
-        except ImportError:
-            warnings.warn("scikit-image could not be imported. Image rotation will use scipy",
-                          ImportWarning)
-            use_scipy = True
-    if use_scipy:
-        if np.any(np.isnan(image)):
-            warnings.warn("Setting NaNs to 0 for SciPy rotation.", SunpyUserWarning)
-        # Transform the image using the scipy affine transform
-        rotated_image = scipy.ndimage.interpolation.affine_transform(
-            np.nan_to_num(image).T, rmatrix, offset=shift, order=order,
-            mode='constant', cval=missing).T
-    else:
-        # Make the rotation matrix 3x3 to include translation of the image
-        skmatrix = np.zeros((3, 3))
-        skmatrix[:2, :2] = rmatrix
-        skmatrix[2, 2] = 1.0
-        skmatrix[:2, 2] = shift
-        tform = skimage.transform.AffineTransform(skmatrix)
+    transform = _AffineTransform(image.shape, rmatrix, order=order, scale=scale,
+                                 image_center=image_center, recenter=recenter,
+                                 missing=missing, use_scipy=use_scipy)
+    return transform(image)
 
+
+class _AffineTransform:
+    """
+    An affine transformation of images of a given shape.
+
+    The transformation, and for scikit-image interpolation orders which do not
+    have a fast path the coordinates of the output pixels in the input image,
+    are calculated once, so that they are shared by all the images that are
+    transformed. See `affine_transform` for a description of the parameters.
+    """
+
+    def __init__(self, shape, rmatrix, order=3, scale=1.0, image_center=None,
+                 recenter=False, missing=0.0, use_scipy=False):
+        self.order = order
+        self.missing = missing
+        self.rmatrix = rmatrix / scale
+        array_center = (np.array(shape)[::-1] - 1) / 2.0
+
+        # Make sure the image center is an array and is where it's supposed to be
+        if image_center is not None:
+            image_center = np.asanyarray(image_center)
+        else:
+            image_center = array_center
+
+        # Determine center of rotation based on use (or not) of the recenter keyword
+        if recenter:
+            rot_center = array_center
+        else:
+            rot_center = image_center
+
+        displacement = np.dot(self.rmatrix, rot_center)
+        self.shift = image_center - displacement
+        if not use_scipy:
+            try:
+                import skimage.transform
+            except ImportError:
+                warnings.warn("scikit-image could not be imported. Image rotation will use scipy",
+                              ImportWarning)
+                use_scipy = True
+        self.use_scipy = use_scipy
+
+        self.coords = None
+        if not use_scipy:
+            # Make the rotation matrix 3x3 to include translation of the image
+            skmatrix = np.zeros((3, 3))
+            skmatrix[:2, :2] = self.rmatrix
+            skmatrix[2, 2] = 1.0
+            skmatrix[:2, 2] = self.shift
+            self.tform = skimage.transform.AffineTransform(skmatrix)
+            # Apart from these orders, skimage.transform.warp calculates the
+            # coordinates of every output pixel, so calculate them once here
+            if order not in (1, 3):
+                self.coords = skimage.transform.warp_coords(self.tform, shape)
+
+    def __call__(self, image):
+        if self.use_scipy:
+            if np.any(np.isnan(image)):
+                warnings.warn("Setting NaNs to 0 for SciPy rotation.", SunpyUserWarning)
+            # Transform the image using the scipy affine transform
+            return scipy.ndimage.interpolation.affine_transform(
+                np.nan_to_num(image).T, self.rmatrix, offset=self.shift, order=self.order,
+                mode='constant', cval=self.missing).T
+
+        import skimage.transform
+
+        order = self.order
+        missing = self.missing
         if issubclass(image.dtype.type, numbers.Integral):
             warnings.warn("Integer input data has been cast to float64.",
                           SunpyUserWarning)
@@ -142,7 +175,8 @@ def affine_transform(image, rmatrix, order=3, scale=1.0, image_center=None,
                 # The input array is all one value (aside from NaNs), so no scaling is needed
                 adjusted_missing = missing - im_min
 
-        rotated_image = skimage.transform.warp(adjusted_image, tform, order=order,
+        inverse_map = self.tform if self.coords is None else self.coords
+        rotated_image = skimage.transform.warp(adjusted_image, inverse_map, order=order,
                                                mode='constant', cval=adjusted_missing)
 
         # Convert the image back to its original range if it is valid
@@ -151,4 +185,4 @@ def affine_transform(image, rmatrix, order=3, scale=1.0, image_center=None,
                 rotated_image *= im_max
             rotated_image += im_min
 
-    return rotated_image
+        return rotated_image
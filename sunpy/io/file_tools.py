@@ -109,6 +109,12 @@ def read_file_header(filepath, filetype=None, **kwargs):
     -------
     headers : `list`
         A list of headers.
+
+    Notes
+    -----
+    Other keyword arguments are passed to the reader used. For example, FITS
+    files accept ``keys`` to quickly read only the given keywords, see
+    `sunpy.io.fits.get_header`.
     """
     # Use the explicitly passed filetype
     if filetype is not None:
@@ -26,22 +26,38 @@ Notes
 import os
 import re
 import sys
+import gzip
 import math
+import numbers
 import warnings
 import traceback
 import collections
 
+import numpy as np
+
 from astropy.io import fits
+from astropy.table import MaskedColumn, Table
 
 from sunpy.io.header import FileHeader
 from sunpy.util.exceptions import SunpyUserWarning
 
-__all__ = ['header_to_fits', 'read', 'get_header', 'write', 'extract_waveunit']
+__all__ = ['header_to_fits', 'read', 'get_header', 'scan_headers', 'write', 'extract_waveunit']
 
 HDPair = collections.namedtuple('HDPair', ['data', 'header'])
 
+# The numpy dtype of the unscaled data for each valid value of BITPIX.
+# FITS data is always stored big-endian on disk.
+_BITPIX_DTYPES = {8: '>u1', 16: '>i2', 32: '>i4', 64: '>i8', -32: '>f4', -64: '>f8'}
+
+# Sizes defined by the FITS standard
+_BLOCK_SIZE = 2880
+_CARD_SIZE = 80
+# Keywords needed to work out the size of the data unit following a header
+_STRUCTURAL_KEYS = re.compile(r'^(BITPIX|NAXIS\d*|PCOUNT|GCOUNT|GROUPS)$')
+_COMMENTARY_KEYS = ('COMMENT', 'HISTORY')
+
 
-def read(filepath, hdus=None, memmap=None, **kwargs):
+def read(filepath, hdus=None, memmap=None, lazy=False, **kwargs):
     """
     Read a fits file.
 
@@ -51,6 +67,12 @@ def read(filepath, hdus=None, memmap=None, **kwargs):
         The fits file to be read.
     hdus: `int` or iterable
         The HDU indexes to read from the file.
+    memmap : `bool`, optional
+        Should memory mapping be used, i.e. keep data on disk rather than in RAM.
+    lazy : `bool`, optional
+        If `True`, only the headers are read. The data of each image HDU is
+        returned as a `DeferredHDUData` which reads the data from disk the
+        first time it is accessed. Defaults to `False`.
 
     Returns
     -------
@@ -65,6 +87,9 @@ def read(filepath, hdus=None, memmap=None, **kwargs):
     Also all comments in the original file are concatenated into a single
     "comment" key in the returned FileHeader.
     """
+    if lazy:
+        return _read_deferred(filepath, hdus=hdus, memmap=memmap)
+
     with fits.open(filepath, ignore_blank=True, memmap=memmap) as hdulist:
         if hdus is not None:
             if isinstance(hdus, int):
@@ -93,7 +118,138 @@ def read(filepath, hdus=None, memmap=None, **kwargs):
     return pairs
 
 
-def get_header(afile):
+def _read_deferred(filepath, hdus=None, memmap=None):
+    """
+    Read only the headers of a fits file, deferring reading the data.
+
+    HDUs which do not contain image data (e.g. binary tables) are returned
+    with ``None`` as their data.
+    """
+    with fits.open(filepath, ignore_blank=True) as hdulist:
+        hdulist.verify('silentfix+warn')
+        headers = get_header(hdulist)
+        # Compressed image data is decompressed into native byte order
+        compressed = [isinstance(hdu, fits.CompImageHDU) for hdu in hdulist]
+
+    indices = range(len(headers))
+    if hdus is not None:
+        if isinstance(hdus, int):
+            indices = [hdus]
+        elif isinstance(hdus, collections.abc.Iterable):
+            indices = list(hdus)
+
+    pairs = []
+    for i in indices:
+        header = headers[i]
+        data = None
+        naxis = header.get('NAXIS', 0)
+        if naxis > 0 and header.get('XTENSION', 'IMAGE').strip() == 'IMAGE':
+            # The numpy shape is the reverse of the FITS axes order
+            shape = tuple(header[f'NAXIS{n}'] for n in range(naxis, 0, -1))
+            dtype = _dtype_from_header(header)
+            if compressed[i]:
+                dtype = dtype.newbyteorder('=')
+            data = DeferredHDUData(filepath, i, shape, dtype, memmap=memmap)
+        pairs.append(HDPair(data, header))
+
+    return pairs
+
+
+def _dtype_from_header(header):
+    """
+    Determine the dtype of the data of an image HDU as returned by
+    `astropy.io.fits`, without reading the data.
+
+    This follows the scaling rules of `astropy.io.fits`: integer data with
+    ``BSCALE``/``BZERO`` set to the pseudo-unsigned convention is returned as
+    unsigned integers, any other scaled integer data is returned as floats.
+    """
+    bitpix = header['BITPIX']
+    bscale = header.get('BSCALE', 1)
+    bzero = header.get('BZERO', 0)
+    if bitpix < 0 or (bscale == 1 and bzero == 0):
+        return np.dtype(_BITPIX_DTYPES[bitpix])
+
+    if bscale == 1:
+        if bitpix == 8 and bzero == -128:
+            return np.dtype('int8')
+        if bitpix > 8 and bzero == 1 << (bitpix - 1):
+            return np.dtype(f'uint{bitpix}')
+
+    return np.dtype('float64') if bitpix > 16 else np.dtype('float32')
+
+
+class DeferredHDUData:
+    """
+    A placeholder for the data of a FITS image HDU which has not been read yet.
+
+    This exposes the ``shape``, ``dtype`` and ``ndim`` of the data, which are
+    known from the header, so that the data only has to be read when the
+    values themselves are needed. Indexing or converting this object to an
+    array reads the data from disk. Indexing it with integers and slices only
+    reads the indexed part of the data, unless the data is tile compressed.
+
+    Parameters
+    ----------
+    filepath : `str`
+        The fits file the data is in.
+    hdu_index : `int`
+        The index of the HDU in the file.
+    shape : `tuple`
+        The shape of the data.
+    dtype : `numpy.dtype`
+        The dtype of the data.
+    memmap : `bool`, optional
+        Passed to `astropy.io.fits.open` when the data is read.
+    """
+
+    def __init__(self, filepath, hdu_index, shape, dtype, memmap=None):
+        self.filepath = filepath
+        self.hdu_index = hdu_index
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self.memmap = memmap
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    @property
+    def size(self):
+        return int(np.prod(self.shape))
+
+    def load(self):
+        """
+        Read the data from disk.
+
+        Returns
+        -------
+        `numpy.ndarray`
+        """
+        with fits.open(self.filepath, ignore_blank=True, memmap=self.memmap) as hdulist:
+            return hdulist[self.hdu_index].data
+
+    def __array__(self, dtype=None):
+        return np.asarray(self.load(), dtype=dtype)
+
+    def __getitem__(self, item):
+        with fits.open(self.filepath, ignore_blank=True, memmap=self.memmap) as hdulist:
+            hdu = hdulist[self.hdu_index]
+            # Image HDUs can read only the part of the data which is indexed
+            # from disk, if it is indexed with integers and slices and is not
+            # empty
+            items = item if isinstance(item, tuple) else (item,)
+            if (hasattr(hdu, 'section') and all(isinstance(i, (numbers.Integral, slice)) for i in items)
+                    and np.broadcast_to(False, self.shape)[item].size):
+                return hdu.section[item]
+            return hdu.data[item]
+
+    def __repr__(self):
+        return (f"<{self.__class__.__name__} HDU {self.hdu_index} of {self.filepath} "
+                f"shape={self.shape} dtype={self.dtype}>")
+
+
+def get_header(afile, keys=None):
     """
     Read a fits file and return just the headers for all HDU's. In each header,
     the key WAVEUNIT denotes the wavelength unit which is used to describe the
@@ -103,12 +259,36 @@ def get_header(afile):
     ----------
     afile : `str` or `astropy.io.fits.HDUList`
         The file to be read, or HDUList to process.
+    keys : iterable of `str`, optional
+        If given, only these keywords are read from each header. The headers
+        are parsed directly from the file with `scan_headers`, which is much
+        faster than reading them with `astropy.io.fits`, but means that the
+        headers are not verified. Not supported if ``afile`` is a
+        `~astropy.io.fits.HDUList`.
 
     Returns
     -------
     headers : `list`
         A list of `sunpy.io.header.FileHeader` headers.
     """
+    if keys is not None:
+        if isinstance(afile, fits.HDUList):
+            raise TypeError("keys can not be specified when passing a HDUList")
+        keys = [key.upper() for key in keys]
+        headers = []
+        # The wavelength keys are always needed to work out WAVEUNIT
+        for values, comments in _scan_hdus(afile, set(keys) | {'WAVEUNIT', 'WAVELNTH'}):
+            waveunit = extract_waveunit({'KEYCOMMENTS': comments, **values})
+            header = FileHeader((key, value) for key, value in values.items() if key in keys)
+            for key in _COMMENTARY_KEYS:
+                if key in keys:
+                    header.setdefault(key, '')
+            header['KEYCOMMENTS'] = {key: comments[key] for key in header if key in comments}
+            if waveunit is not None:
+                header['WAVEUNIT'] = waveunit
+            headers.append(header)
+        return headers
+
     if isinstance(afile, fits.HDUList):
         hdulist = afile
         close = False
@@ -150,6 +330,199 @@ def get_header(afile):
     return headers
 
 
+def scan_headers(filepaths, keys=None, hdu=0):
+    """
+    Quickly read a set of keywords from the headers of many fits files.
+
+    The header cards are parsed directly from the 2880 byte header blocks,
+    only converting the values of the requested keywords. The data units are
+    never read, and are skipped over when reading headers of later HDUs. The
+    headers are not verified like they are by `read` and `get_header`, and
+    the headers of tile compressed images are returned as they are stored in
+    the file, i.e. as binary table headers.
+
+    Parameters
+    ----------
+    filepaths : iterable of `str` or `pathlib.Path`
+        The fits files to read. Gzip compressed files are supported.
+    keys : iterable of `str`, optional
+        The keywords to read. If not given, all keywords are read.
+    hdu : `int`, optional
+        The index of the HDU to read the header of. Defaults to the primary
+        HDU.
+
+    Returns
+    -------
+    `astropy.table.Table`
+        A table with a ``path`` column, and a column for each keyword. Values
+        of keywords missing from a header are masked.
+
+    Examples
+    --------
+    >>> import glob
+    >>> from sunpy.io.fits import scan_headers
+    >>> table = scan_headers(glob.glob('aia_*.fits'), keys=['DATE-OBS', 'WAVELNTH', 'EXPTIME'])  # doctest: +SKIP
+    """
+    if keys is not None:
+        keys = [key.upper() for key in keys]
+    paths = []
+    rows = []
+    for filepath in filepaths:
+        hdus = _scan_hdus(filepath, keys)
+        if hdu >= len(hdus):
+            raise IndexError(f"{filepath} has no HDU with index {hdu}")
+        paths.append(os.fspath(filepath))
+        rows.append(hdus[hdu][0])
+
+    if keys is None:
+        # Use all the keys, in the order they are first found
+        keys = list(dict.fromkeys(key for row in rows for key in row))
+
+    columns = [paths] + [_masked_column([row.get(key) for row in rows], key) for key in keys]
+    return Table(columns, names=['path'] + keys, masked=True)
+
+
+def _masked_column(values, name):
+    """
+    Create a column from a list of header values, masking missing (`None`)
+    values.
+    """
+    mask = [value is None for value in values]
+    types = {type(value) for value in values if value is not None}
+    if types <= {bool}:
+        fill, dtype = False, bool
+    elif types <= {int}:
+        fill, dtype = 0, int
+    elif types <= {int, float}:
+        fill, dtype = np.nan, float
+    elif types <= {str}:
+        fill, dtype = '', str
+    else:
+        fill, dtype = None, object
+    data = np.array([fill if missing else value for value, missing in zip(values, mask)],
+                    dtype=dtype)
+    return MaskedColumn(data, mask=mask, name=name)
+
+
+def _scan_hdus(afile, keys=None):
+    """
+    Parse the headers of all HDUs in a fits file, without reading the data.
+
+    Parameters
+    ----------
+    afile : `str`, `pathlib.Path` or file-like
+        The fits file.
+    keys : iterable of `str`, optional
+        The keywords to read. If not given, all keywords are read.
+
+    Returns
+    -------
+    `list`
+        A list of ``(values, comments)`` pairs of `dict` for each HDU.
+    """
+    if hasattr(afile, 'read'):
+        return _scan_fileobj(afile, keys)
+
+    with open(afile, 'rb') as fileobj:
+        if fileobj.read(2) == b'\x1f\x8b':
+            fileobj.seek(0)
+            with gzip.GzipFile(fileobj=fileobj) as gzfileobj:
+                return _scan_fileobj(gzfileobj, keys)
+        fileobj.seek(0)
+        return _scan_fileobj(fileobj, keys)
+
+
+def _scan_fileobj(fileobj, keys=None):
+    keys = None if keys is None else {key.upper() for key in keys}
+    hdus = []
+    while True:
+        header_cards = _read_header_cards(fileobj)
+        if header_cards is None:
+            break
+        values, comments, structure = {}, {}, {}
+        for keyword, image in header_cards:
+            card = None
+            if keyword == 'HIERARCH':
+                card = _parse_card(image)
+                keyword = card.keyword
+            wanted = keys is None or keyword in keys
+            structural = _STRUCTURAL_KEYS.match(keyword)
+            if not (wanted or structural):
+                continue
+            if keyword in _COMMENTARY_KEYS:
+                values[keyword] = values.get(keyword, '') + image[8:].decode('ascii').rstrip()
+                continue
+            card = card or _parse_card(image)
+            value = None if isinstance(card.value, fits.card.Undefined) else card.value
+            if structural:
+                structure[keyword] = value
+            if wanted:
+                values[keyword] = value
+                if card.comment:
+                    comments[keyword] = card.comment
+        for keyword in _COMMENTARY_KEYS:
+            if keyword in values:
+                values[keyword] = values[keyword].strip()
+        hdus.append((values, comments))
+        _skip_data_unit(fileobj, structure)
+
+    return hdus
+
+
+def _parse_card(image):
+    """
+    Parse a card image, fixing it in the same way as ``verify('silentfix')``
+    if it does not follow the standard.
+    """
+    card = fits.Card.fromstring(image.decode('ascii'))
+    try:
+        card.value
+    except fits.VerifyError:
+        card.verify('silentfix')
+    return card
+
+
+def _read_header_cards(fileobj):
+    """
+    Read the blocks of one header, returning a list of ``(keyword, image)``
+    pairs, where CONTINUE cards are appended to the image of the card they
+    continue. Returns `None` at the end of the file.
+    """
+    cards = []
+    while True:
+        block = fileobj.read(_BLOCK_SIZE)
+        if len(block) < _BLOCK_SIZE:
+            if not block and not cards:
+                return None
+            raise OSError("Header is truncated")
+        for i in range(0, _BLOCK_SIZE, _CARD_SIZE):
+            image = block[i:i + _CARD_SIZE]
+            keyword = image[:8].decode('ascii').rstrip()
+            if keyword == 'END':
+                return cards
+            if keyword == 'CONTINUE' and cards:
+                cards[-1] = (cards[-1][0], cards[-1][1] + image)
+            elif keyword:
+                cards.append((keyword, image))
+
+
+def _skip_data_unit(fileobj, structure):
+    """
+    Move past the data unit described by the structural keywords of a header.
+    """
+    naxis = structure.get('NAXIS', 0)
+    if not naxis:
+        return
+    axes = [structure.get(f'NAXIS{i}', 0) for i in range(1, naxis + 1)]
+    # Random groups have NAXIS1 = 0, which does not contribute to the size
+    if structure.get('GROUPS') and axes[0] == 0:
+        axes = axes[1:]
+    nbytes = (abs(structure['BITPIX']) // 8 * structure.get('GCOUNT', 1) *
+              (structure.get('PCOUNT', 0) + int(np.prod(axes))))
+    padded = -(-nbytes // _BLOCK_SIZE) * _BLOCK_SIZE
+    fileobj.seek(padded, os.SEEK_CUR)
+
+
 def write(fname, data, header, hdu_type=None, **kwargs):
     """
     Take a data header pair and write a FITS file.
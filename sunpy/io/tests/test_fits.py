@@ -2,6 +2,7 @@ import os
 from pathlib import Path
 from collections import OrderedDict
 
+import numpy as np
 import pytest
 
 import astropy.io.fits as fits
@@ -10,7 +11,7 @@ from astropy.utils.exceptions import AstropyUserWarning
 import sunpy.data.test
 import sunpy.io.fits
 from sunpy.data.test.waveunit import MEDN_IMAGE, MQ_IMAGE, NA_IMAGE, SVSM_IMAGE
-from sunpy.io.fits import extract_waveunit, get_header, header_to_fits
+from sunpy.io.fits import extract_waveunit, get_header, header_to_fits, scan_headers
 from sunpy.util import MetaDict, SunpyUserWarning
 
 testpath = sunpy.data.test.rootdir
@@ -135,3 +136,106 @@ def test_warn_longkey():
                                'goodkey': 'test'})
     assert 'GOODKEY' in fits.keys()
     assert 'BADLONGKEY' not in fits.keys()
+
+
+@pytest.mark.parametrize('fname', [RHESSI_IMAGE, EIT_195_IMAGE, AIA_171_IMAGE, SWAP_LEVEL1_IMAGE,
+                                   os.path.join(testpath, 'mdi.fd_Ic.20101015_230100_TAI.data.fits'),
+                                   os.path.join(testpath, 'hsi_obssumm_20120601_018_truncated.fits.gz')])
+def test_read_lazy(fname):
+    pairs = sunpy.io.fits.read(fname)
+    lazy_pairs = sunpy.io.fits.read(fname, lazy=True)
+    assert len(pairs) == len(lazy_pairs)
+    for (data, header), (lazy_data, lazy_header) in zip(pairs, lazy_pairs):
+        assert header == lazy_header
+        if data is None or data.ndim < 2:
+            # Only image HDUs are deferred
+            assert lazy_data is None or isinstance(lazy_data, sunpy.io.fits.DeferredHDUData)
+            continue
+        assert isinstance(lazy_data, sunpy.io.fits.DeferredHDUData)
+        assert lazy_data.shape == data.shape
+        assert lazy_data.dtype == data.dtype
+        np.testing.assert_equal(np.asarray(lazy_data), data)
+
+
+@pytest.mark.parametrize('fname', [EIT_195_IMAGE, AIA_171_IMAGE,
+                                   os.path.join(testpath, 'iris_l2_20130801_074720_4040000014_SJI_1400_t000.fits'),
+                                   os.path.join(testpath, 'mdi.fd_Ic.20101015_230100_TAI.data.fits')])
+@pytest.mark.parametrize('item', [np.s_[10:20, 5:9], np.s_[1], np.s_[-5:, ::3], np.s_[[0, 1], 4],
+                                  np.s_[5:5]])
+def test_read_lazy_index(fname, item):
+    # The first image HDU
+    index, lazy_data = next((i, pair.data) for i, pair in enumerate(sunpy.io.fits.read(fname, lazy=True))
+                            if pair.data is not None)
+    data = sunpy.io.fits.read(fname)[index].data
+    np.testing.assert_equal(lazy_data[item], data[item])
+
+
+def test_read_lazy_verify(mocker):
+    # The lazy path reports the header fixes in the same way as the eager path
+    verify = mocker.spy(fits.HDUList, 'verify')
+    sunpy.io.fits.read(AIA_171_IMAGE, lazy=True)
+    assert verify.call_args.args[1:] == ('silentfix+warn',)
+
+
+def test_read_lazy_hdus():
+    pairs = sunpy.io.fits.read(RHESSI_IMAGE, hdus=[0], lazy=True)
+    assert len(pairs) == 1
+    assert pairs[0].data.hdu_index == 0
+    assert pairs[0].data[0, 0] == sunpy.io.fits.read(RHESSI_IMAGE)[0].data[0, 0]
+
+
+@pytest.mark.parametrize('fname', [RHESSI_IMAGE, EIT_195_IMAGE, AIA_171_IMAGE, SWAP_LEVEL1_IMAGE,
+                                   os.path.join(testpath, 'hsi_obssumm_20120601_018_truncated.fits.gz'),
+                                   os.path.join(testpath, 'iris_l2_20130801_074720_4040000014_SJI_1400_t000.fits'),
+                                   os.path.join(testpath, '20181209_180305_kcor_l1.5_rebinned.fits')])
+def test_get_header_keys(fname):
+    headers = get_header(fname)
+    keys = ['NAXIS1', 'DATE-OBS', 'WAVELNTH', 'COMMENT', 'NOTAKEY']
+    scanned = get_header(fname, keys=keys)
+    assert len(scanned) == len(headers)
+    for header, scanned_header in zip(headers, scanned):
+        for key in keys:
+            assert scanned_header.get(key) == header.get(key)
+            assert (scanned_header['KEYCOMMENTS'].get(key) ==
+                    header['KEYCOMMENTS'].get(key))
+        assert scanned_header.get('WAVEUNIT') == header.get('WAVEUNIT')
+
+
+def test_get_header_keys_hdulist():
+    with fits.open(AIA_171_IMAGE) as hdulist:
+        with pytest.raises(TypeError, match='keys can not be specified'):
+            get_header(hdulist, keys=['NAXIS1'])
+
+
+def test_scan_headers():
+    fnames = [AIA_171_IMAGE, EIT_195_IMAGE, Path(RHESSI_IMAGE)]
+    table = scan_headers(fnames, keys=['date-obs', 'EXPTIME', 'NAXIS1', 'WAVELNTH'])
+    assert table.colnames == ['path', 'DATE-OBS', 'EXPTIME', 'NAXIS1', 'WAVELNTH']
+    assert list(table['path']) == [os.fspath(f) for f in fnames]
+    for row, fname in zip(table, fnames):
+        header = get_header(fname)[0]
+        assert row['NAXIS1'] == header['NAXIS1']
+    assert table['EXPTIME'][0] == get_header(AIA_171_IMAGE)[0]['EXPTIME']
+    # RHESSI images do not have a wavelength
+    assert list(table['WAVELNTH'].mask) == [False, False, True]
+    assert table['NAXIS1'].dtype.kind == 'i'
+
+
+def test_scan_headers_all_keys_and_hdu():
+    header = get_header(RHESSI_IMAGE)[1]
+    table = scan_headers([RHESSI_IMAGE], hdu=1)
+    for key in ['XTENSION', 'TFIELDS', 'TTYPE1']:
+        assert table[key][0] == header[key]
+
+    with pytest.raises(IndexError, match='has no HDU with index 10'):
+        scan_headers([RHESSI_IMAGE], hdu=10)
+
+
+def test_scan_headers_truncated(tmpdir):
+    fname = str(tmpdir / 'truncated.fits')
+    with open(AIA_171_IMAGE, 'rb') as f:
+        header_block = f.read(1000)
+    with open(fname, 'wb') as f:
+        f.write(header_block)
+    with pytest.raises(OSError, match='Header is truncated'):
+        scan_headers([fname])
@@ -2,7 +2,10 @@ import os
 import glob
 import pathlib
 import warnings
+from functools import partial
+from contextlib import contextmanager
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from urllib.request import Request, urlopen
 
 import numpy as np
@@ -60,6 +63,24 @@ class MapFactory(BasicRegistrationFactory):
     composite : `bool`, optional
         Return a `sunpy.map.CompositeMap` object comprised of all the parsed maps.
 
+    lazy : `bool`, optional
+        Only read the headers of FITS files, and defer reading the data until
+        the ``.data`` attribute of a map is accessed.
+
+    workers : `int`, optional
+        Read files concurrently using a pool of this many threads.
+
+    executor : `concurrent.futures.Executor`, optional
+        Read files concurrently using this executor, e.g. a
+        `~concurrent.futures.ProcessPoolExecutor`. Cannot be given together
+        with ``workers``.
+
+    region : `tuple`, `~astropy.units.Quantity` or `~astropy.coordinates.SkyCoord`, optional
+        The bottom left and top right corners of a rectangle to cut out of
+        every map, in any of the forms accepted by
+        `~sunpy.map.GenericMap.submap`. Only the data inside the rectangle is
+        read from FITS files.
+
     Returns
     -------
     `sunpy.map.GenericMap`
@@ -147,6 +168,17 @@ class MapFactory(BasicRegistrationFactory):
     * Any mixture of the above not in a list
 
     >>> mymap = sunpy.map.Map(((data, header), data2, header2, 'file1.fits', url_str, 'eit_*.fits'))  # doctest: +SKIP
+
+    Large numbers of files can be read concurrently, and the data of FITS
+    files only read from disk when it is needed. The order of the returned
+    maps does not depend on the number of workers.
+
+    >>> mysequence = sunpy.map.Map('eit_*.fits', sequence=True, lazy=True, workers=8)  # doctest: +SKIP
+
+    A region can be cut out of large files without reading the rest of the
+    data from disk.
+
+    >>> cutout = sunpy.map.Map('file1.fits', region=[[1000, 1500], [1300, 1800]] * u.pix)  # doctest: +SKIP
     """
 
     def _read_file(self, fname, **kwargs):
@@ -190,7 +222,7 @@ class MapFactory(BasicRegistrationFactory):
         else:
             return False
 
-    def _parse_args(self, *args, silence_errors=False, **kwargs):
+    def _parse_args(self, *args, silence_errors=False, workers=None, executor=None, **kwargs):
         """
         Parses an args list into data-header pairs.
 
@@ -205,6 +237,10 @@ class MapFactory(BasicRegistrationFactory):
         * url, which will be downloaded and read
         * lists containing any of the above.
 
+        If ``workers`` or ``executor`` is given the arguments are parsed
+        concurrently, with each file in a directory or glob read by a separate
+        task. The pairs are always returned in the order of the arguments.
+
         Example
         -------
         self._parse_args(data, header,
@@ -240,14 +276,24 @@ class MapFactory(BasicRegistrationFactory):
         # Parse the arguments
         # Note that this list can also contain GenericMaps if they are directly given to the factory
         data_header_pairs = []
-        for arg in args:
-            try:
-                data_header_pairs += self._parse_arg(arg, **kwargs)
-            except NoMapsInFileError as e:
-                if not silence_errors:
-                    raise
-                warnings.warn(
-                    f"One of the arguments failed to parse with error: {e}", SunpyUserWarning)
+        with _get_executor(workers, executor) as pool:
+            if pool is None:
+                results = [partial(self._parse_arg, arg, **kwargs) for arg in args]
+            else:
+                # Split directories and globs into their files, so that each
+                # file is read by a separate task
+                args = [afile for arg in args for afile in
+                        (_expand_path(arg) if isinstance(arg, pathlib.Path) else [arg])]
+                results = [pool.submit(self._parse_arg, arg, **kwargs).result for arg in args]
+
+            for result in results:
+                try:
+                    data_header_pairs += result()
+                except NoMapsInFileError as e:
+                    if not silence_errors:
+                        raise
+                    warnings.warn(
+                        f"One of the arguments failed to parse with error: {e}", SunpyUserWarning)
 
         return data_header_pairs
 
@@ -289,23 +335,13 @@ class MapFactory(BasicRegistrationFactory):
 
     @_parse_arg.register(pathlib.Path)
     def _parse_path(self, arg, **kwargs):
-        path = arg.expanduser()
-        if _is_file(path):
-            return self._read_file(path, **kwargs)
-        elif _is_dir(path):
-            pairs = []
-            for afile in sorted(path.glob('*')):
-                pairs += self._read_file(afile, **kwargs)
-            return pairs
-        elif glob.glob(os.path.expanduser(arg)):
-            pairs = []
-            for afile in sorted(glob.glob(os.path.expanduser(arg))):
-                pairs += self._read_file(afile, **kwargs)
-            return pairs
-        else:
-            raise ValueError(f'Did not find any files at {arg}')
+        pairs = []
+        for afile in _expand_path(arg):
+            pairs += self._read_file(afile, **kwargs)
+        return pairs
 
-    def __call__(self, *args, composite=False, sequence=False, silence_errors=False, **kwargs):
+    def __call__(self, *args, composite=False, sequence=False, silence_errors=False,
+                 lazy=False, workers=None, executor=None, region=None, **kwargs):
         """ Method for running the factory. Takes arbitrary arguments and
         keyword arguments and passes them to a sequence of pre-registered types
         to determine which is the correct Map-type to build.
@@ -325,26 +361,44 @@ class MapFactory(BasicRegistrationFactory):
         silence_errors : `bool`, optional
             If set, ignore data-header pairs which cause an exception.
             Default is ``False``.
+        lazy : `bool`, optional
+            If set, only read the headers of FITS files and defer reading the
+            data until it is accessed. Default is ``False``.
+        workers : `int`, optional
+            If set, read files concurrently using this many threads.
+        executor : `concurrent.futures.Executor`, optional
+            If set, read files concurrently using this executor. It is not
+            shut down after use.
+        region : `tuple`, `~astropy.units.Quantity` or `~astropy.coordinates.SkyCoord`, optional
+            If set, the bottom left and top right corners of a rectangle to
+            cut out of every map. Only the data inside the rectangle is read
+            from FITS files.
 
         Notes
         -----
         Extra keyword arguments are passed through to `sunpy.io.read_file` such
         as `memmap` for FITS files.
         """
-        data_header_pairs = self._parse_args(*args, silence_errors=silence_errors, **kwargs)
+        if region is not None:
+            # Defer reading the data, so that only the region is read
+            lazy = True
+        data_header_pairs = self._parse_args(*args, silence_errors=silence_errors, lazy=lazy,
+                                             workers=workers, executor=executor, **kwargs)
         new_maps = list()
 
         # Loop over each registered type and check to see if WidgetType
         # matches the arguments.  If it does, use that type.
         for pair in data_header_pairs:
             if isinstance(pair, GenericMap):
-                new_maps.append(pair)
+                new_maps.append(pair if region is None else pair.submap(region[0], top_right=region[1]))
                 continue
             data, header = pair
             meta = MetaDict(header)
 
             try:
                 new_map = self._check_registered_widgets(data, meta, **kwargs)
+                if region is not None:
+                    new_map = new_map.submap(region[0], top_right=region[1])
                 new_maps.append(new_map)
             except (NoMatchError, MultipleMatchError,
                     ValidationFunctionError, MapMetaValidationError) as e:
@@ -398,6 +452,41 @@ class MapFactory(BasicRegistrationFactory):
         return WidgetType(data, meta, **kwargs)
 
 
+@contextmanager
+def _get_executor(workers, executor):
+    """
+    Provide the executor used to read files, or `None` to read them serially.
+
+    An executor created here from ``workers`` is shut down on exit, an
+    executor passed in by the user is not.
+    """
+    if workers is not None and executor is not None:
+        raise ValueError("Only one of workers and executor can be specified.")
+    if executor is not None:
+        yield executor
+    elif workers is not None:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            yield pool
+    else:
+        yield None
+
+
+def _expand_path(arg):
+    """
+    Expand a path, which may be a file, a directory or a glob pattern, into a
+    sorted list of files.
+    """
+    path = arg.expanduser()
+    if _is_file(path):
+        return [path]
+    elif _is_dir(path):
+        return sorted(path.glob('*'))
+    elif glob.glob(os.path.expanduser(arg)):
+        return [pathlib.Path(afile) for afile in sorted(glob.glob(os.path.expanduser(arg)))]
+    else:
+        raise ValueError(f'Did not find any files at {arg}')
+
+
 def _is_url(arg):
     try:
         urlopen(arg)
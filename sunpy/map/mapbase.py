@@ -5,12 +5,13 @@ import copy
 import html
 import numbers
 import textwrap
+import threading
 import warnings
 import webbrowser
 from io import BytesIO
 from base64 import b64encode
 from tempfile import NamedTemporaryFile
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -34,7 +35,7 @@ from sunpy import config, log
 from sunpy.coordinates import HeliographicCarrington, HeliographicStonyhurst, Helioprojective, get_earth, sun
 from sunpy.coordinates.utils import get_rectangle_coordinates
 from sunpy.image.resample import resample as sunpy_image_resample
-from sunpy.image.resample import reshape_image_to_4d_superpixel
+from sunpy.image.resample import block_reduce
 from sunpy.sun import constants
 from sunpy.time import is_time, parse_time
 from sunpy.util import MetaDict, expand_list
@@ -56,6 +57,54 @@ SpatialPair = namedtuple('SpatialPair', 'axis1 axis2')
 
 _META_FIX_URL = 'https://docs.sunpy.org/en/stable/code_ref/map.html#fixing-map-metadata'
 
+# Metadata keys which do not affect the WCS of a map. These are left out of the
+# key used to look up a map in the WCS cache, so that maps which only differ in
+# these keys can share a WCS.
+_NON_WCS_KEYS = frozenset({
+    'keycomments', 'comment', 'history', 'bitpix', 'bscale', 'bzero', 'blank',
+    'checksum', 'datasum', 'exptime', 'xposure', 'quality', 'filename',
+    'datamin', 'datamax', 'datamean', 'datamedn', 'datarms', 'dataskew',
+    'datakurt', 'datavals', 'missvals', 'totvals',
+})
+
+
+class _WCSCache:
+    """
+    A thread-safe, size-bounded, least recently used cache of map WCS objects.
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self._dict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._dict)
+
+    def get(self, key):
+        with self._lock:
+            value = self._dict.get(key)
+            if value is not None:
+                self._dict.move_to_end(key)
+            return value
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._dict[key] = value
+            self._dict.move_to_end(key)
+            while len(self._dict) > self.maxsize:
+                self._dict.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._dict.clear()
+
+
+_wcs_cache = _WCSCache()
+# Used when re-raising the warnings from building a WCS, so that the "default"
+# warnings action only shows them once, as it would for the original warnings.
+_wcs_warning_registry = {}
+
 # Manually specify the ``.meta`` docstring. This is assigned to the .meta
 # class attribute in GenericMap.__init__()
 _meta_doc = """
@@ -121,6 +170,33 @@ class MapMetaValidationError(AttributeError):
     pass
 
 
+def _superpixel_meta(meta, scale, center, dimensions, offset, new_shape):
+    """
+    The metadata for a superpixel map with the given dimensions, offset and
+    data shape, from the metadata of the original map, its scale and the
+    longitude and latitude of its center, in the units of its axes.
+    """
+    # create copy of new meta data
+    new_meta = meta.copy()
+
+    new_nx = new_shape[1]
+    new_ny = new_shape[0]
+
+    # Update metadata
+    new_meta['cdelt1'] = dimensions[0] * scale[0]
+    new_meta['cdelt2'] = dimensions[1] * scale[1]
+    if 'CD1_1' in new_meta:
+        new_meta['CD1_1'] *= dimensions[0]
+        new_meta['CD2_1'] *= dimensions[0]
+        new_meta['CD1_2'] *= dimensions[1]
+        new_meta['CD2_2'] *= dimensions[1]
+    new_meta['crpix1'] = (new_nx + 1) / 2
+    new_meta['crpix2'] = (new_ny + 1) / 2
+    new_meta['crval1'] = center[0] + 0.5 * (offset[0] * scale[0])
+    new_meta['crval2'] = center[1] + 0.5 * (offset[1] * scale[1])
+    return new_meta
+
+
 class GenericMap(NDData):
     """
     A Generic spatially-aware 2D data array
@@ -512,14 +588,71 @@ class GenericMap(NDData):
     def wcs(self):
         """
         The `~astropy.wcs.WCS` property of the map.
+
+        Notes
+        -----
+        Constructing the WCS is relatively expensive, so built WCS objects are
+        kept in a process-wide, size-bounded cache that is shared between maps
+        of the same type that have identical WCS-relevant metadata. Each map
+        gets its own copy of the cached WCS, so modifying the WCS of one map
+        does not affect any other map.
+        """
+        key = self._wcs_cache_key
+        cached = _wcs_cache.get(key) if key is not None else None
+        if cached is None:
+            # Record the warnings raised while building the WCS, so that they
+            # can also be raised for the maps which use the cached WCS.
+            with warnings.catch_warnings(record=True) as caught_warnings:
+                warnings.simplefilter("always")
+                w2 = self._make_wcs()
+            cached = (w2, tuple((w.message, w.category, w.filename, w.lineno)
+                                for w in caught_warnings))
+            if key is not None:
+                _wcs_cache[key] = cached
+
+        w2, wcs_warnings = cached
+        for message, category, filename, lineno in wcs_warnings:
+            warnings.warn_explicit(message, category, filename, lineno,
+                                   registry=_wcs_warning_registry)
+        # Each map gets a copy, so modifying it doesn't modify the cache.
+        return copy.deepcopy(w2)
+
+    @property
+    def _wcs_cache_key(self):
+        """
+        The key used to look up the WCS of this map in the WCS cache, or `None`
+        if the WCS of this map should not be cached.
+        """
+        # Without an observation time the date falls back to the time the
+        # map was first asked for it, which is specific to this map.
+        if 'date-obs' not in self.meta:
+            return None
+        try:
+            items = frozenset((key, value) for key, value in self.meta.items()
+                              if key not in _NON_WCS_KEYS and not key.startswith('datap'))
+        except TypeError:
+            # Some of the metadata values are not hashable
+            return None
+        return type(self), self._data.shape, items
+
+    def _make_wcs(self):
         """
+        Construct the `~astropy.wcs.WCS` of the map from the map metadata.
+        """
+        header = self.fits_header
+        # Drop the observer coordinate information in the header, it is set
+        # below from the observer coordinate of the map. This avoids issues
+        # with maps that store multiple observer coordinate keywords.
+        for kw in ['crln_obs', 'dsun_obs', 'hgln_obs', 'hglt_obs']:
+            header.remove(kw, ignore_missing=True, remove_all=True)
+
         # Construct the WCS based on the FITS header, but don't "do_set" which
         # analyses the FITS header for correctness.
         with warnings.catch_warnings():
             # Ignore warnings we may raise when constructing the fits header about dropped keys.
             warnings.simplefilter("ignore", SunpyUserWarning)
             try:
-                w2 = astropy.wcs.WCS(header=self.fits_header, _do_set=False)
+                w2 = astropy.wcs.WCS(header=header, _do_set=False)
             except Exception as e:
                 warnings.warn("Unable to treat `.meta` as a FITS header, assuming a simple WCS. "
                               f"The exception raised was:\n{e}")
@@ -536,6 +669,10 @@ class GenericMap(NDData):
 
             w2 = w2.sub([1, 2])
 
+        # The NAXISn keywords in the metadata may not match the data, so don't
+        # let them set the shape of the WCS.
+        w2.pixel_shape = None
+
         # Add one to go from zero-based to one-based indexing
         w2.wcs.crpix = u.Quantity(self.reference_pixel) + 1 * u.pix
         # Make these a quantity array to prevent the numpy setting element of
@@ -562,15 +699,6 @@ class GenericMap(NDData):
 
         # Set observer coordinate information
         #
-        # Clear all the aux information that was set earlier. This is to avoid
-        # issues with maps that store multiple observer coordinate keywords.
-        # Note that we have to create a new WCS as it's not possible to modify
-        # wcs.wcs.aux in place.
-        header = w2.to_header()
-        for kw in ['crln_obs', 'dsun_obs', 'hgln_obs', 'hglt_obs']:
-            header.pop(kw, None)
-        w2 = astropy.wcs.WCS(header)
-
         # Get observer coord, and transform if needed
         obs_coord = self.observer_coordinate
         if not isinstance(obs_coord.frame, (HeliographicStonyhurst, HeliographicCarrington)):
@@ -625,19 +753,32 @@ class GenericMap(NDData):
         return WCSAxes, {'wcs': self.wcs}
 
     # Some numpy extraction
+    @property
+    def data(self):
+        """
+        The map data array.
+
+        If the map was created with ``lazy=True`` the data is read from disk
+        the first time this is accessed.
+        """
+        if isinstance(self._data, io.fits.DeferredHDUData):
+            self._data = self._data.load()
+        return self._data
+
     @property
     def dimensions(self):
         """
         The dimensions of the array (x axis first, y axis second).
         """
-        return PixelPair(*u.Quantity(np.flipud(self.data.shape), 'pixel'))
+        # Use the underlying data so that deferred data is not read from disk
+        return PixelPair(*u.Quantity(np.flipud(self._data.shape), 'pixel'))
 
     @property
     def dtype(self):
         """
         The `numpy.dtype` of the array of the map.
         """
-        return self.data.dtype
+        return self._data.dtype
 
     @property
     @deprecated(since="2.1", message="Use map.data.size instead", alternative="map.data.size")
@@ -652,7 +793,7 @@ class GenericMap(NDData):
         """
         The value of `numpy.ndarray.ndim` of the data array of the map.
         """
-        return self.data.ndim
+        return self._data.ndim
 
     def std(self, *args, **kwargs):
         """
@@ -1176,9 +1317,9 @@ class GenericMap(NDData):
     def _fix_naxis(self):
         # If naxis is not specified, get it from the array shape
         if 'naxis1' not in self.meta:
-            self.meta['naxis1'] = self.data.shape[1]
+            self.meta['naxis1'] = self._data.shape[1]
         if 'naxis2' not in self.meta:
-            self.meta['naxis2'] = self.data.shape[0]
+            self.meta['naxis2'] = self._data.shape[0]
         if 'naxis' not in self.meta:
             self.meta['naxis'] = self.ndim
 
@@ -1399,6 +1540,17 @@ class GenericMap(NDData):
                                         method, center=True)
         new_data = new_data.T
 
+        new_meta = self._resample_meta(dimensions, new_data.shape)
+
+        # Create new map instance
+        new_map = self._new_instance(new_data, new_meta, self.plot_settings)
+        return new_map
+
+    def _resample_meta(self, dimensions, new_shape):
+        """
+        The metadata for this map resampled to the given dimensions and data
+        shape.
+        """
         scale_factor_x = float(self.dimensions[0] / dimensions[0])
         scale_factor_y = float(self.dimensions[1] / dimensions[1])
 
@@ -1418,12 +1570,9 @@ class GenericMap(NDData):
         lon, lat = self._get_lon_lat(self.center.frame)
         new_meta['crval1'] = lon.value
         new_meta['crval2'] = lat.value
-        new_meta['naxis1'] = new_data.shape[1]
-        new_meta['naxis2'] = new_data.shape[0]
-
-        # Create new map instance
-        new_map = self._new_instance(new_data, new_meta, self.plot_settings)
-        return new_map
+        new_meta['naxis1'] = new_shape[1]
+        new_meta['naxis2'] = new_shape[0]
+        return new_meta
 
     @u.quantity_input
     def rotate(self, angle: u.deg = None, rmatrix=None, order=4, scale=1.0,
@@ -1492,16 +1641,50 @@ class GenericMap(NDData):
         to rotation, and differences from IDL's rot().
         """
         # Put the import here to reduce sunpy.map import time
-        from sunpy.image.transform import affine_transform
+        from sunpy.image.transform import _AffineTransform
 
         if angle is not None and rmatrix is not None:
             raise ValueError("You cannot specify both an angle and a rotation matrix.")
-        elif angle is None and rmatrix is None:
-            rmatrix = self.rotation_matrix
-
         if order not in range(6):
             raise ValueError("Order must be between 0 and 5.")
 
+        rmatrix, pad, unpad, pixel_center, new_meta = self._rotate_geometry(
+            angle=angle, rmatrix=rmatrix, scale=scale, recenter=recenter, missing=missing)
+        transform = _AffineTransform((self.data.shape[1] + 2 * pad[0], self.data.shape[0] + 2 * pad[1]),
+                                     np.asarray(rmatrix),
+                                     order=order, scale=scale,
+                                     image_center=np.flipud(pixel_center),
+                                     recenter=recenter, missing=missing,
+                                     use_scipy=use_scipy)
+        new_data = self._rotate_data(self.data, transform, pad, unpad, missing)
+
+        # Create new map with the modification
+        new_map = self._new_instance(new_data, new_meta, self.plot_settings)
+
+        return new_map
+
+    def _rotate_geometry(self, angle=None, rmatrix=None, scale=1.0, recenter=False, missing=0.0):
+        """
+        Calculate how the data of this map is padded and rotated by `rotate`,
+        and the metadata of the rotated map.
+
+        Returns
+        -------
+        rmatrix : `numpy.ndarray`
+            The rotation matrix.
+        pad, unpad : `tuple`
+            The number of pixels the data is padded by before the rotation,
+            and unpadded by after the rotation, in the (x, y) directions.
+        pixel_center : `numpy.ndarray`
+            The (x, y) pixel of the padded data to rotate around.
+        new_meta : `~sunpy.util.MetaDict`
+            The metadata of the rotated map.
+        """
+        if angle is not None and rmatrix is not None:
+            raise ValueError("You cannot specify both an angle and a rotation matrix.")
+        elif angle is None and rmatrix is None:
+            rmatrix = self.rotation_matrix
+
         # The FITS-WCS transform is by definition defined around the
         # reference coordinate in the header.
         lon, lat = self._get_lon_lat(self.reference_coordinate.frame)
@@ -1516,35 +1699,34 @@ class GenericMap(NDData):
             rmatrix = np.array([[c, -s],
                                 [s, c]])
 
+        data_shape = self._data.shape
         # Calculate the shape in pixels to contain all of the image data
-        extent = np.max(np.abs(np.vstack((self.data.shape @ rmatrix,
-                                          self.data.shape @ rmatrix.T))), axis=0)
+        extent = np.max(np.abs(np.vstack((data_shape @ rmatrix,
+                                          data_shape @ rmatrix.T))), axis=0)
 
         # Calculate the needed padding or unpadding
-        diff = np.asarray(np.ceil((extent - self.data.shape) / 2), dtype=int).ravel()
+        diff = np.asarray(np.ceil((extent - data_shape) / 2), dtype=int).ravel()
         # Pad the image array
         pad_x = int(np.max((diff[1], 0)))
         pad_y = int(np.max((diff[0], 0)))
 
-        if issubclass(self.data.dtype.type, numbers.Integral) and (missing % 1 != 0):
+        if issubclass(self.dtype.type, numbers.Integral) and (missing % 1 != 0):
             warnings.warn(
                 "The specified `missing` value is not an integer, but the data "
                 "array is of integer type, so the output may be strange.",
                 SunpyUserWarning)
 
-        new_data = np.pad(self.data,
-                          ((pad_y, pad_y), (pad_x, pad_x)),
-                          mode='constant',
-                          constant_values=(missing, missing))
         new_meta['crpix1'] += pad_x
         new_meta['crpix2'] += pad_y
 
         # All of the following pixel calculations use a pixel origin of 0
-
-        pixel_array_center = (np.flipud(new_data.shape) - 1) / 2.0
+        padded_shape = (data_shape[0] + 2 * pad_y, data_shape[1] + 2 * pad_x)
+        pixel_array_center = (np.flipud(padded_shape) - 1) / 2.0
 
         # Create a temporary map so we can use it for the data to pixel calculation.
-        temp_map = self._new_instance(new_data, new_meta, self.plot_settings)
+        # Only the shape of its data is used, so don't pad the data itself here.
+        temp_map = self._new_instance(np.broadcast_to(np.zeros((), dtype=self.dtype), padded_shape),
+                                      new_meta, self.plot_settings)
 
         # Convert the axis of rotation from data coordinates to pixel coordinates
         pixel_rotation_center = u.Quantity(temp_map.world_to_pixel(self.reference_coordinate)).value
@@ -1555,14 +1737,6 @@ class GenericMap(NDData):
         else:
             pixel_center = pixel_array_center
 
-        # Apply the rotation to the image data
-        new_data = affine_transform(new_data.T,
-                                    np.asarray(rmatrix),
-                                    order=order, scale=scale,
-                                    image_center=np.flipud(pixel_center),
-                                    recenter=recenter, missing=missing,
-                                    use_scipy=use_scipy).T
-
         if recenter:
             new_reference_pixel = pixel_array_center
         else:
@@ -1580,11 +1754,9 @@ class GenericMap(NDData):
         # Unpad the array if necessary
         unpad_x = -np.min((diff[1], 0))
         if unpad_x > 0:
-            new_data = new_data[:, unpad_x:-unpad_x]
             new_meta['crpix1'] -= unpad_x
         unpad_y = -np.min((diff[0], 0))
         if unpad_y > 0:
-            new_data = new_data[unpad_y:-unpad_y, :]
             new_meta['crpix2'] -= unpad_y
 
         # Calculate the new rotation matrix to store in the header by
@@ -1611,13 +1783,32 @@ class GenericMap(NDData):
         new_meta.pop('CD2_1', None)
         new_meta.pop('CD2_2', None)
 
-        # Create new map with the modification
-        new_map = self._new_instance(new_data, new_meta, self.plot_settings)
+        return rmatrix, (pad_x, pad_y), (unpad_x, unpad_y), pixel_center, new_meta
 
-        return new_map
+    @staticmethod
+    def _rotate_data(data, transform, pad, unpad, missing):
+        """
+        Pad, rotate and unpad map data, as calculated by ``_rotate_geometry``.
+        """
+        pad_x, pad_y = pad
+        new_data = np.pad(data,
+                          ((pad_y, pad_y), (pad_x, pad_x)),
+                          mode='constant',
+                          constant_values=(missing, missing))
+
+        # Apply the rotation to the image data
+        new_data = transform(new_data.T).T
+
+        unpad_x, unpad_y = unpad
+        if unpad_x > 0:
+            new_data = new_data[:, unpad_x:-unpad_x]
+        if unpad_y > 0:
+            new_data = new_data[unpad_y:-unpad_y, :]
+        return new_data
 
     @u.quantity_input
-    def submap(self, bottom_left, *, top_right=None, width: (u.deg, u.pix) = None, height: (u.deg, u.pix) = None):
+    def submap(self, bottom_left, *, top_right=None, width: (u.deg, u.pix) = None, height: (u.deg, u.pix) = None,
+               copy=True):
         """
         Returns a submap defined by a rectangle.
 
@@ -1640,6 +1831,10 @@ class GenericMap(NDData):
             The width of the rectangle. Required if ``top_right`` is omitted.
         height : `astropy.units.Quantity`
             The height of the rectangle. Required if ``top_right`` is omitted.
+        copy : `bool`, optional
+            If `False`, the data and mask of the new map are views of those of
+            this map rather than copies, so changing the values of one changes
+            the other. Defaults to `True`.
 
         Returns
         -------
@@ -1653,6 +1848,9 @@ class GenericMap(NDData):
         order not in numpy order. So, for example, the ``bottom_left=``
         argument should be ``[left, bottom]``.
 
+        If the map was created with ``lazy=True`` and its data has not been
+        read yet, only the data of the sub-region is read from disk.
+
         Examples
         --------
         >>> import astropy.units as u
@@ -1765,14 +1963,17 @@ class GenericMap(NDData):
 
         # Clip pixel values to max of array, prevents negative
         # indexing
-        bottom = int(np.clip(bottom, 0, self.data.shape[0]))
-        top = int(np.clip(top, 0, self.data.shape[0]))
-        left = int(np.clip(left, 0, self.data.shape[1]))
-        right = int(np.clip(right, 0, self.data.shape[1]))
+        bottom = int(np.clip(bottom, 0, self._data.shape[0]))
+        top = int(np.clip(top, 0, self._data.shape[0]))
+        left = int(np.clip(left, 0, self._data.shape[1]))
+        right = int(np.clip(right, 0, self._data.shape[1]))
 
         arr_slice = np.s_[bottom:top, left:right]
-        # Get ndarray representation of submap
-        new_data = self.data[arr_slice].copy()
+        # Get ndarray representation of submap. Indexing deferred data reads
+        # only the slice from disk, into a new array.
+        new_data = self._data[arr_slice]
+        if copy and isinstance(self._data, np.ndarray):
+            new_data = new_data.copy()
 
         # Make a copy of the header with updated centering information
         new_meta = self.meta.copy()
@@ -1784,7 +1985,9 @@ class GenericMap(NDData):
 
         # Create new map instance
         if self.mask is not None:
-            new_mask = self.mask[arr_slice].copy()
+            new_mask = self.mask[arr_slice]
+            if copy:
+                new_mask = new_mask.copy()
             # Create new map with the modification
             new_map = self._new_instance(new_data, new_meta, self.plot_settings, mask=new_mask)
             return new_map
@@ -1843,7 +2046,8 @@ class GenericMap(NDData):
         return tuple(u.Quantity(self.wcs.world_to_pixel(corners), u.pix).T)
 
     @u.quantity_input
-    def superpixel(self, dimensions: u.pixel, offset: u.pixel = (0, 0)*u.pixel, func=np.sum):
+    def superpixel(self, dimensions: u.pixel, offset: u.pixel = (0, 0)*u.pixel, func=np.sum,
+                   chunk_size=None):
         """Returns a new map consisting of superpixels formed by applying
         'func' to the original map data.
 
@@ -1867,6 +2071,13 @@ class GenericMap(NDData):
             The default value of 'func' is `~numpy.sum`; using this causes
             superpixel to sum over (dimension[0], dimension[1]) pixels of the
             original map.
+            'func' can also be the name of one of the built-in reductions of
+            `sunpy.image.resample.block_reduce` (e.g., ``'sum'``, ``'mean'``,
+            ``'median'`` or ``'nanmean'``), which reduce each superpixel in a
+            single pass.
+        chunk_size : `int`, optional
+            If given, the number of rows of superpixels computed at a time.
+            This limits how much data is read at once for memory-mapped data.
 
         Returns
         -------
@@ -1877,58 +2088,20 @@ class GenericMap(NDData):
         ----------
         | `Summarizing blocks of an array using a moving window <https://mail.scipy.org/pipermail/numpy-discussion/2010-July/051760.html>`_
         """
+        dimensions, offset = self._superpixel_parameters(dimensions, offset)
 
-        # Note: because the underlying ndarray is transposed in sense when
-        #   compared to the Map, the ndarray is transposed, resampled, then
-        #   transposed back.
-        # Note: "center" defaults to True in this function because data
-        #   coordinates in a Map are at pixel centers.
-
-        if (offset.value[0] < 0) or (offset.value[1] < 0):
-            raise ValueError("Offset is strictly non-negative.")
-
-        # These are rounded by int() in reshape_image_to_4d_superpixel,
-        # so round here too for use in constructing metadata later.
-        dimensions = [int(dim) for dim in dimensions.to_value(u.pix)]
-        offset = [int(off) for off in offset.to_value(u.pix)]
-
-        # Make a copy of the original data, perform reshaping, and apply the
-        # function.
+        # The superpixels are computed from a view of the data, so there is no
+        # need to copy the data first.
         if self.mask is not None:
-            data = np.ma.array(self.data.copy(), mask=self.mask)
+            data = np.ma.array(self.data, mask=self.mask, copy=False)
         else:
-            data = self.data.copy()
-
-        reshaped = reshape_image_to_4d_superpixel(data,
-                                                  [dimensions[1], dimensions[0]],
-                                                  [offset[1], offset[0]])
-        new_array = func(func(reshaped, axis=3), axis=1)
-
-        # Update image scale and number of pixels
-
-        # create copy of new meta data
-        new_meta = self.meta.copy()
-
-        new_nx = new_array.shape[1]
-        new_ny = new_array.shape[0]
-
-        scale = [self.scale[i].to_value(self.spatial_units[i] / u.pix) for i in range(2)]
+            data = self.data
 
-        # Update metadata
-        new_meta['cdelt1'] = dimensions[0] * scale[0]
-        new_meta['cdelt2'] = dimensions[1] * scale[1]
-        if 'CD1_1' in new_meta:
-            new_meta['CD1_1'] *= dimensions[0]
-            new_meta['CD2_1'] *= dimensions[0]
-            new_meta['CD1_2'] *= dimensions[1]
-            new_meta['CD2_2'] *= dimensions[1]
-        new_meta['crpix1'] = (new_nx + 1) / 2
-        new_meta['crpix2'] = (new_ny + 1) / 2
-        lon, lat = self._get_lon_lat(self.center.frame)
-        new_meta['crval1'] = lon.to_value(self.spatial_units[0]) + 0.5 * \
-            (offset[0] * scale[0])
-        new_meta['crval2'] = lat.to_value(self.spatial_units[1]) + 0.5 * \
-            (offset[1] * scale[1])
+        new_array = block_reduce(data,
+                                 [dimensions[1], dimensions[0]],
+                                 [offset[1], offset[0]],
+                                 func=func, chunk_size=chunk_size)
+        new_meta = self._superpixel_meta(dimensions, offset, new_array.shape)
 
         # Create new map instance
         if self.mask is not None:
@@ -1942,6 +2115,30 @@ class GenericMap(NDData):
         new_map = self._new_instance(new_data, new_meta, self.plot_settings, mask=new_mask)
         return new_map
 
+    @staticmethod
+    def _superpixel_parameters(dimensions, offset):
+        """
+        Validate the superpixel dimensions and offset, and round them to
+        integer numbers of pixels.
+        """
+        if (offset.value[0] < 0) or (offset.value[1] < 0):
+            raise ValueError("Offset is strictly non-negative.")
+
+        dimensions = [int(dim) for dim in dimensions.to_value(u.pix)]
+        offset = [int(off) for off in offset.to_value(u.pix)]
+        return dimensions, offset
+
+    def _superpixel_meta(self, dimensions, offset, new_shape):
+        """
+        The metadata for a superpixel map of this map with the given
+        dimensions, offset and data shape.
+        """
+        scale = [self.scale[i].to_value(self.spatial_units[i] / u.pix) for i in range(2)]
+        lon, lat = self._get_lon_lat(self.center.frame)
+        return _superpixel_meta(self.meta, scale,
+                                (lon.to_value(self.spatial_units[0]), lat.to_value(self.spatial_units[1])),
+                                dimensions, offset, new_shape)
+
 # #### Visualization #### #
 
     @property
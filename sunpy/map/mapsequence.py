@@ -6,15 +6,22 @@ import warnings
 import webbrowser
 from copy import deepcopy
 from tempfile import NamedTemporaryFile
+from collections.abc import Sequence
 
 import matplotlib.animation
 import numpy as np
 import numpy.ma as ma
 
 import astropy.units as u
+import astropy.wcs
+from astropy.coordinates import UnitSphericalRepresentation
 
+from sunpy.image.resample import _Resampler, block_reduce
+from sunpy.image.transform import _AffineTransform
+from sunpy.io.fits import header_to_fits
 from sunpy.map import GenericMap
-from sunpy.util import SunpyUserWarning, expand_list
+from sunpy.map.mapbase import _superpixel_meta
+from sunpy.util import MetaDict, SunpyUserWarning, expand_list
 from sunpy.visualization import axis_labels_from_ctype, wcsaxes_compat
 from sunpy.visualization.animator.mapsequenceanimator import MapSequenceAnimator
 
@@ -42,17 +49,31 @@ class MapSequence:
     ----------
     maps : `list`
         This attribute holds the list of Map instances obtained from parameter args.
+        For a sequence stored as a data cube (see `MapSequence.from_cube`)
+        this is a read-only sequence which creates the maps when they are
+        accessed.
 
     Notes
     -----
     To coalign a mapsequence so that solar features remain on the same pixels,
     please see the "Coalignment of MapSequences" note below.
 
+    A sequence of maps which all have the same shape can instead be stored as
+    a single data cube, optionally memory mapped to a file, using
+    `MapSequence.as_cube` or `MapSequence.from_cube`. The maps of such a
+    sequence are views into the cube, which are only created when they are
+    accessed, and `MapSequence.as_array` returns a view of the cube rather
+    than a copy.
+
     Examples
     --------
     >>> import sunpy.map
     >>> mapsequence = sunpy.map.Map('images/*.fits', sequence=True)   # doctest: +SKIP
 
+    Store the sequence in a memory mapped data cube
+
+    >>> cube_sequence = mapsequence.as_cube('images.npy')   # doctest: +SKIP
+
     MapSequences can be co-aligned using the routines in sunpy.image.coalignment.
     """
 
@@ -75,11 +96,104 @@ class MapSequence:
         if derotate:
             self._derotate()
 
+    @classmethod
+    def from_cube(cls, data, meta, mask=None, plot_settings=None):
+        """
+        Create a MapSequence whose maps are stored in a single data cube.
+
+        The data is not copied, so ``data`` can be a `numpy.memmap` to keep
+        the frames on disk. Each map of the sequence is created from a view of
+        its frame the first time it is accessed.
+
+        Parameters
+        ----------
+        data : `numpy.ndarray`
+            A (nt, ny, nx) array, with one frame per map along the first axis.
+        meta : `list`
+            The nt headers of the maps.
+        mask : `numpy.ndarray`, optional
+            A (nt, ny, nx) boolean mask for the data.
+        plot_settings : `dict` or `list` of `dict`, optional
+            The plot settings for all maps, or for each map.
+
+        Returns
+        -------
+        `sunpy.map.MapSequence`
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from sunpy.map import MapSequence
+        >>> cube = np.load('images.npy', mmap_mode='r')  # doctest: +SKIP
+        >>> sequence = MapSequence.from_cube(cube, headers)  # doctest: +SKIP
+        """
+        if np.ndim(data) != 3:
+            raise ValueError("data must be a (nt, ny, nx) array.")
+        if len(meta) != data.shape[0]:
+            raise ValueError("There must be one header for each frame of the data.")
+        if mask is not None and np.shape(mask) != data.shape:
+            raise ValueError("mask must have the same shape as data.")
+        sequence = cls()
+        sequence.maps = _CubeMaps(data, list(meta), mask=mask, plot_settings=plot_settings)
+        return sequence
+
+    def as_cube(self, filename=None):
+        """
+        Return a copy of this MapSequence with the maps stored in a single
+        data cube.
+
+        The maps are copied into the cube one at a time, so that the peak
+        memory use is the size of the cube plus one map. If a filename is
+        given the cube is memory mapped to that file, so that only one map is
+        held in memory at a time.
+
+        Parameters
+        ----------
+        filename : `str` or `pathlib.Path`, optional
+            If given, the cube is saved to this ``.npy`` file and memory mapped.
+            It can be opened again with ``numpy.load(filename, mmap_mode='r')``.
+
+        Returns
+        -------
+        `sunpy.map.MapSequence`
+            A sequence backed by a (nt, ny, nx) cube. See `MapSequence.from_cube`.
+        """
+        if not self.all_maps_same_shape():
+            raise ValueError('Not all maps have the same shape.')
+
+        first = self.maps[0]
+        shape = (len(self),) + tuple(int(n.value) for n in first.dimensions[::-1])
+        dtype = np.result_type(*[m.dtype for m in self.maps])
+        if filename is None:
+            data = np.empty(shape, dtype=dtype)
+        else:
+            data = np.lib.format.open_memmap(filename, mode='w+', dtype=dtype, shape=shape)
+        mask = np.zeros(shape, dtype=bool) if self.at_least_one_map_has_mask() else None
+
+        for i, m in enumerate(self.maps):
+            # Use the underlying data so that the data of lazily loaded maps is
+            # not kept in memory after it is copied
+            data[i] = m._data
+            if mask is not None and m.mask is not None:
+                mask[i] = m.mask
+
+        sequence = MapSequence()
+        sequence.maps = _CubeMaps(data, [m.meta for m in self.maps], mask=mask,
+                                  plot_settings=[m.plot_settings for m in self.maps],
+                                  map_types=[type(m) for m in self.maps])
+        return sequence
+
     def __getitem__(self, key):
         """Overriding indexing operation.  If the key results in a single map,
         then a map object is returned.  This allows functions like enumerate to
         work.  Otherwise, a mapsequence is returned."""
 
+        if isinstance(self.maps, _CubeMaps) and isinstance(key, slice):
+            # Keep the new sequence backed by (a view of) the same cube
+            sequence = MapSequence()
+            sequence.maps = self.maps[key]
+            return sequence
+
         if isinstance(self.maps[key], GenericMap):
             return self.maps[key]
         else:
@@ -472,12 +586,16 @@ class MapSequence:
         Tests if all the maps have the same number pixels in the x and y
         directions.
         """
-        return np.all([m.data.shape == self.maps[0].data.shape for m in self.maps])
+        if isinstance(self.maps, _CubeMaps):
+            return True
+        return np.all([m.dimensions == self.maps[0].dimensions for m in self.maps])
 
     def at_least_one_map_has_mask(self):
         """
         Tests if at least one map has a mask.
         """
+        if isinstance(self.maps, _CubeMaps):
+            return self.maps.mask is not None
         return np.any([m.mask is not None for m in self.maps])
 
     def as_array(self):
@@ -491,7 +609,16 @@ class MapSequence:
         with masks copied from maps as appropriately; maps that do not have a
         mask are supplied with a mask that is full of False entries.
         If all the map shapes are not the same, a ValueError is thrown.
+
+        For a sequence stored as a data cube, the returned array is a view of
+        the cube rather than a copy.
         """
+        if isinstance(self.maps, _CubeMaps):
+            data = np.moveaxis(self.maps.data, 0, -1)
+            if self.maps.mask is not None:
+                return ma.masked_array(data, mask=np.moveaxis(self.maps.mask, 0, -1))
+            return data
+
         if self.all_maps_same_shape():
             data = np.swapaxes(np.swapaxes(np.asarray(
                 [m.data for m in self.maps]), 0, 1).copy(), 1, 2).copy()
@@ -509,9 +636,178 @@ class MapSequence:
     def all_meta(self):
         """
         Return all the meta objects as a list.
+
+        For a sequence stored as a data cube, the metadata of the maps which
+        have not been accessed yet is taken from their headers, without
+        creating the maps.
         """
+        if isinstance(self.maps, _CubeMaps):
+            return self.maps.all_meta()
         return [m.meta for m in self.maps]
 
+    @u.quantity_input
+    def resample(self, dimensions: u.pixel, method='linear', workers=None, executor=None):
+        """
+        Returns a new sequence with every map resampled to new dimension
+        sizes, see `sunpy.map.GenericMap.resample` for a description of the
+        parameters.
+
+        The interpolation grid is only calculated once for maps with the same
+        shape, and the maps can be resampled concurrently.
+
+        Parameters
+        ----------
+        dimensions : `~astropy.units.Quantity`
+            Output pixel dimensions.
+        method : `str`, optional
+            Method to use for resampling interpolation.
+        workers : `int`, optional
+            If set, resample the maps concurrently using a thread pool with
+            this many threads.
+        executor : `concurrent.futures.Executor`, optional
+            If set, resample the maps concurrently using this executor. It is
+            not shut down afterwards. Can not be used with ``workers``.
+
+        Returns
+        -------
+        `sunpy.map.MapSequence`
+        """
+        # Import here to avoid a circular import
+        from sunpy.map.map_factory import _get_executor
+
+        resamplers = {}
+        jobs = []
+        for m in self.maps:
+            # The data is resampled transposed, as GenericMap.resample does
+            shape = m._data.shape[::-1]
+            if shape not in resamplers:
+                resamplers[shape] = _Resampler(shape, dimensions, method, center=True)
+            jobs.append((m, resamplers[shape]))
+
+        def resample_map(job):
+            m, resampler = job
+            new_data = resampler(m.data.T).T
+            return m._new_instance(new_data, m._resample_meta(dimensions, new_data.shape),
+                                   m.plot_settings)
+
+        with _get_executor(workers, executor) as pool:
+            new_maps = list(map(resample_map, jobs) if pool is None else pool.map(resample_map, jobs))
+        return MapSequence(new_maps, sortby=None)
+
+    @u.quantity_input
+    def rotate(self, angle: u.deg = None, rmatrix=None, order=4, scale=1.0,
+               recenter=False, missing=0.0, use_scipy=False, workers=None, executor=None):
+        """
+        Returns a new sequence with every map rotated and rescaled, see
+        `sunpy.map.GenericMap.rotate` for a description of the parameters.
+
+        The transformation is only calculated once for maps with the same
+        geometry, that is the same shape, rotation and center of rotation, and
+        the maps can be rotated concurrently.
+
+        Parameters
+        ----------
+        angle : `~astropy.units.Quantity`, optional
+            The angle (degrees) to rotate counterclockwise.
+        rmatrix : array-like, optional
+            2x2 linear transformation rotation matrix.
+        order : `int`, optional
+            Interpolation order to be used. Must be in the range 0-5.
+        scale : `float`, optional
+            A scale factor for the images.
+        recenter : `bool`, optional
+            If True, position the axis of rotation at the center of the new maps.
+        missing : `float`, optional
+            The numerical value to fill any missing points after rotation.
+        use_scipy : `bool`, optional
+            If True, forces the rotation to use
+            :func:`scipy.ndimage.affine_transform`.
+        workers : `int`, optional
+            If set, rotate the maps concurrently using a thread pool with this
+            many threads.
+        executor : `concurrent.futures.Executor`, optional
+            If set, rotate the maps concurrently using this executor. It is not
+            shut down afterwards. Can not be used with ``workers``.
+
+        Returns
+        -------
+        `sunpy.map.MapSequence`
+        """
+        # Import here to avoid a circular import
+        from sunpy.map.map_factory import _get_executor
+
+        if angle is not None and rmatrix is not None:
+            raise ValueError("You cannot specify both an angle and a rotation matrix.")
+        if order not in range(6):
+            raise ValueError("Order must be between 0 and 5.")
+
+        transforms = {}
+        jobs = []
+        for m in self.maps:
+            map_rmatrix, pad, unpad, pixel_center, new_meta = m._rotate_geometry(
+                angle=angle, rmatrix=rmatrix, scale=scale, recenter=recenter, missing=missing)
+            shape = (m._data.shape[1] + 2 * pad[0], m._data.shape[0] + 2 * pad[1])
+            key = (shape, tuple(np.ravel(map_rmatrix)), tuple(pixel_center))
+            if key not in transforms:
+                transforms[key] = _AffineTransform(shape, np.asarray(map_rmatrix),
+                                                   order=order, scale=scale,
+                                                   image_center=np.flipud(pixel_center),
+                                                   recenter=recenter, missing=missing,
+                                                   use_scipy=use_scipy)
+            jobs.append((m, transforms[key], pad, unpad, new_meta))
+
+        def rotate_map(job):
+            m, transform, pad, unpad, new_meta = job
+            new_data = m._rotate_data(m.data, transform, pad, unpad, missing)
+            return m._new_instance(new_data, new_meta, m.plot_settings)
+
+        with _get_executor(workers, executor) as pool:
+            new_maps = list(map(rotate_map, jobs) if pool is None else pool.map(rotate_map, jobs))
+        return MapSequence(new_maps, sortby=None)
+
+    @u.quantity_input
+    def superpixel(self, dimensions: u.pixel, offset: u.pixel = (0, 0)*u.pixel, func=np.sum,
+                   chunk_size=None):
+        """
+        Returns a new sequence of superpixel maps, see
+        `sunpy.map.GenericMap.superpixel` for a description of the parameters.
+
+        For a sequence stored as a data cube, the superpixels of all the
+        frames are computed in one call, from the cube and the headers of the
+        frames without creating their maps, and the new sequence is also
+        stored as a data cube.
+
+        Returns
+        -------
+        `sunpy.map.MapSequence`
+        """
+        if not isinstance(self.maps, _CubeMaps):
+            return MapSequence([m.superpixel(dimensions, offset=offset, func=func,
+                                             chunk_size=chunk_size) for m in self.maps],
+                               sortby=None)
+
+        dimensions, offset = GenericMap._superpixel_parameters(dimensions, offset)
+        data = self.maps.data
+        if self.maps.mask is not None:
+            data = ma.array(data, mask=self.maps.mask, copy=False)
+        new_cube = block_reduce(data,
+                                [dimensions[1], dimensions[0]],
+                                [offset[1], offset[0]],
+                                func=func, chunk_size=chunk_size)
+        new_meta = []
+        for meta in self.maps.all_meta():
+            scale = [meta.get('cdelt1', 1.), meta.get('cdelt2', 1.)]
+            center = _frame_center(meta, data.shape[1:])
+            new_meta.append(_superpixel_meta(meta, scale, center, dimensions, offset,
+                                             new_cube.shape[1:]))
+
+        sequence = MapSequence()
+        sequence.maps = _CubeMaps(ma.getdata(new_cube), new_meta,
+                                  mask=None if self.maps.mask is None else ma.getmaskarray(new_cube),
+                                  plot_settings=self.maps.all_plot_settings(),
+                                  map_types=self.maps.all_map_types())
+        return sequence
+
     def save(self, filepath, filetype='auto', **kwargs):
         """
         Saves the sequence, with one file per map.
@@ -545,3 +841,96 @@ class MapSequence:
 
         for index, map_seq in enumerate(self.maps):
             map_seq.save(filepath.format(index=index), filetype, **kwargs)
+
+
+def _frame_center(meta, shape):
+    """
+    The longitude and latitude, in the units of its axes, of the center of a
+    frame of a data cube, found from the WCS of its header without creating
+    a map.
+    """
+    with warnings.catch_warnings():
+        # The header may have keys which can not be written to a FITS header
+        warnings.simplefilter("ignore", SunpyUserWarning)
+        wcs = astropy.wcs.WCS(header_to_fits(meta))
+    center = wcs.celestial.pixel_to_world((shape[1] - 1) / 2, (shape[0] - 1) / 2)
+    r = center.frame.represent_as(UnitSphericalRepresentation)
+    return (r.lon.to_value(meta['cunit1']), r.lat.to_value(meta['cunit2']))
+
+
+class _CubeMaps(Sequence):
+    """
+    The maps of a MapSequence stored as a (nt, ny, nx) data cube.
+
+    Each map is created from a view of its frame of the cube the first time
+    it is accessed, and then kept so that changes to it persist.
+    """
+
+    def __init__(self, data, meta, mask=None, plot_settings=None, map_types=None, frames=None):
+        self.data = data
+        self.meta = meta
+        self.mask = mask
+        if plot_settings is None or isinstance(plot_settings, dict):
+            plot_settings = [plot_settings] * len(meta)
+        self.plot_settings = plot_settings
+        self._map_types = map_types
+        self._frames = frames if frames is not None else [None] * len(meta)
+
+    def __len__(self):
+        return len(self.meta)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return _CubeMaps(self.data[key], self.meta[key],
+                             mask=None if self.mask is None else self.mask[key],
+                             plot_settings=self.plot_settings[key],
+                             map_types=None if self._map_types is None else self._map_types[key],
+                             frames=self._frames[key])
+
+        index = range(len(self))[key]
+        if self._frames[index] is None:
+            self._frames[index] = self._make_map(index)
+        return self._frames[index]
+
+    def all_meta(self):
+        """
+        The metadata of the maps which have been created, and the headers, as
+        `~sunpy.util.MetaDict`, of the others.
+        """
+        for index, meta in enumerate(self.meta):
+            if not isinstance(meta, MetaDict):
+                self.meta[index] = MetaDict(meta)
+        return [meta if frame is None else frame.meta
+                for frame, meta in zip(self._frames, self.meta)]
+
+    def all_plot_settings(self):
+        """
+        The plot settings of the maps which have been created, and the stored
+        plot settings of the others.
+        """
+        return [settings if frame is None else frame.plot_settings
+                for frame, settings in zip(self._frames, self.plot_settings)]
+
+    def all_map_types(self):
+        """
+        The types of the maps which have been created, and the stored types,
+        if there are any, of the others.
+        """
+        map_types = self._map_types or [None] * len(self)
+        return [map_type if frame is None else type(frame)
+                for frame, map_type in zip(self._frames, map_types)]
+
+    def _make_map(self, index):
+        kwargs = {}
+        if self.mask is not None:
+            kwargs['mask'] = self.mask[index]
+        if self._map_types is not None and self._map_types[index] is not None:
+            return self._map_types[index](self.data[index], self.meta[index],
+                                          plot_settings=self.plot_settings[index], **kwargs)
+
+        # Import here to avoid a circular import
+        from sunpy.map.map_factory import Map
+        new_map = Map(self.data[index], self.meta[index], **kwargs)
+        if self.plot_settings[index]:
+            new_map.plot_settings.update(self.plot_settings[index])
+        return new_map
@@ -1,7 +1,9 @@
 """
 This submodule provides utility functions to act on `sunpy.map.GenericMap` instances.
 """
+import threading
 from itertools import product
+from collections import OrderedDict
 
 import numpy as np
 
@@ -18,6 +20,99 @@ __all__ = ['all_pixel_indices_from_map', 'all_coordinates_from_map',
            'on_disk_bounding_coordinates',
            'contains_coordinate', 'contains_solar_center']
 
+# The maximum total number of coordinates held in the coordinate grid cache
+_GRID_CACHE_SIZE = 2**24
+# The approximate number of pixels along each axis of the coarse grids used to
+# narrow down the region of a map that is evaluated at full resolution
+_COARSE_GRID_PIXELS = 128
+
+
+class _CoordinateGridCache:
+    """
+    A thread-safe, least recently used cache of map coordinate grids, which is
+    bounded by the total number of coordinates it holds.
+    """
+
+    def __init__(self, maxsize=_GRID_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._dict = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._dict)
+
+    def get(self, key):
+        with self._lock:
+            value = self._dict.get(key)
+            if value is not None:
+                self._dict.move_to_end(key)
+            return value
+
+    def __setitem__(self, key, value):
+        if value.size > self.maxsize:
+            return
+        with self._lock:
+            old_value = self._dict.pop(key, None)
+            if old_value is not None:
+                self._size -= old_value.size
+            self._dict[key] = value
+            self._size += value.size
+            while self._size > self.maxsize:
+                _, old_value = self._dict.popitem(last=False)
+                self._size -= old_value.size
+
+    def clear(self):
+        with self._lock:
+            self._dict.clear()
+            self._size = 0
+
+
+_grid_cache = _CoordinateGridCache()
+
+
+def _coordinate_grid(smap, step=1, edges=False):
+    """
+    Returns the coordinates of the centers of the pixels of a map.
+
+    The coordinates are cached, and shared between maps with the same WCS and
+    shape, so they must not be modified.
+
+    Parameters
+    ----------
+    smap : `~sunpy.map.GenericMap`
+        A SunPy map.
+    step : `int`, optional
+        Only return the coordinates of every ``step``-th pixel along each axis.
+    edges : `bool`, optional
+        If `True`, only return the coordinates of the pixels at the edges of
+        the map, in the order given by `map_edges`.
+
+    Returns
+    -------
+    `~astropy.coordinates.SkyCoord`
+    """
+    key = smap._wcs_cache_key
+    if key is not None:
+        key = (key, step, edges)
+        coordinates = _grid_cache.get(key)
+        if coordinates is not None:
+            return coordinates
+
+    if edges:
+        # We need to strip the units from edges before handing it to np.concatenate,
+        # as the .unit attribute is not propagated in np.concatenate for numpy<1.17
+        # When sunpy depends on numpy>=1.17 this unit replacing code can be removed
+        edge_pixels = u.Quantity(np.concatenate(map_edges(smap)).value, unit=u.pix, copy=False)
+        coordinates = smap.pixel_to_world(edge_pixels[:, 0], edge_pixels[:, 1])
+    else:
+        x, y = np.meshgrid(*[np.arange(0, v.value, step) for v in smap.dimensions]) * u.pix
+        coordinates = smap.pixel_to_world(x, y)
+
+    if key is not None:
+        _grid_cache[key] = coordinates
+    return coordinates
+
 
 def all_pixel_indices_from_map(smap):
     """
@@ -51,9 +146,14 @@ def all_coordinates_from_map(smap):
     `~astropy.coordinates.SkyCoord`
         An two-dimensional array of sky coordinates in the coordinate
         system "coordinate_system".
+
+    Notes
+    -----
+    The coordinates are cached, so that the coordinates of maps with the same
+    WCS and shape are only calculated once.
     """
-    x, y = all_pixel_indices_from_map(smap)
-    return smap.pixel_to_world(x, y)
+    # Copy the cached coordinates, so that they can be modified
+    return _coordinate_grid(smap).copy()
 
 
 def all_corner_coords_from_map(smap):
@@ -154,14 +254,8 @@ def sample_at_coords(smap, coordinates):
 
 
 def _edge_coordinates(smap):
-    # Calculate all the edge pixels
-    edges = map_edges(smap)
-    # We need to strip the units from edges before handing it to np.concatenate,
-    # as the .unit attribute is not propagated in np.concatenate for numpy<1.17
-    # When sunpy depends on numpy>=1.17 this unit replacing code can be removed
-    edge_pixels = u.Quantity(np.concatenate(edges).value, unit=u.pix, copy=False)
     # Calculate the edge of the world
-    return smap.pixel_to_world(edge_pixels[:, 0], edge_pixels[:, 1])
+    return _coordinate_grid(smap, edges=True)
 
 
 def contains_full_disk(smap):
@@ -367,12 +461,7 @@ def on_disk_bounding_coordinates(smap):
     if is_all_off_disk(smap):
         raise ValueError("The entire map is off disk.")
 
-    # Get all the coordinates from the input map
-    coordinates = all_coordinates_from_map(smap)
-
-    # Find which coordinates are on the disk
-    on_disk = coordinate_is_on_solar_disk(coordinates)
-    on_disk_coordinates = coordinates[on_disk]
+    on_disk_coordinates = _on_disk_coordinates(smap)
 
     # The bottom left and top right coordinates that contain
     # the on disk coordinates.
@@ -383,6 +472,56 @@ def on_disk_bounding_coordinates(smap):
                     frame=smap.coordinate_frame)
 
 
+def _on_disk_coordinates(smap):
+    """
+    Returns the coordinates of all the on disk pixels of a map.
+
+    These are cached in the same way as the coordinate grids.
+    """
+    key = smap._wcs_cache_key
+    if key is not None:
+        key = (key, 'on_disk')
+        coordinates = _grid_cache.get(key)
+        if coordinates is not None:
+            return coordinates
+
+    coordinates = _find_on_disk_coordinates(smap)
+    if key is not None:
+        _grid_cache[key] = coordinates
+    return coordinates
+
+
+def _find_on_disk_coordinates(smap):
+    """
+    Find the coordinates of all the on disk pixels of a map.
+
+    The on disk pixels are first found on a coarse grid, and then only the
+    region around them is evaluated at full resolution.
+    """
+    step = max(1, int(max(smap.dimensions).value) // _COARSE_GRID_PIXELS)
+    if step > 1:
+        coarse_on_disk = coordinate_is_on_solar_disk(_coordinate_grid(smap, step=step))
+        if np.any(coarse_on_disk):
+            ny, nx = smap.data.shape
+            iy, ix = np.nonzero(coarse_on_disk)
+            # Pad the region by two coarse pixels in each direction, which
+            # contains all of the on disk pixels unless they form a sliver
+            # which is too thin for the coarse grid.
+            x0, x1 = max(0, (ix.min() - 2) * step), min(nx, (ix.max() + 2) * step + 1)
+            y0, y1 = max(0, (iy.min() - 2) * step), min(ny, (iy.max() + 2) * step + 1)
+            x, y = np.meshgrid(np.arange(x0, x1), np.arange(y0, y1)) * u.pix
+            coordinates = smap.pixel_to_world(x, y)
+            on_disk = coordinate_is_on_solar_disk(coordinates)
+            # The on disk pixels are connected, so if none of them are on a
+            # side of the region inside the map, there are none outside it.
+            if not ((x0 > 0 and on_disk[:, 0].any()) or (x1 < nx and on_disk[:, -1].any()) or
+                    (y0 > 0 and on_disk[0].any()) or (y1 < ny and on_disk[-1].any())):
+                return coordinates[on_disk]
+
+    coordinates = _coordinate_grid(smap)
+    return coordinates[coordinate_is_on_solar_disk(coordinates)]
+
+
 def contains_coordinate(smap, coordinates):
     """
     Checks whether a coordinate falls within the bounds of a map.
@@ -10,6 +10,8 @@ import tempfile
 import numpy as np
 import pytest
 
+import astropy.units as u
+from astropy.coordinates import SkyCoord
 from astropy.io import fits
 from astropy.wcs import WCS
 
@@ -282,3 +284,93 @@ def test_no_2d_hdus(tmpdir):
 
     with pytest.warns(SunpyUserWarning, match='One of the arguments failed to parse'):
         sunpy.map.Map([tmp_fpath, AIA_171_IMAGE], silence_errors=True)
+
+
+@pytest.mark.filterwarnings("ignore:Invalid 'BLANK' keyword in header")
+def test_lazy_maps():
+    eager = sunpy.map.Map(filepath / "EIT")
+    lazy = sunpy.map.Map(filepath / "EIT", lazy=True)
+    for emap, lmap in zip(eager, lazy):
+        assert type(lmap) is type(emap)
+        assert isinstance(lmap._data, sunpy.io.fits.DeferredHDUData)
+        assert lmap.dimensions == emap.dimensions
+        assert lmap.dtype == emap.dtype
+        assert lmap.date == emap.date
+        # Accessing the data reads it from disk
+        np.testing.assert_equal(lmap.data, emap.data)
+        assert isinstance(lmap._data, np.ndarray)
+
+
+@pytest.mark.filterwarnings("ignore:Invalid 'BLANK' keyword in header")
+def test_lazy_submap():
+    eager = sunpy.map.Map(AIA_171_IMAGE)
+    lazy = sunpy.map.Map(AIA_171_IMAGE, lazy=True)
+    submap = lazy.submap([10, 20] * u.pix, top_right=[30, 25] * u.pix)
+    # Only the data of the submap is read
+    assert isinstance(lazy._data, sunpy.io.fits.DeferredHDUData)
+    assert submap.data.shape == (6, 21)
+    np.testing.assert_equal(submap.data, eager.submap([10, 20] * u.pix, top_right=[30, 25] * u.pix).data)
+
+
+@pytest.mark.filterwarnings("ignore:Invalid 'BLANK' keyword in header")
+@pytest.mark.parametrize('region', [
+    [[10, 20], [30, 25]] * u.pix,
+    ([10, 20] * u.pix, [30, 25] * u.pix),
+    'world',
+])
+def test_map_region(region):
+    eager = sunpy.map.Map(AIA_171_IMAGE)
+    if region == 'world':
+        region = SkyCoord([-300, 200] * u.arcsec, [-100, 300] * u.arcsec, frame=eager.coordinate_frame)
+    expected = eager.submap(region[0], top_right=region[1])
+
+    cutout = sunpy.map.Map(AIA_171_IMAGE, region=region)
+    assert type(cutout) is type(expected)
+    assert isinstance(cutout._data, np.ndarray)
+    assert cutout.meta == expected.meta
+    np.testing.assert_equal(cutout.data, expected.data)
+
+    cutouts = sunpy.map.Map([AIA_171_IMAGE, eager], region=region, sequence=True)
+    for cutout in cutouts:
+        np.testing.assert_equal(cutout.data, expected.data)
+
+
+@pytest.mark.filterwarnings("ignore:Invalid 'BLANK' keyword in header")
+@pytest.mark.parametrize('lazy', [False, True])
+def test_parallel_maps(lazy):
+    inputs = [filepath / "EIT", AIA_171_IMAGE, filepath / "EIT" / "*"]
+    serial = sunpy.map.Map(inputs)
+    parallel = sunpy.map.Map(inputs, workers=4, lazy=lazy)
+    assert len(serial) == len(parallel)
+    for smap, pmap in zip(serial, parallel):
+        assert type(pmap) is type(smap)
+        assert pmap.date == smap.date
+        np.testing.assert_equal(pmap.data, smap.data)
+
+
+@pytest.mark.filterwarnings("ignore:Invalid 'BLANK' keyword in header")
+def test_parallel_maps_executor():
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        sequence = sunpy.map.Map(a_list_of_many, sequence=True, executor=executor)
+        # The executor is not shut down by the factory
+        assert executor.submit(len, a_list_of_many).result() == len(a_list_of_many)
+    assert isinstance(sequence, sunpy.map.MapSequence)
+    assert len(sequence) == len(a_list_of_many)
+
+    with pytest.raises(ValueError, match='Only one of workers and executor'):
+        sunpy.map.Map(a_fname, workers=2, executor=executor)
+
+
+def test_parallel_no_2d_hdus(tmpdir):
+    tmp_fpath = str(tmpdir / 'data.fits')
+    with fits.open(AIA_171_IMAGE, ignore_blank=True) as hdul:
+        fits.writeto(tmp_fpath, np.arange(100), hdul[0].header)
+
+    with pytest.raises(NoMapsInFileError, match='Found no HDUs with >= 2D data'):
+        sunpy.map.Map([AIA_171_IMAGE, tmp_fpath], workers=2)
+
+    with pytest.warns(SunpyUserWarning, match='One of the arguments failed to parse'):
+        amap = sunpy.map.Map([tmp_fpath, AIA_171_IMAGE], workers=2, lazy=True, silence_errors=True)
+    assert isinstance(amap, sunpy.map.sources.AIAMap)
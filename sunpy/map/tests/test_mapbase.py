@@ -84,6 +84,52 @@ def test_wcs_cache(aia171_test_map):
     assert new_wcs.wcs.crpix[0] == new_crpix
 
 
+def test_wcs_shared_cache(aia171_test_map):
+    sunpy.map.mapbase._wcs_cache.clear()
+    wcs1 = aia171_test_map.wcs
+    assert len(sunpy.map.mapbase._wcs_cache) == 1
+
+    # A map with the same WCS-relevant metadata uses the cached WCS
+    meta = aia171_test_map.meta.copy()
+    meta['exptime'] = 1
+    new_map = sunpy.map.Map(aia171_test_map.data, meta)
+    wcs2 = new_map.wcs
+    assert len(sunpy.map.mapbase._wcs_cache) == 1
+    assert wcs1.to_header() == wcs2.to_header()
+
+    # Each map gets a copy, so modifying one WCS doesn't affect other maps
+    assert wcs1 is not wcs2
+    wcs2.wcs.crpix[0] = 1000
+    assert sunpy.map.Map(aia171_test_map.data, meta).wcs.wcs.crpix[0] == wcs1.wcs.crpix[0]
+
+    # Changing the pointing doesn't use the cached WCS
+    meta['crval1'] = 100
+    assert sunpy.map.Map(aia171_test_map.data, meta).wcs.wcs.crval[0] != wcs1.wcs.crval[0]
+    assert len(sunpy.map.mapbase._wcs_cache) == 2
+
+
+def test_wcs_shared_cache_warnings(aia171_test_map):
+    sunpy.map.mapbase._wcs_cache.clear()
+    for key in ['hgln_obs', 'crln_obs', 'haex_obs', 'heex_obs']:
+        aia171_test_map.meta.pop(key, None)
+    # The warnings raised while building the WCS are raised again for a map
+    # which uses the cached WCS
+    for _ in range(2):
+        new_map = sunpy.map.Map(aia171_test_map.data, aia171_test_map.meta)
+        with pytest.warns(SunpyMetadataWarning, match='Missing metadata for observer'):
+            new_map.wcs
+    assert len(sunpy.map.mapbase._wcs_cache) == 1
+
+
+def test_wcs_observer_keywords(aia171_test_map):
+    # Only the observer coordinate of the map sets the observer information
+    aia171_test_map.meta['crln_obs'] = 0
+    wcs = aia171_test_map.wcs
+    assert wcs.wcs.aux.crln_obs is None
+    assert wcs.wcs.aux.hgln_obs == aia171_test_map.observer_coordinate.lon.to_value(u.deg)
+    assert wcs.pixel_shape is None
+
+
 def test_header_immutability(aia171_test_map):
     # Check that accessing the wcs of a map doesn't modify the meta data
     assert 'KEYCOMMENTS' in aia171_test_map.meta
@@ -591,6 +637,24 @@ def test_submap_data_header(generic_map, unit):
     assert (generic_map.data[height // 2:height, width // 2:width] == submap.data).all()
 
 
+def test_submap_copy(generic_map):
+    generic_map.mask = generic_map.data > 0
+    bottom_left, top_right = [1, 1] * u.pix, [2, 3] * u.pix
+
+    copied = generic_map.submap(bottom_left, top_right=top_right)
+    view = generic_map.submap(bottom_left, top_right=top_right, copy=False)
+    assert np.shares_memory(view.data, generic_map.data)
+    assert np.shares_memory(view.mask, generic_map.mask)
+    assert not np.shares_memory(copied.data, generic_map.data)
+    assert not np.shares_memory(copied.mask, generic_map.mask)
+    np.testing.assert_equal(view.data, copied.data)
+    assert view.meta == copied.meta
+
+    view.data[0, 0] = -1
+    assert generic_map.data[1, 1] == -1
+    assert copied.data[0, 0] != -1
+
+
 def test_reference_coordinate(simple_map):
     assert simple_map.reference_pixel.x == 1 * u.pix
     assert simple_map.reference_pixel.y == 1 * u.pix
@@ -718,6 +782,19 @@ def test_superpixel_fractional_inputs(generic_map):
     assert super1.meta == super2.meta
 
 
+@pytest.mark.parametrize('func', ['sum', 'nanmean', 'median'])
+def test_superpixel_builtin_func(aia171_test_map_with_mask, func):
+    dimensions = (4, 2) * u.pix
+    expected = aia171_test_map_with_mask.superpixel(
+        dimensions, func=lambda x, axis: getattr(np.ma, func.replace('nan', ''))(x, axis=axis))
+    superpixel_map = aia171_test_map_with_mask.superpixel(dimensions, func=func, chunk_size=5)
+    assert superpixel_map.meta == expected.meta
+    np.testing.assert_array_equal(superpixel_map.mask, expected.mask)
+    if func != 'median':
+        # The median of the medians of the rows of a superpixel is not its median
+        np.testing.assert_allclose(superpixel_map.data, expected.data)
+
+
 def test_superpixel_err(generic_map):
     with pytest.raises(ValueError, match="Offset is strictly non-negative."):
         generic_map.superpixel((2, 2) * u.pix, offset=(-2, 2) * u.pix)
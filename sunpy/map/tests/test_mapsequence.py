@@ -2,6 +2,7 @@
 Test mapsequence functionality
 """
 from unittest import mock
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pytest
@@ -226,3 +227,152 @@ def test_save(aia171_test_map, hmi_test_map, tmp_path):
     for k in seq.maps[1].meta:
         assert test_seq.maps[1].meta[k] == seq.maps[1].meta[k]
     assert_quantity_allclose(test_seq.maps[1].data, seq.maps[1].data)
+
+
+@pytest.mark.parametrize('memmap', [False, True])
+def test_as_cube(mapsequence_all_the_same_some_have_masks, memmap, tmp_path):
+    seq = mapsequence_all_the_same_some_have_masks
+    filename = tmp_path / 'cube.npy' if memmap else None
+    cube_seq = seq.as_cube(filename)
+    assert isinstance(cube_seq, sunpy.map.MapSequence)
+    assert len(cube_seq) == len(seq)
+    assert isinstance(cube_seq.maps.data, np.memmap) is memmap
+    assert cube_seq.all_maps_same_shape()
+    assert cube_seq.at_least_one_map_has_mask()
+
+    # The array is a view of the cube with the same values as the copy
+    array = cube_seq.as_array()
+    assert np.shares_memory(array, cube_seq.maps.data)
+    np.testing.assert_equal(array, seq.as_array())
+    np.testing.assert_equal(np.ma.getmask(array), np.ma.getmask(seq.as_array()))
+    # The metadata is read without creating the maps
+    assert cube_seq.all_meta() == seq.all_meta()
+    assert all(isinstance(meta, MetaDict) for meta in cube_seq.all_meta())
+    assert cube_seq.maps._frames == [None] * len(seq)
+
+    for m, cube_map in zip(seq, cube_seq):
+        assert type(cube_map) is type(m)
+        assert cube_map.meta == m.meta
+        assert np.shares_memory(cube_map.data, cube_seq.maps.data)
+        np.testing.assert_equal(cube_map.data, m.data)
+    # Maps are only created once
+    assert cube_seq[0] is cube_seq[0]
+
+    if memmap:
+        # The saved cube can be used to create a sequence again
+        cube = np.load(filename, mmap_mode='r')
+        loaded_seq = sunpy.map.MapSequence.from_cube(cube, seq.all_meta())
+        assert isinstance(loaded_seq[1], sunpy.map.sources.AIAMap)
+        np.testing.assert_equal(loaded_seq.as_array(), seq.as_array().data)
+
+
+def test_as_cube_different(mapsequence_different):
+    with pytest.raises(ValueError, match='Not all maps have the same shape'):
+        mapsequence_different.as_cube()
+
+
+def test_from_cube_slicing(aia171_test_map):
+    data = np.arange(4 * 128 * 128, dtype=float).reshape((4, 128, 128))
+    seq = sunpy.map.MapSequence.from_cube(data, [aia171_test_map.meta] * 4,
+                                          plot_settings={'cmap': 'viridis'})
+    assert isinstance(seq[0], sunpy.map.sources.AIAMap)
+    assert seq[0].plot_settings['cmap'] == 'viridis'
+
+    subseq = seq[1:3]
+    assert isinstance(subseq, sunpy.map.MapSequence)
+    assert len(subseq) == 2
+    np.testing.assert_equal(subseq[0].data, data[1])
+    assert np.shares_memory(subseq.as_array(), data)
+    assert subseq.as_array().shape == (128, 128, 2)
+
+
+def test_from_cube_errors(aia171_test_map):
+    data = np.zeros((2, 128, 128))
+    with pytest.raises(ValueError, match='must be a'):
+        sunpy.map.MapSequence.from_cube(data[0], [aia171_test_map.meta])
+    with pytest.raises(ValueError, match='one header for each frame'):
+        sunpy.map.MapSequence.from_cube(data, [aia171_test_map.meta])
+    with pytest.raises(ValueError, match='mask must have the same shape'):
+        sunpy.map.MapSequence.from_cube(data, [aia171_test_map.meta] * 2, mask=np.zeros((2, 2)))
+
+
+@pytest.mark.parametrize('as_cube', [False, True])
+def test_superpixel(mapsequence_all_the_same_some_have_masks, as_cube):
+    seq = mapsequence_all_the_same_some_have_masks
+    if as_cube:
+        seq = seq.as_cube()
+    dimensions = (4, 2) * u.pix
+    offset = (1, 0) * u.pix
+    superpixel_seq = seq.superpixel(dimensions, offset=offset, func='mean')
+    assert isinstance(superpixel_seq, sunpy.map.MapSequence)
+    assert isinstance(superpixel_seq.maps, list) is not as_cube
+    if as_cube:
+        # The superpixels are computed without creating the maps
+        assert seq.maps._frames == [None] * len(seq)
+    assert len(superpixel_seq) == len(seq)
+    for m, superpixel_map in zip(seq, superpixel_seq):
+        expected = m.superpixel(dimensions, offset=offset, func='mean')
+        assert isinstance(superpixel_map, type(m))
+        assert superpixel_map.meta == expected.meta
+        np.testing.assert_allclose(superpixel_map.data, expected.data)
+        np.testing.assert_array_equal(_full_mask(superpixel_map), _full_mask(expected))
+
+
+def _full_mask(m):
+    return np.zeros(m.data.shape, dtype=bool) if m.mask is None else m.mask
+
+
+@pytest.mark.parametrize('workers', [None, 2])
+def test_rotate(aia171_test_map, workers):
+    other_map = aia171_test_map.rotate(10 * u.deg)
+    seq = sunpy.map.Map([aia171_test_map, aia171_test_map, other_map], sequence=True, sortby=None)
+    rotated_seq = seq.rotate(30 * u.deg, order=2, workers=workers)
+    assert isinstance(rotated_seq, sunpy.map.MapSequence)
+    assert len(rotated_seq) == len(seq)
+    for m, rotated_map in zip(seq, rotated_seq):
+        expected = m.rotate(30 * u.deg, order=2)
+        assert isinstance(rotated_map, type(m))
+        assert rotated_map.meta == expected.meta
+        np.testing.assert_array_equal(rotated_map.data, expected.data)
+
+    # Rotate each map by its own rotation matrix
+    for m, rotated_map in zip(seq, seq.rotate(use_scipy=True)):
+        expected = m.rotate(use_scipy=True)
+        assert rotated_map.meta == expected.meta
+        np.testing.assert_array_equal(rotated_map.data, expected.data)
+
+
+def test_rotate_errors(mapsequence_all_the_same):
+    with pytest.raises(ValueError, match='You cannot specify both'):
+        mapsequence_all_the_same.rotate(10 * u.deg, rmatrix=np.eye(2))
+    with pytest.raises(ValueError, match='Order must be between 0 and 5'):
+        mapsequence_all_the_same.rotate(10 * u.deg, order=6)
+
+
+@pytest.mark.parametrize('method', ['neighbor', 'linear', 'spline'])
+def test_resample(mapsequence_different, method):
+    dimensions = (20, 30) * u.pix
+    executor = ThreadPoolExecutor(max_workers=2)
+    resampled_seq = mapsequence_different.resample(dimensions, method, executor=executor)
+    executor.shutdown()
+    assert len(resampled_seq) == len(mapsequence_different)
+    for m, resampled_map in zip(mapsequence_different, resampled_seq):
+        expected = m.resample(dimensions, method)
+        assert resampled_map.meta == expected.meta
+        np.testing.assert_array_equal(resampled_map.data, expected.data)
+
+
+def test_superpixel_from_cube(aia171_test_map):
+    # A frame which has been accessed keeps its changes in the superpixel sequence
+    data = np.stack([aia171_test_map.data] * 2)
+    seq = sunpy.map.MapSequence.from_cube(data, [dict(aia171_test_map.meta)] * 2)
+    seq[1].meta['crval1'] += 10
+    seq[1].plot_settings['cmap'] = 'viridis'
+    superpixel_seq = seq.superpixel((4, 4) * u.pix)
+    assert seq.maps._frames[0] is None
+    for m, superpixel_map in zip(seq, superpixel_seq):
+        expected = m.superpixel((4, 4) * u.pix)
+        assert isinstance(superpixel_map, sunpy.map.sources.AIAMap)
+        assert superpixel_map.meta == expected.meta
+        assert superpixel_map.plot_settings['cmap'] == expected.plot_settings['cmap']
+        np.testing.assert_allclose(superpixel_map.data, expected.data)
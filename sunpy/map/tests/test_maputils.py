@@ -8,6 +8,7 @@ import sunpy.map
 from sunpy.coordinates import HeliographicStonyhurst
 from sunpy.coordinates.frames import HeliographicCarrington
 from sunpy.coordinates.utils import GreatArc
+from sunpy.map import maputils
 from sunpy.map.maputils import (
     _verify_coordinate_helioprojective,
     all_coordinates_from_map,
@@ -94,6 +95,30 @@ def test_all_coordinates_from_map(sub_smap):
     assert coordinates.frame.name == sub_smap.coordinate_frame.name
 
 
+def test_all_coordinates_from_map_cached(sub_smap):
+    maputils._grid_cache.clear()
+    first = all_coordinates_from_map(sub_smap)
+    assert len(maputils._grid_cache) == 1
+    second = all_coordinates_from_map(sub_smap)
+    assert len(maputils._grid_cache) == 1
+    # Callers get their own copy of the cached grid
+    assert first is not second
+    assert np.all(first.Tx == second.Tx)
+    assert np.all(first.Ty == second.Ty)
+
+
+def test_coordinate_grid_modes(sub_smap):
+    coarse = maputils._coordinate_grid(sub_smap, step=4)
+    full = all_coordinates_from_map(sub_smap)
+    assert coarse.shape == full[::4, ::4].shape
+    assert np.all(coarse.Tx == full[::4, ::4].Tx)
+
+    edges = maputils._coordinate_grid(sub_smap, edges=True)
+    expected = sub_smap.pixel_to_world(*np.concatenate(map_edges(sub_smap)).T)
+    assert np.all(edges.Tx == expected.Tx)
+    assert np.all(edges.Ty == expected.Ty)
+
+
 def test_all_corner_coordinates_from_map(sub_smap):
     coordinates = all_corner_coords_from_map(sub_smap)
     shape = sub_smap.data.shape
@@ -188,6 +213,21 @@ def test_on_disk_bounding_coordinates(aia171_test_map):
     np.testing.assert_almost_equal(tr.Ty.to(u.arcsec).value, 971.63586861, decimal=1)
 
 
+@pytest.mark.parametrize('submap', [False, True])
+def test_on_disk_bounding_coordinates_full_grid(aia171_test_map, submap):
+    smap = aia171_test_map.resample((256, 256)*u.pix)
+    if submap:
+        smap = smap.submap((100, 150)*u.pix, top_right=(255, 255)*u.pix)
+    coordinates = all_coordinates_from_map(smap)
+    on_disk = coordinates[coordinate_is_on_solar_disk(coordinates)]
+
+    bl, tr = on_disk_bounding_coordinates(smap)
+    assert u.allclose(bl.Tx, on_disk.Tx.min())
+    assert u.allclose(bl.Ty, on_disk.Ty.min())
+    assert u.allclose(tr.Tx, on_disk.Tx.max())
+    assert u.allclose(tr.Ty, on_disk.Ty.max())
+
+
 def test_data_at_coordinates(aia171_test_map, aia_test_arc):
     data = sample_at_coords(aia171_test_map, aia_test_arc.coordinates())
     pixels = np.asarray(np.rint(
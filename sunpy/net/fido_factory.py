@@ -9,9 +9,11 @@ This module provides the `Fido
 
 """
 import os
+import warnings
 from pathlib import Path
 from textwrap import dedent
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor, wait
 
 import parfive
 
@@ -22,6 +24,7 @@ from sunpy.net import attr, vso
 from sunpy.net.base_client import BaseClient, QueryResponseColumn, QueryResponseRow, QueryResponseTable
 from sunpy.util.datatype_factory_base import BasicRegistrationFactory, NoMatchError
 from sunpy.util.decorators import deprecated
+from sunpy.util.exceptions import SunpyUserWarning
 from sunpy.util.parfive_helpers import Downloader, Results
 from sunpy.util.util import get_width
 
@@ -264,6 +267,8 @@ query_walker = attr.AttrWalker()
 """
 We construct an `AttrWalker` which calls `_make_query_to_client` for each
 logical component of the query, i.e. any block which are ANDed together.
+The walker returns a list of ``(client, query)`` pairs, which are then
+searched by `UnifiedDownloaderFactory.search`.
 """
 
 
@@ -298,7 +303,7 @@ class UnifiedDownloaderFactory(BasicRegistrationFactory):
 
     """
 
-    def search(self, *query):
+    def search(self, *query, workers=None, executor=None, timeout=None):
         """
         Query for data in form of multiple parameters.
 
@@ -324,6 +329,12 @@ class UnifiedDownloaderFactory(BasicRegistrationFactory):
         ...                        a.Wavelength(304*u.angstrom, 304*u.angstrom),
         ...                        a.Sample(10*u.minute))  # doctest: +REMOTE_DATA
 
+        Query all the clients at the same time, dropping the results of any
+        client which has not responded within 30 seconds
+
+        >>> unifresp = Fido.search(a.Time('2012/3/4', '2012/3/6'),
+        ...     a.Instrument.norh | a.Instrument.rhessi, timeout=30)  # doctest: +REMOTE_DATA
+
         Parameters
         ----------
         query : `sunpy.net.vso.attrs`, `sunpy.net.jsoc.attrs`
@@ -331,6 +342,17 @@ class UnifiedDownloaderFactory(BasicRegistrationFactory):
             requested data.  The query is specified using attributes from the
             VSO and the JSOC.  The query can mix attributes from the VSO and
             the JSOC.
+        workers : `int`, optional
+            If given, search the clients concurrently in a thread pool with
+            this many threads.
+        executor : `concurrent.futures.Executor`, optional
+            If given, search the clients concurrently with this executor.
+            Only one of ``workers`` and ``executor`` can be specified.
+        timeout : `float`, optional
+            The number of seconds to wait for the clients to respond, measured
+            from when the search is dispatched. If given, the clients are
+            searched concurrently, with one thread per client unless
+            ``workers`` or ``executor`` is specified.
 
         Returns
         -------
@@ -343,9 +365,21 @@ class UnifiedDownloaderFactory(BasicRegistrationFactory):
         ie. query is now of form A & B or ((A & B) | (C & D))
         This helps in modularising query into parts and handling each of the
         parts individually.
+
+        When the clients are searched concurrently, a client which raises an
+        error or does not respond within ``timeout`` does not stop the search.
+        A warning is emitted instead, and the results from the other clients
+        are returned.
         """
         query = attr.and_(*query)
-        results = query_walker.create(query, self)
+        blocks = query_walker.create(query, self)
+        if timeout is not None and workers is None and executor is None:
+            workers = len(blocks)
+
+        if workers is None and executor is None:
+            results = [self._search_client(client, *block) for client, block in blocks]
+        else:
+            results = self._search_concurrently(blocks, workers, executor, timeout)
 
         # If we have searched the VSO but no results were returned, but another
         # client generated results, we drop the empty VSO results for tidiness.
@@ -489,7 +523,7 @@ class UnifiedDownloaderFactory(BasicRegistrationFactory):
 
     def _make_query_to_client(self, *query):
         """
-        Given a query, look up the client and perform the query.
+        Given a query, look up the clients which can perform the query.
 
         Parameters
         ----------
@@ -497,23 +531,59 @@ class UnifiedDownloaderFactory(BasicRegistrationFactory):
 
         Returns
         -------
-        results : `list`
-
-        client : `object`
-            Instance of client class
+        `list` of `tuple`
+            A ``(client, query)`` pair for each client class which can handle
+            the query.
         """
         candidate_widget_types = self._check_registered_widgets(*query)
+        # This method is called by the query walker in `search`, which then
+        # performs the queries and feeds the results into a UnifiedResponse.
+        return [(client, query) for client in candidate_widget_types]
+
+    @staticmethod
+    def _search_client(client, *query):
+        """
+        Instantiate a client class and perform the query with it.
+        """
+        tmpclient = client()
+        kwargs = dict()
+        # Handle the change in response format in the VSO
+        if isinstance(tmpclient, vso.VSOClient):
+            kwargs = dict(response_format="table")
+        return tmpclient.search(*query, **kwargs)
+
+    def _search_concurrently(self, blocks, workers, executor, timeout):
+        """
+        Search all the ``(client, query)`` blocks at the same time.
+
+        The results are returned in the order of the blocks. Clients which
+        raise an error or do not finish within ``timeout`` seconds are
+        dropped with a warning.
+        """
+        if workers is not None and executor is not None:
+            raise ValueError("Only one of workers and executor can be specified.")
+        pool = executor if executor is not None else ThreadPoolExecutor(max_workers=workers)
+        try:
+            futures = [pool.submit(self._search_client, client, *block) for client, block in blocks]
+            _, not_done = wait(futures, timeout=timeout)
+        finally:
+            # Do not wait for clients which have timed out, their threads
+            # finish in the background.
+            if executor is None:
+                pool.shutdown(wait=False)
+
         results = []
-        for client in candidate_widget_types:
-            tmpclient = client()
-            kwargs = dict()
-            # Handle the change in response format in the VSO
-            if isinstance(tmpclient, vso.VSOClient):
-                kwargs = dict(response_format="table")
-            results.append(tmpclient.search(*query, **kwargs))
-
-        # This method is called by `search` and the results are fed into a
-        # UnifiedResponse object.
+        for (client, _), future in zip(blocks, futures):
+            if future in not_done:
+                future.cancel()
+                warnings.warn(f"The {client.__name__} search did not finish within {timeout} "
+                              "seconds, its results have been dropped.", SunpyUserWarning)
+            elif future.exception() is not None:
+                warnings.warn(f"The {client.__name__} search failed with error: "
+                              f"{future.exception()}", SunpyUserWarning)
+            else:
+                results.append(future.result())
+
         return results
 
     def __repr__(self):
@@ -6,6 +6,8 @@ import codecs
 import urllib
 import inspect
 from itertools import chain
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 import astropy.table
 from astropy.table import Row
@@ -16,7 +18,6 @@ from sunpy import log
 from sunpy.net import attr
 from sunpy.net.base_client import BaseClient, QueryResponseTable
 from sunpy.net.hek import attrs
-from sunpy.util import dict_keys_same, unique
 from sunpy.util.xml import xml_to_dict
 
 __all__ = ['HEKClient', 'HEKTable', 'HEKRow']
@@ -33,6 +34,53 @@ def _freeze(obj):
     return obj
 
 
+def _event_id(event):
+    """ Get what identifies an event, which is its IVORN if it has one. """
+    for key in ('kb_archivid', 'SOL_standard'):
+        if event.get(key):
+            return key, event[key]
+    return _freeze(event)
+
+
+def _make_table(pages, unique=False):
+    """
+    Make a table of events, which are given as dicts, one column at a time.
+
+    Parameters
+    ----------
+    pages : iterable of `list` of `dict`
+        The events on each page of results.
+    unique : `bool`, optional
+        If `True` only the first of the events with the same ID is kept.
+
+    Returns
+    -------
+    `astropy.table.Table`
+        The events, with `None` for the properties an event does not have.
+    """
+    columns = {}
+    nrows = 0
+    ids = set()
+    for events in pages:
+        for event in events:
+            if unique:
+                event_id = _event_id(event)
+                if event_id in ids:
+                    continue
+                ids.add(event_id)
+            for key, value in event.items():
+                column = columns.get(key)
+                if column is None:
+                    column = columns[key] = [None] * nrows
+                column.append(value)
+            nrows += 1
+            if len(event) < len(columns):
+                for column in columns.values():
+                    if len(column) < nrows:
+                        column.append(None)
+    return astropy.table.Table(columns)
+
+
 class HEKClient(BaseClient):
     """
     Provides access to the Heliophysics Event Knowledgebase (HEK).
@@ -51,36 +99,64 @@ class HEKClient(BaseClient):
     }
     # Default to full disk.
     attrs.walker.apply(attrs.SpatialRegion(), {}, default)
+    # The maximum number of pages of results which are downloaded at the same time
+    max_conn = 4
 
     def __init__(self, url=DEFAULT_URL):
         self.url = url
 
-    def _download(self, data):
-        """ Download all data, even if paginated. """
-        page = 1
-        results = []
-
-        while True:
-            data['page'] = page
-            url = self.url + urllib.parse.urlencode(data)
-            log.debug(f'Opening {url}')
-            fd = urllib.request.urlopen(url)
-            try:
-                result = codecs.decode(fd.read(), encoding='utf-8', errors='replace')
-                result = json.loads(result)
-            except Exception as e:
-                raise IOError("Failed to load return from the HEKClient.") from e
-            finally:
-                fd.close()
-            results.extend(result['result'])
-
-            if not result['overmax']:
-                if len(results) > 0:
-                    return astropy.table.Table(dict_keys_same(results))
-                else:
-                    return astropy.table.Table()
-
-            page += 1
+    def _download_page(self, data, page):
+        """ Download one page of results. """
+        url = self.url + urllib.parse.urlencode(dict(data, page=page))
+        log.debug(f'Opening {url}')
+        fd = urllib.request.urlopen(url)
+        try:
+            result = codecs.decode(fd.read(), encoding='utf-8', errors='replace')
+            return json.loads(result)
+        except Exception as e:
+            raise IOError("Failed to load return from the HEKClient.") from e
+        finally:
+            fd.close()
+
+    def _download(self, data, executor, first_page=None):
+        """
+        Download all data, even if paginated.
+
+        Once the first page shows that there are more, ``max_conn`` of the
+        following pages are kept downloading at the same time.
+
+        Parameters
+        ----------
+        data : `dict`
+            The query.
+        executor : `concurrent.futures.Executor`
+            The executor to download the pages with.
+        first_page : `concurrent.futures.Future`, optional
+            The download of the first page, if it has already been started.
+
+        Yields
+        ------
+        `list` of `dict`
+            The events on each page, in order.
+        """
+        if first_page is None:
+            first_page = executor.submit(self._download_page, data, 1)
+        result = first_page.result()
+        yield result['result']
+
+        pending = deque()
+        page = 2
+        try:
+            while result['overmax']:
+                while len(pending) < self.max_conn:
+                    pending.append(executor.submit(self._download_page, data, page))
+                    page += 1
+                result = pending.popleft().result()
+                yield result['result']
+        finally:
+            # The pages after the last one have no results
+            for future in pending:
+                future.cancel()
 
     def search(self, *args, **kwargs):
         """
@@ -115,14 +191,13 @@ class HEKClient(BaseClient):
             new.update(elem)
             ndata.append(new)
 
-        if len(ndata) == 1:
-            return HEKTable(self._download(ndata[0]), client=self)
-        else:
-            return HEKTable(self._merge(self._download(data) for data in ndata), client=self)
-
-    def _merge(self, responses):
-        """ Merge responses, removing duplicates. """
-        return list(unique(chain.from_iterable(responses), _freeze))
+        with ThreadPoolExecutor(max_workers=self.max_conn) as executor:
+            # Start downloading the first page of every query at once
+            first_pages = [executor.submit(self._download_page, data, 1) for data in ndata]
+            pages = chain.from_iterable(self._download(data, executor, first_page)
+                                        for data, first_page in zip(ndata, first_pages))
+            table = _make_table(pages, unique=len(ndata) > 1)
+        return HEKTable(table, client=self)
 
     def fetch(self, *args, **kwargs):
         """
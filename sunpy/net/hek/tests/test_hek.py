@@ -1,3 +1,6 @@
+import threading
+from unittest import mock
+
 import pytest
 
 from sunpy.net import attr, attrs, hek
@@ -197,3 +200,71 @@ def test_mixed_results_get_angstrom():
     result = client.search(attrs.Time(tstart, tend), attrs.hek.EventType(event_type))
     assert len(result) == 13
     assert result[0]["SOL_standard"] == 'SOL2014-10-24T20:53:46L247C106'
+
+
+def fake_pages(npages):
+    """
+    Make a stand-in for downloading a page of results, on which the query for
+    each of the FRM names in ``npages`` has that many pages of two events.
+    """
+    requested = []
+    lock = threading.Lock()
+
+    def download_page(data, page):
+        name = data.get('value0', data.get('value1'))
+        with lock:
+            requested.append((name, page))
+        if page > npages[name]:
+            return {'result': [], 'overmax': False}
+        # The events on the second page for 'B' are the same as those for 'A'
+        ids = [f'A{page}_{i}' if (name, page) == ('B', 2) else f'{name}{page}_{i}' for i in range(2)]
+        events = [{'kb_archivid': id, 'SOL_standard': f'SOL{id}', 'frm_name': name} for id in ids]
+        events[1][f'{name}_prop'] = page
+        return {'result': events, 'overmax': page < npages[name]}
+
+    return download_page, requested
+
+
+def test_search_paginated():
+    download_page, requested = fake_pages({'A': 7})
+    h = hek.HEKClient()
+    with mock.patch.object(h, '_download_page', side_effect=download_page):
+        res = h.search(attrs.Time('2011/08/09 07:23:56', '2011/08/09 12:40:29'), attrs.hek.FL,
+                       attrs.hek.FRM.Name == 'A')
+
+    assert isinstance(res, hek.hek.HEKTable)
+    assert list(res['kb_archivid']) == [f'A{page}_{i}' for page in range(1, 8) for i in range(2)]
+    assert res.colnames == ['kb_archivid', 'SOL_standard', 'frm_name', 'A_prop']
+    assert list(res['A_prop']) == [None, 1, None, 2, None, 3, None, 4, None, 5, None, 6, None, 7]
+    # No more than max_conn pages are requested after the last one
+    pages = sorted(page for _, page in requested)
+    assert pages[:7] == list(range(1, 8))
+    assert len(pages) <= 7 + h.max_conn
+
+
+def test_search_or_unique():
+    download_page, requested = fake_pages({'A': 2, 'B': 3})
+    h = hek.HEKClient()
+    with mock.patch.object(h, '_download_page', side_effect=download_page):
+        res = h.search(attrs.Time('2011/08/09 07:23:56', '2011/08/09 12:40:29'), attrs.hek.FL,
+                       (attrs.hek.FRM.Name == 'A') | (attrs.hek.FRM.Name == 'B'))
+
+    assert list(res['kb_archivid']) == ['A1_0', 'A1_1', 'A2_0', 'A2_1', 'B1_0', 'B1_1', 'B3_0', 'B3_1']
+    assert list(res['B_prop']) == [None] * 5 + [1, None, 3]
+
+
+def test_search_empty():
+    download_page, requested = fake_pages({'A': 0})
+    h = hek.HEKClient()
+    with mock.patch.object(h, '_download_page', side_effect=download_page):
+        res = h.search(attrs.Time('2011/08/09 07:23:56', '2011/08/09 12:40:29'), attrs.hek.FL,
+                       attrs.hek.FRM.Name == 'A')
+    assert isinstance(res, hek.hek.HEKTable)
+    assert len(res) == 0
+    assert requested == [('A', 1)]
+
+
+def test_event_id():
+    assert hek.hek._event_id({'kb_archivid': 'a', 'SOL_standard': 'b'}) == ('kb_archivid', 'a')
+    assert hek.hek._event_id({'kb_archivid': '', 'SOL_standard': 'b'}) == ('SOL_standard', 'b')
+    assert hek.hek._event_id({'x': [1, {'y': 2}]}) == (('x', (1, (('y', 2),))),)
@@ -8,10 +8,14 @@ and returns the results from the VSO query to the user.
 """
 
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
 from tqdm import tqdm
 
 from astropy import units
+from astropy.time import Time
 
 from sunpy.net import attrs as a
 from sunpy.net import hek, vso
@@ -99,6 +103,80 @@ def vso_attribute_parse(phrase):
     return query
 
 
+def _attr_key(attr):
+    """
+    Make a hashable representation of a VSO attribute.
+    """
+    if isinstance(attr, a.Wavelength):
+        return (type(attr), attr.min.to_value(units.AA, equivalencies=units.spectral()),
+                attr.max.to_value(units.AA, equivalencies=units.spectral()))
+    return type(attr), attr.value
+
+
+def _plan_queries(queries, max_duration=None, max_events=None):
+    """
+    Merge VSO queries that differ only in time, and whose time ranges overlap
+    or touch, into one query each.
+
+    Parameters
+    ----------
+    queries : `list`
+        The VSO queries, as made by `vso_attribute_parse`, with the time range
+        first.
+    max_duration : `astropy.units.Quantity`, optional
+        The longest time range of a merged query. A query which is longer
+        than this on its own is not merged with any other.
+    max_events : `int`, optional
+        The largest number of queries merged into one.
+
+    Returns
+    -------
+    `list` of `tuple`
+        The merged queries, each with the indices of the queries it covers,
+        in the order of the first query each covers.
+    """
+    groups = {}
+    for i, (time, *query) in enumerate(queries):
+        key = tuple(_attr_key(attr) for attr in query)
+        groups.setdefault(key, []).append(i)
+
+    plan = []
+    for indices in groups.values():
+        indices.sort(key=lambda i: queries[i][0].start)
+        merged = []
+        for i in indices:
+            time = queries[i][0]
+            if (merged and time.start <= end
+                    and (max_duration is None or max(end, time.end) - start <= max_duration)
+                    and (max_events is None or len(merged) < max_events)):
+                end = max(end, time.end)
+            else:
+                if merged:
+                    plan.append(([a.Time(start, end)] + queries[merged[0]][1:], merged))
+                start, end = time.start, time.end
+                merged = []
+            merged.append(i)
+        plan.append(([a.Time(start, end)] + queries[merged[0]][1:], merged))
+    return sorted(plan, key=lambda item: min(item[1]))
+
+
+def _time_bounds(table):
+    """
+    Get the start and end times, in MJD, of the records in a VSO results table.
+
+    The times a record does not have are NaN.
+    """
+    bounds = []
+    for name in ('Start Time', 'End Time'):
+        if name not in table.colnames:
+            bounds.append(np.full(len(table), np.nan))
+        elif isinstance(table[name], Time):
+            bounds.append(table[name].mjd)
+        else:
+            bounds.append(np.array([np.nan if t is None else Time(t).mjd for t in table[name]]))
+    return bounds
+
+
 class H2VClient:
     """
     Class to handle HEK to VSO translations
@@ -114,6 +192,12 @@ class H2VClient:
     >>> from sunpy.net import hek2vso
     >>> h2v = hek2vso.H2VClient()  # doctest: +REMOTE_DATA
     """
+    # The maximum number of VSO queries which are made at the same time
+    max_conn = 4
+    # The longest time range, and the largest number of events, of a query
+    # which is merged from the queries of several events
+    max_merged_duration = 1 * units.day
+    max_merged_events = 20
 
     def __init__(self):
         self.hek_client = hek.HEKClient()
@@ -160,6 +244,15 @@ class H2VClient:
         query, returning the results in a list organized by their
         corresponding HEK query.
 
+        The queries for events which have the same source, instrument and
+        wavelength, and whose time ranges overlap or touch, are merged into
+        one, as long as the merged query covers no more than
+        ``max_merged_duration`` and ``max_merged_events``. Up to ``max_conn``
+        queries are made at the same time, in the order of the events, and no
+        more queries are made once ``limit`` has been reached. The records of
+        a merged query are then split up between its events, by whether they
+        overlap the time range of the event.
+
         Parameters
         ----------
         hek_results : `sunpy.net.hek.hek.HEKRow` or `sunpy.net.hek.hek.HEKTable`
@@ -181,14 +274,44 @@ class H2VClient:
         >>> res = h2v.translate_and_query(q)  # doctest: +REMOTE_DATA
         """
         vso_query = translate_results_to_query(hek_results)
-
-        for query in tqdm(vso_query, unit="records"):
-            temp = self.vso_client.search(*query, response_format=vso_response_format)
-            self.vso_results.append(temp)
-            self.num_of_records += len(temp)
-            if limit is not None:
-                if self.num_of_records >= limit:
-                    break
+        if vso_response_format == "table":
+            plan = _plan_queries(vso_query, self.max_merged_duration, self.max_merged_events)
+        else:
+            # Records of other formats can not be split up between events
+            plan = [(query, [i]) for i, query in enumerate(vso_query)]
+
+        results = [None] * len(vso_query)
+        # The first event whose results have not been added yet
+        event = 0
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=self.max_conn) as executor:
+            try:
+                for n, (query, indices) in enumerate(tqdm(plan, unit="queries")):
+                    # Keep up to max_conn queries going, in the order of the events
+                    while len(pending) < self.max_conn and n + len(pending) < len(plan):
+                        next_query = plan[n + len(pending)][0]
+                        pending.append(executor.submit(self.vso_client.search, *next_query,
+                                                       response_format=vso_response_format))
+                    response = pending.popleft().result()
+                    if len(indices) == 1:
+                        results[indices[0]] = response
+                    else:
+                        starts, ends = _time_bounds(response)
+                        for i in indices:
+                            time = vso_query[i][0]
+                            results[i] = response[~((starts > time.end.mjd) | (ends < time.start.mjd))]
+
+                    # All the events before the first event of the next query have their results
+                    last = min(plan[n + 1][1]) if n + 1 < len(plan) else len(results)
+                    for temp in results[event:last]:
+                        self.vso_results.append(temp)
+                        self.num_of_records += len(temp)
+                        if limit is not None and self.num_of_records >= limit:
+                            return self.vso_results
+                    event = last
+            finally:
+                for future in pending:
+                    future.cancel()
 
         return self.vso_results
 
@@ -156,3 +156,83 @@ def test_quick_clean(h2v_client, hek_client):
 
     assert h2v.vso_results == []
     assert h2v.num_of_records == 0
+
+
+def fake_vso_search(*query, response_format=None):
+    """
+    A stand-in for the VSO, which has a record every ten minutes for each of
+    the instruments and wavelengths.
+    """
+    time, source, instrument, wavelength = query
+    start = parse_time('2011-08-09') + np.arange(24 * 6) * 10 * u.min
+    end = start + 5 * u.min
+    keep = (start <= time.end) & (end >= time.start)
+    fileid = [f'{instrument.value}_{wavelength.min.value:.0f}_{t.isot}' for t in start[keep]]
+    return vso.VSOQueryResponseTable({'Start Time': start[keep], 'End Time': end[keep],
+                                      'fileid': fileid})
+
+
+@pytest.fixture
+def hek_events():
+    times = [('07:00', '07:30'), ('07:20', '08:00'), ('08:00', '08:10'), ('09:00', '09:20'),
+             ('07:10', '07:40'), ('10:00', '10:05')]
+    instruments = ['AIA', 'AIA', 'AIA', 'AIA', 'EIT', 'AIA']
+    wavelengths = [171, 171, 171, 171, 195, 211]
+    return hek.HEKTable({'event_starttime': [f'2011-08-09T{start}:00' for start, _ in times],
+                         'event_endtime': [f'2011-08-09T{end}:00' for _, end in times],
+                         'obs_observatory': ['SDO'] * 6,
+                         'obs_instrument': instruments,
+                         'obs_meanwavel': wavelengths,
+                         'obs_wavelunit': ['angstrom'] * 6})
+
+
+def test_plan_queries(hek_events):
+    queries = hek2vso.translate_results_to_query(hek_events)
+    plan = hek2vso.hek2vso._plan_queries(queries)
+
+    # The first three AIA 171 events overlap or touch
+    assert [indices for _, indices in plan] == [[0, 1, 2], [3], [4], [5]]
+    query, indices = plan[0]
+    assert query[0].start == parse_time('2011-08-09T07:00')
+    assert query[0].end == parse_time('2011-08-09T08:10')
+    assert query[1:] == queries[0][1:]
+
+
+def test_plan_queries_capped(hek_events):
+    queries = hek2vso.translate_results_to_query(hek_events)
+
+    plan = hek2vso.hek2vso._plan_queries(queries, max_events=2)
+    assert [indices for _, indices in plan] == [[0, 1], [2], [3], [4], [5]]
+
+    plan = hek2vso.hek2vso._plan_queries(queries, max_duration=1 * u.hour)
+    assert [indices for _, indices in plan] == [[0, 1], [2], [3], [4], [5]]
+    assert plan[0][0][0].end == parse_time('2011-08-09T08:00')
+
+
+def test_translate_and_query_merged(mocker, hek_events):
+    mocker.patch('sunpy.net.vso.VSOClient')
+    h2v = hek2vso.H2VClient()
+    h2v.vso_client.search.side_effect = fake_vso_search
+    results = h2v.translate_and_query(hek_events)
+
+    assert h2v.vso_client.search.call_count == 4
+    expected = [fake_vso_search(*query) for query in hek2vso.translate_results_to_query(hek_events)]
+    assert len(results) == len(expected)
+    for result, exp in zip(results, expected):
+        assert isinstance(result, vso.VSOQueryResponseTable)
+        assert list(result['fileid']) == list(exp['fileid'])
+    assert h2v.num_of_records == sum(len(exp) for exp in expected)
+
+    # No more queries are made once the limit has been reached
+    h2v._quick_clean()
+    h2v.vso_client.search.reset_mock()
+    mocker.patch.object(h2v, 'max_conn', 1)
+    results = h2v.translate_and_query(hek_events, limit=5)
+    assert [len(result) for result in results] == [4, 5]
+    assert h2v.vso_client.search.call_count == 1
+
+    h2v._quick_clean()
+    h2v.vso_client.search.reset_mock()
+    results = h2v.translate_and_query(hek_events, limit=sum(len(exp) for exp in expected[:3]) + 1)
+    assert len(results) == 4
+    assert h2v.vso_client.search.call_count == 2
@@ -1,10 +1,12 @@
 import os
 import copy
 import json
-import time
 import urllib
 import warnings
+import functools
+import threading
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import drms
 import numpy as np
@@ -19,7 +21,9 @@ from sunpy import config
 from sunpy.net.attr import and_
 from sunpy.net.base_client import BaseClient, QueryResponseTable, convert_row_to_table
 from sunpy.net.jsoc.attrs import walker
+from sunpy.net.jsoc.series_cache import SeriesCache
 from sunpy.util._table_attribute import TableAttribute
+from sunpy.util.config import CACHE_DIR
 from sunpy.util.decorators import deprecated
 from sunpy.util.exceptions import SunpyUserWarning
 from sunpy.util.parfive_helpers import Downloader, Results
@@ -30,6 +34,24 @@ __all__ = ['JSOCClient', 'JSOCResponse']
 PKEY_LIST_TIME = {'T_START', 'T_REC', 'T_OBS', 'MidTime', 'OBS_DATE',
                   'obsdate', 'DATE_OBS', 'starttime', 'stoptime', 'UTC_StartTime'}
 
+# The maximum number of parallel connections JSOC allows
+JSOC_MAX_CONN = 10
+
+# The status of an export request which JSOC has not yet found
+JSOC_STATUS_NOTFOUND = 6
+
+series_cache = SeriesCache(CACHE_DIR + '/jsoc_series.db')
+
+
+@functools.lru_cache(maxsize=None)
+def _get_drms_client():
+    """
+    Get the drms client, which is created the first time it is needed and then
+    shared by all the JSOC clients, so that the same session is used for all
+    the searches.
+    """
+    return drms.Client()
+
 
 class NotExportedError(Exception):
     pass
@@ -202,6 +224,17 @@ class JSOCClient(BaseClient):
     """
     # Default number of max connections that the Downloader opens
     default_max_conn = 2
+    # The longest time in seconds between two checks of the status of an export request
+    max_sleep = 60
+    # How many times the status of an export request is checked while it is not found on JSOC
+    retries_notfound = 5
+    # The keywords a search returns, along with the prime keys of the series, unless
+    # `~sunpy.net.jsoc.attrs.Keys` is given
+    default_keys = list(JSOCResponse.display_keys)
+
+    @property
+    def _drms_client(self):
+        return _get_drms_client()
 
     def search(self, *query, **kwargs):
         """
@@ -453,13 +486,21 @@ class JSOCClient(BaseClient):
 
         sleep : `int`
             The number of seconds to wait between calls to JSOC to check the status
-            of the request.
+            of the request. The wait doubles after every check, up to
+            ``max_sleep`` seconds.
 
         Returns
         -------
         results : a `~sunpy.net.download.Results` instance
             A Results object
 
+        Notes
+        -----
+        All the export requests are made before any of them is waited for, and
+        the status of all of them is checked concurrently. The files of each
+        request are queued for download as soon as that request has been
+        staged, so the time spent waiting is that of the slowest request
+        rather than the sum over all of them.
        """
         for resp in jsoc_response.query_args:
             if 'notify' not in resp:
@@ -485,14 +526,17 @@ class JSOCClient(BaseClient):
 
         # Add them to the response for good measure
         jsoc_response.requests = [r for r in responses]
-        time.sleep(sleep/2.)
 
-        for response in responses:
-            response.wait(verbose=progress)
+        dl_set = downloader is not None
+        downloader = self._get_downloader(downloader, progress, overwrite, max_conn, defaults)
+        path = self._get_path(path)
+        for response in self._wait_for_requests(responses, sleep=sleep, progress=progress):
+            self._enqueue_request(downloader, response, path, progress, **defaults)
 
-        return self.get_request(responses, path=path, overwrite=overwrite,
-                                progress=progress, downloader=downloader,
-                                wait=wait, max_conn=max_conn, **defaults)
+        if dl_set and not wait:
+            return Results()
+
+        return downloader.download()
 
     def get_request(self, requests, path=None, overwrite=False, progress=True,
                     downloader=None, wait=True, max_conn=default_max_conn, **kwargs):
@@ -534,7 +578,7 @@ class JSOCClient(BaseClient):
             A `~sunpy.net.download.Results` instance or `None` if no URLs to download
 
         """
-        c = drms.Client()
+        c = self._drms_client
 
         kwargs['max_splits'] = kwargs.get('max_splits', 2)
 
@@ -553,7 +597,83 @@ class JSOCClient(BaseClient):
             raise NotExportedError("Can not download as not all the requests "
                                    "have been exported for download yet.")
 
-        # Ensure path has a {file} in it
+        path = self._get_path(path)
+
+        dl_set = downloader is not None
+        downloader = self._get_downloader(downloader, progress, overwrite, max_conn, kwargs)
+
+        for request in requests:
+            self._enqueue_request(downloader, request, path, progress, **kwargs)
+
+        if dl_set and not wait:
+            return Results()
+
+        results = downloader.download()
+        return results
+
+    def _wait_for_requests(self, requests, sleep=10, progress=True):
+        """
+        Wait for export requests to be staged by JSOC.
+
+        The status of the requests is checked concurrently, first after
+        ``sleep / 2`` seconds and then with a wait that doubles after every
+        check, up to ``max_sleep`` seconds.
+
+        Parameters
+        ----------
+        requests : `list` of `~drms.client.ExportRequest`
+            The export requests.
+        sleep : `int`
+            The number of seconds to wait between the first two checks of the
+            status of each request.
+        progress : `bool`, optional
+            If `True` print a message when a request has been staged.
+
+        Yields
+        ------
+        `~drms.client.ExportRequest`
+            Each request, as soon as it has been staged.
+        """
+        requests = list(requests)
+        if not requests:
+            return
+        # Set to stop checking the remaining requests once one has failed
+        stop = threading.Event()
+
+        def wait(request):
+            interval = sleep / 2
+            retries_notfound = self.retries_notfound
+            while not request.has_finished(skip_update=True):
+                if stop.wait(interval):
+                    return None
+                if request.has_finished():
+                    break
+                if request.status == JSOC_STATUS_NOTFOUND:
+                    if retries_notfound <= 0:
+                        raise NotExportedError(f"The export request {request.id} "
+                                               "was not found on JSOC.")
+                    retries_notfound -= 1
+                interval = min(2 * interval, max(sleep, self.max_sleep))
+            # Raises an error if the request has failed
+            request.wait(verbose=False)
+            if progress:
+                print(f"Export request {request.id} has been staged.")
+            return request
+
+        # Checking the status of a request only needs one connection at a time
+        executor = ThreadPoolExecutor(max_workers=min(len(requests), JSOC_MAX_CONN))
+        try:
+            futures = [executor.submit(wait, request) for request in requests]
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            stop.set()
+            executor.shutdown()
+
+    def _get_path(self, path):
+        """
+        Get the path template, including ``{file}``, to save the data to.
+        """
         if path is None:
             default_dir = config.get("downloads", "download_dir")
             path = os.path.join(default_dir, '{file}')
@@ -562,45 +682,55 @@ class JSOCClient(BaseClient):
 
         if isinstance(path, str) and '{file}' not in path:
             path = os.path.join(path, '{file}')
+        return path
 
-        paths = []
-        for request in requests:
-            if request.method == 'url-tar':
-                fname = path.format(file=Path(request.tarfile).name)
-                paths.append(os.path.expanduser(fname))
-            else:
-                for filename in request.data['filename']:
-                    # Ensure we don't duplicate the file extension
-                    ext = os.path.splitext(filename)[1]
-                    if path.endswith(ext):
-                        fname = path.strip(ext)
-                    else:
-                        fname = path
-                    fname = fname.format(file=filename)
-                    fname = os.path.expanduser(fname)
-                    paths.append(fname)
-
-        dl_set = True
+    def _get_downloader(self, downloader, progress, overwrite, max_conn, kwargs):
+        """
+        Get the downloader to use, making sure it stays within the number of
+        parallel connections JSOC allows.
+
+        ``kwargs``, the keyword arguments for ``enqueue_file``, are updated
+        in place.
+        """
+        kwargs['max_splits'] = kwargs.get('max_splits', 2)
         if not downloader:
-            dl_set = False
             downloader = Downloader(progress=progress, overwrite=overwrite, max_conn=max_conn)
 
-        if downloader.max_conn * kwargs['max_splits'] > 10:
+        if downloader.max_conn * kwargs['max_splits'] > JSOC_MAX_CONN:
             warnings.warn(("JSOC does not support more than 10 parallel connections. " +
                            f"Changing the number of parallel connections to {2 * self.default_max_conn}."),
                           SunpyUserWarning)
             kwargs['max_splits'] = 2
             downloader.max_conn = self.default_max_conn
+        return downloader
 
-        urls = []
-        for request in requests:
-            if request.status == 0:
-                if request.protocol == 'as-is' or request.method == 'url-tar':
-                    urls.extend(list(request.urls.url))
+    def _enqueue_request(self, downloader, request, path, progress=True, **kwargs):
+        """
+        Queue the files of a staged export request for download.
+        """
+        if request.method == 'url-tar':
+            paths = [os.path.expanduser(path.format(file=Path(request.tarfile).name))]
+        else:
+            paths = []
+            for filename in request.data['filename']:
+                # Ensure we don't duplicate the file extension
+                ext = os.path.splitext(filename)[1]
+                if path.endswith(ext):
+                    fname = path.strip(ext)
                 else:
-                    for index, data in request.data.iterrows():
-                        url_dir = request.request_url + '/'
-                        urls.append(urllib.parse.urljoin(url_dir, data['filename']))
+                    fname = path
+                fname = fname.format(file=filename)
+                fname = os.path.expanduser(fname)
+                paths.append(fname)
+
+        urls = []
+        if request.status == 0:
+            if request.protocol == 'as-is' or request.method == 'url-tar':
+                urls.extend(list(request.urls.url))
+            else:
+                for index, data in request.data.iterrows():
+                    url_dir = request.request_url + '/'
+                    urls.append(urllib.parse.urljoin(url_dir, data['filename']))
 
         if urls:
             if progress:
@@ -609,12 +739,6 @@ class JSOCClient(BaseClient):
             for aurl, fname in zip(urls, paths):
                 downloader.enqueue_file(aurl, filename=fname, **kwargs)
 
-        if dl_set and not wait:
-            return Results()
-
-        results = downloader.download()
-        return results
-
     def _make_recordset(self, series, start_time='', end_time='', wavelength='',
                         segment='', primekey={}, **kwargs):
         """
@@ -749,13 +873,11 @@ class JSOCClient(BaseClient):
 
         # Extract and format primekeys
         pkstr = ''
-        c = drms.Client()
-        si = c.info(series)
-        pkeys_isTime = si.keywords.loc[si.primekeys].is_time
-        for pkey in pkeys_isTime.index.values:
+        si = self._series_info(series)
+        for pkey in si['primekeys']:
             # The loop is iterating over the list of prime-keys existing for the given series.
             if len(primekey) > 0:
-                if pkeys_isTime[pkey]:
+                if pkey in si['time_primekeys']:
                     pkstr += '[{}]'.format(primekey.pop('TIME', ''))
                 else:
                     pkstr += '[{}]'.format(primekey.pop(pkey, ''))
@@ -784,12 +906,12 @@ class JSOCClient(BaseClient):
         """
 
         isMeta = iargs.get('meta', False)
-        c = drms.Client()
+        c = self._drms_client
 
         if isMeta:
             keywords = '**ALL**'
         else:
-            keywords = iargs.get('keys', '**ALL**')
+            keywords = iargs.get('keys')
         # TODO: keywords should be set only to '**ALL**' post 3.0
         # All checks done above should be removed.
 
@@ -797,7 +919,7 @@ class JSOCClient(BaseClient):
             error_message = "Series must be specified for a JSOC Query"
             raise ValueError(error_message)
 
-        if not isinstance(keywords, list) and not isinstance(keywords, str):
+        if keywords is not None and not isinstance(keywords, (list, str)):
             error_message = "Keywords can only be passed as a list or "\
                             "comma-separated strings."
             raise TypeError(error_message)
@@ -805,7 +927,8 @@ class JSOCClient(BaseClient):
         # Raise errors for PrimeKeys
         # Get a set of the PrimeKeys that exist for the given series, and check
         # whether the passed PrimeKeys is a subset of that.
-        pkeys = c.pkeys(iargs['series'])
+        si = self._series_info(iargs['series'])
+        pkeys = list(si['primekeys'])
         pkeys_passed = iargs.get('primekey', None)  # pkeys_passes is a dict, with key-value pairs.
         if pkeys_passed is not None:
             if not set(list(pkeys_passed.keys())) <= set(pkeys):
@@ -824,8 +947,7 @@ class JSOCClient(BaseClient):
         # Raise errors for segments
         # Get a set of the segments that exist for the given series, and check
         # whether the passed segments is a subset of that.
-        si = c.info(iargs['series'])
-        segs = list(si.segments.index.values)          # Fetches all valid segment names
+        segs = list(si['segments'])          # Fetches all valid segment names
         segs_passed = iargs.get('segment', None)
         if segs_passed is not None:
 
@@ -849,6 +971,9 @@ class JSOCClient(BaseClient):
 
         ds = self._make_recordset(**iargs)
 
+        if keywords is None:
+            keywords = self._default_keywords(si)
+
         # Convert the list of keywords into comma-separated string.
         if isinstance(keywords, list):
             key = str(keywords)[1:-1].replace(' ', '').replace("'", '')
@@ -868,6 +993,36 @@ class JSOCClient(BaseClient):
         else:
             return astropy.table.Table.from_pandas(r)
 
+    def _series_info(self, series):
+        """
+        Get the information about a series, from ``series_cache`` if it is
+        there.
+
+        The information is a `dict` of the names of the prime keys, of those
+        prime keys which are times, of the segments and of the keywords.
+        """
+        name = series.lower()
+        info = series_cache.find(name)
+        if info is None:
+            si = self._drms_client.info(name)
+            info = {'primekeys': list(si.primekeys),
+                    'time_primekeys': [key for key in si.primekeys if si.keywords.loc[key, 'is_time']],
+                    'segments': list(si.segments.index),
+                    'keywords': list(si.keywords.index)}
+            series_cache.store(name, info)
+        return info
+
+    def _default_keywords(self, si):
+        """
+        The keywords of a series to fetch when none are given, which are those
+        in ``default_keys`` and the prime keys.
+        """
+        if isinstance(self.default_keys, str):
+            return self.default_keys
+        keywords = [key for key in self.default_keys if key in si['keywords']]
+        keywords += [key for key in si['primekeys'] if key not in keywords]
+        return keywords
+
     @classmethod
     def _can_handle_query(cls, *query):
         # Import here to prevent circular imports
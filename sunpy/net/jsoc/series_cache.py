@@ -0,0 +1,66 @@
+"""
+A cache of the information about JSOC series.
+"""
+import astropy.units as u
+
+from sunpy.data.data_manager import ExpiringSqliteStorage
+
+__all__ = ['SeriesCache']
+
+
+class SeriesCache:
+    """
+    SeriesCache stores the information about JSOC series, that is their prime
+    keys, segments and keywords, so that `~sunpy.net.jsoc.JSOCClient` does
+    not have to request it again for every search.
+
+    The information about a series is stored as a `dict`, which has to be
+    serializable to JSON.
+
+    Parameters
+    ----------
+    path : `str` or `pathlib.Path`
+        Path to the sqlite database file.
+    expiry : `astropy.units.Quantity`, optional
+        How long the information about a series is kept. Defaults to 1 day.
+    """
+
+    def __init__(self, path, expiry=1*u.day):
+        self._storage = ExpiringSqliteStorage(path, 'series')
+        self._expiry = expiry
+
+    def find(self, name):
+        """
+        Find the stored information about a series.
+
+        Parameters
+        ----------
+        name : `str`
+            The name of the series, in lower case.
+
+        Returns
+        -------
+        `dict` or `None`
+            The information about the series, or `None` if there is no
+            unexpired information about it.
+        """
+        return self._storage.find([name]).get(name)
+
+    def store(self, name, info):
+        """
+        Store the information about a series.
+
+        Parameters
+        ----------
+        name : `str`
+            The name of the series, in lower case.
+        info : `dict`
+            The information about the series, serializable to JSON.
+        """
+        self._storage.store([(name, info, self._expiry)])
+
+    def clear(self):
+        """
+        Remove all the stored information.
+        """
+        self._storage.clear()
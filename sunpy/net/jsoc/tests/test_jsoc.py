@@ -1,7 +1,11 @@
 import os
+import json
 import tempfile
 from unittest import mock
+from urllib.parse import parse_qs, urlparse
+from http.server import BaseHTTPRequestHandler
 
+import drms
 import pandas as pd
 import pytest
 from parfive import Results
@@ -15,6 +19,7 @@ import sunpy.data.test
 import sunpy.map
 import sunpy.net.attrs as a
 from sunpy.net.jsoc import JSOCClient, JSOCResponse
+from sunpy.net.jsoc.jsoc import NotExportedError
 from sunpy.util.exceptions import SunpyDeprecationWarning, SunpyUserWarning
 
 
@@ -35,6 +40,71 @@ def jsoc_response_double():
     return resp
 
 
+@pytest.fixture
+def local_jsoc(http_server):
+    """
+    A stand-in for the JSOC export service, on which each export request is
+    pending for a given number of status checks.
+    """
+    polls = []
+    pending = {}
+    failed = set()
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path.endswith('jsoc_fetch'):
+                requestid = parse_qs(url.query)['requestid'][0]
+                polls.append(requestid)
+                if pending[requestid] > 0:
+                    pending[requestid] -= 1
+                    d = {'status': 1, 'requestid': requestid}
+                elif requestid in failed:
+                    d = {'status': 4, 'requestid': requestid, 'error': 'Export failed'}
+                else:
+                    d = {'status': 0, 'requestid': requestid, 'method': 'url', 'protocol': 'fits',
+                         'dir': f'/SUM/{requestid}', 'size': 1,
+                         'data': [{'record': f'{requestid}[{i}]', 'filename': f'{requestid}_{i}.fits'}
+                                  for i in range(2)]}
+                body = json.dumps(d).encode()
+            else:
+                body = url.path.encode()
+            self.send_response(200)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    baseurl = http_server(Handler).url
+    drms_client = drms.Client(server=drms.ServerConfig(name='local', cgi_baseurl=baseurl + 'cgi-bin/ajax/',
+                                                       cgi_jsoc_info='jsoc_info', cgi_jsoc_fetch='jsoc_fetch',
+                                                       http_download_baseurl=baseurl))
+
+    def export(requestid, npending, fail=False):
+        pending[requestid] = npending
+        if fail:
+            failed.add(requestid)
+        return drms_client.export_from_id(requestid)
+
+    return export, polls
+
+
+@pytest.fixture
+def series_info(mocker, series_cache):
+    """
+    The information about a made up series, which is requested from JSOC
+    through ``drms.Client.info``.
+    """
+    d = {'status': 0, 'primekeys': ['T_REC', 'CAMERA'], 'links': [],
+         'keywords': [{'name': name, 'type': type} for name, type in
+                      [('T_REC', 'time'), ('CAMERA', 'int'), ('TELESCOP', 'string'),
+                       ('INSTRUME', 'string'), ('CAR_ROT', 'int'), ('T_OBS', 'time')]],
+         'segments': [{'name': 'image'}]}
+    return mocker.patch('drms.Client.info', return_value=drms.SeriesInfo(d, name='hmi.test_45s'))
+
+
 def test_jsocresponse_single():
     j1 = JSOCResponse(data=[[1, 2, 3, 4]])
     assert all(j1 == astropy.table.Table(data=[[1, 2, 3, 4]]))
@@ -475,3 +545,100 @@ def test_row_and_warning(mocker, client, jsoc_response_double):
         client.fetch(jsoc_response_double[0], sleep=0)
 
     assert request_data.called_once_with(jsoc_response_double[0].as_table())
+
+
+def test_fetch_concurrent_staging(mocker, client, jsoc_response_double, local_jsoc, tmp_path):
+    export, polls = local_jsoc
+    requests = [export('JSOC_A', 3), export('JSOC_B', 1)]
+    mocker.patch("sunpy.net.jsoc.jsoc.JSOCClient.request_data", return_value=requests)
+    files = client.fetch(jsoc_response_double, path=tmp_path, sleep=0.1, progress=False)
+
+    assert sorted(files) == sorted(str(tmp_path / f'JSOC_{r}_{i}.fits') for r in 'AB' for i in range(2))
+    assert (tmp_path / 'JSOC_B_1.fits').read_text() == '/SUM/JSOC_B/JSOC_B_1.fits'
+    # B is checked while A is still pending, rather than after A has been staged
+    polls = polls[2:]
+    assert len(polls) == 4
+    assert polls.index('JSOC_B') < len(polls) - 1 - polls[::-1].index('JSOC_A')
+
+
+def test_fetch_enqueue_when_staged(mocker, client, jsoc_response_double, local_jsoc, tmp_path):
+    export, polls = local_jsoc
+    requests = [export('JSOC_A', 2), export('JSOC_B', 0)]
+    mocker.patch("sunpy.net.jsoc.jsoc.JSOCClient.request_data", return_value=requests)
+    downloader = mock.MagicMock(max_conn=2)
+    results = client.fetch(jsoc_response_double, path=tmp_path, sleep=0.1, progress=False,
+                           downloader=downloader, wait=False)
+
+    assert len(results) == 0
+    assert not downloader.download.called
+    urls = [call.args[0] for call in downloader.enqueue_file.call_args_list]
+    assert [url.rsplit('/', 1)[-1] for url in urls] == ['JSOC_B_0.fits', 'JSOC_B_1.fits',
+                                                        'JSOC_A_0.fits', 'JSOC_A_1.fits']
+
+
+def test_fetch_progress_message(mocker, client, jsoc_response_double, local_jsoc, tmp_path, capsys):
+    export, polls = local_jsoc
+    mocker.patch("sunpy.net.jsoc.jsoc.JSOCClient.request_data", return_value=[export('JSOC_A', 0)])
+    client.fetch(jsoc_response_double, path=tmp_path, sleep=0.1, progress=True,
+                 downloader=mock.MagicMock(max_conn=2), wait=False)
+    assert "2 URLs found for download. Full request totalling 1MB" in capsys.readouterr().out
+
+
+def test_fetch_export_failed(mocker, client, jsoc_response_double, local_jsoc, tmp_path):
+    export, polls = local_jsoc
+    requests = [export('JSOC_A', 100), export('JSOC_B', 1, fail=True)]
+    mocker.patch("sunpy.net.jsoc.jsoc.JSOCClient.request_data", return_value=requests)
+    with pytest.raises(drms.DrmsExportError, match='Export failed'):
+        client.fetch(jsoc_response_double, path=tmp_path, sleep=0.1, progress=False)
+    # Checking A stops once B has failed
+    assert polls.count('JSOC_A') < 5
+
+
+def test_fetch_not_found(mocker, client, jsoc_response_double, local_jsoc, tmp_path):
+    export, polls = local_jsoc
+    requests = [export('JSOC_A', 0)]
+    requests[0]._status = 6
+    mocker.patch("sunpy.net.jsoc.jsoc.JSOCClient.request_data", return_value=requests)
+    mocker.patch.object(client, 'retries_notfound', 0)
+    mocker.patch.object(requests[0], 'has_finished', return_value=False)
+    with pytest.raises(NotExportedError, match='JSOC_A was not found'):
+        client.fetch(jsoc_response_double, path=tmp_path, sleep=0, progress=False)
+
+
+def test_search_series_info_cached(mocker, series_info, series_cache):
+    query = mocker.patch('drms.Client.query', return_value=pd.DataFrame({'T_REC': ['2014.01.01_00:00:45_TAI'],
+                                                                          'CAMERA': [1]}))
+    client = JSOCClient()
+    assert JSOCClient()._drms_client is client._drms_client
+    res = client.search(a.Time('2014-01-01T00:00:00', '2014-01-01T00:01:00'),
+                        a.jsoc.Series('hmi.test_45s') | a.jsoc.Series('hmi.Test_45s'))
+    assert len(res) == 2
+    # One request for the information about the series, which another client then reuses
+    assert series_info.call_count == 1
+    assert series_cache.find('hmi.test_45s') == {
+        'primekeys': ['T_REC', 'CAMERA'], 'time_primekeys': ['T_REC'], 'segments': ['image'],
+        'keywords': ['T_REC', 'CAMERA', 'TELESCOP', 'INSTRUME', 'CAR_ROT', 'T_OBS']}
+    JSOCClient().search(a.Time('2014-01-01T00:00:00', '2014-01-01T00:01:00'),
+                        a.jsoc.Series('hmi.test_45s'), a.jsoc.Segment('image'))
+    assert series_info.call_count == 1
+
+    # Only the keywords of the table are fetched by default
+    assert query.call_args.kwargs['key'] == 'T_REC,TELESCOP,INSTRUME,CAR_ROT,CAMERA'
+    with pytest.warns(SunpyDeprecationWarning):
+        client.search(a.Time('2014-01-01T00:00:00', '2014-01-01T00:01:00'),
+                      a.jsoc.Series('hmi.test_45s'), a.jsoc.Keys('T_OBS'))
+    assert query.call_args.kwargs['key'] == 'T_OBS'
+    mocker.patch.object(client, 'default_keys', '**ALL**')
+    client.search(a.Time('2014-01-01T00:00:00', '2014-01-01T00:01:00'), a.jsoc.Series('hmi.test_45s'))
+    assert query.call_args.kwargs['key'] == '**ALL**'
+
+
+def test_search_series_info_error(mocker, series_info):
+    client = JSOCClient()
+    with pytest.raises(ValueError, match='Unexpected PrimeKeys were passed'):
+        client.search(a.Time('2014-01-01T00:00:00', '2014-01-01T00:01:00'),
+                      a.jsoc.Series('hmi.test_45s'), a.jsoc.PrimeKey('HARPNUM', '4864'))
+    with pytest.raises(ValueError, match='Unexpected Segments were passed'):
+        client.search(a.Time('2014-01-01T00:00:00', '2014-01-01T00:01:00'),
+                      a.jsoc.Series('hmi.test_45s'), a.jsoc.Segment('bitmap'))
+    assert series_info.call_count == 1
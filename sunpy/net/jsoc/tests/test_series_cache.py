@@ -0,0 +1,28 @@
+import time
+from unittest.mock import patch
+
+import pytest
+
+import astropy.units as u
+
+from sunpy.net.jsoc.series_cache import SeriesCache
+
+
+@pytest.fixture
+def series_cache(tmp_path):
+    return SeriesCache(tmp_path / 'jsoc_series.db', expiry=1*u.hour)
+
+
+def test_series_cache_store(series_cache):
+    info = {'primekeys': ['T_REC', 'CAMERA'], 'keywords': [{'name': 'T_REC', 'type': 'time'}]}
+    assert series_cache.find('hmi.v_45s') is None
+    series_cache.store('hmi.v_45s', info)
+    assert series_cache.find('hmi.v_45s') == info
+    assert series_cache.find('hmi.m_45s') is None
+
+    # Expired information is not found
+    with patch('sunpy.data.data_manager.storage.time.time', return_value=time.time() + 7200):
+        assert series_cache.find('hmi.v_45s') is None
+
+    series_cache.clear()
+    assert series_cache.find('hmi.v_45s') is None
@@ -1,7 +1,11 @@
 import os
+import time
 import pathlib
 from stat import S_IREAD, S_IRGRP, S_IROTH
 from unittest import mock
+from http.server import BaseHTTPRequestHandler
+from urllib.request import urlopen
+from concurrent.futures import ThreadPoolExecutor
 
 import hypothesis.strategies as st
 import pytest
@@ -17,10 +21,10 @@ from sunpy import config
 from sunpy.net import Fido, attr
 from sunpy.net import attrs as a
 from sunpy.net import jsoc
-from sunpy.net.base_client import QueryResponseColumn, QueryResponseRow, QueryResponseTable
+from sunpy.net.base_client import BaseClient, QueryResponseColumn, QueryResponseRow, QueryResponseTable
 from sunpy.net.dataretriever.client import QueryResponse
 from sunpy.net.dataretriever.sources.goes import XRSClient
-from sunpy.net.fido_factory import UnifiedResponse
+from sunpy.net.fido_factory import UnifiedDownloaderFactory, UnifiedResponse
 from sunpy.net.tests.strategies import goes_time, offline_instruments, online_instruments, srs_time, time_attr
 from sunpy.net.vso import VSOQueryResponseTable
 from sunpy.net.vso.vso import DownloadFailed
@@ -553,3 +557,90 @@ def test_path_format_keys():
 
     with pytest.warns(SunpyDeprecationWarning):
         assert unif.response_block_properties() == {'_excite_'}
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """
+    Serve ``/<delay>/<status>`` by waiting ``delay`` seconds and then
+    responding with ``status``.
+    """
+    def do_GET(self):
+        delay, status = self.path.strip('/').split('/')
+        time.sleep(float(delay))
+        self.send_response(int(status))
+        self.end_headers()
+        self.wfile.write(self.path.encode())
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stand_in_fido(http_server):
+    """
+    A Fido instance with three clients, each of which searches a local
+    stand-in HTTP server.
+    """
+    server = http_server(_StandInHandler)
+
+    class StandInClient(BaseClient):
+        path = '0/200'
+
+        def search(self, *query):
+            with urlopen(server.url + self.path) as response:
+                return QueryResponseTable({'Path': [response.read().decode()]}, client=self)
+
+        def fetch(self, *args, **kwargs):
+            return NotImplemented
+
+        @classmethod
+        def _can_handle_query(cls, *query):
+            return any(isinstance(x, a.Instrument) and x.value == 'standin' for x in query)
+
+    class SlowStandInClient(StandInClient):
+        path = '2/200'
+
+    class BrokenStandInClient(StandInClient):
+        path = '0/500'
+
+    clients = [StandInClient, SlowStandInClient, BrokenStandInClient]
+    try:
+        yield UnifiedDownloaderFactory(registry={client: client._can_handle_query for client in clients},
+                                       additional_validation_functions=['_can_handle_query'])
+    finally:
+        for client in clients:
+            BaseClient._registry.pop(client, None)
+
+
+def test_search_concurrent_partial_results(stand_in_fido):
+    with pytest.warns(SunpyUserWarning) as record:
+        results = stand_in_fido.search(a.Instrument('standin'), timeout=0.5)
+    messages = sorted(str(w.message) for w in record)
+    assert len(messages) == 2
+    assert messages[0].startswith('The BrokenStandInClient search failed with error: HTTP Error 500')
+    assert messages[1] == ('The SlowStandInClient search did not finish within 0.5 seconds, '
+                           'its results have been dropped.')
+
+    assert len(results) == 1
+    assert results.keys() == ['standin']
+    assert results[0]['Path'][0] == '/0/200'
+
+
+def test_search_concurrent_order(stand_in_fido):
+    registry = stand_in_fido.registry
+    stand_in_fido.registry = {client: check for client, check in registry.items()
+                              if client.__name__ != 'BrokenStandInClient'}
+    serial = stand_in_fido.search(a.Instrument('standin'))
+    with ThreadPoolExecutor(2) as executor:
+        concurrent = stand_in_fido.search(a.Instrument('standin'), executor=executor)
+
+    assert [r['Path'][0] for r in serial] == ['/0/200', '/2/200']
+    assert [r['Path'][0] for r in concurrent] == ['/0/200', '/2/200']
+
+    with pytest.raises(ValueError, match='Only one of workers and executor can be specified.'):
+        stand_in_fido.search(a.Instrument('standin'), workers=2, executor=executor)
+
+
+def test_search_serial_raises(stand_in_fido):
+    with pytest.raises(Exception, match='HTTP Error 500'):
+        stand_in_fido.search(a.Instrument('standin'))
@@ -8,8 +8,10 @@ from astropy.coordinates import BaseCoordinateFrame, Longitude, SkyCoord
 from astropy.time import TimeDelta
 
 from sunpy.coordinates import Heliocentric, HeliographicStonyhurst, Helioprojective, get_earth
-from sunpy.coordinates.transformations import transform_with_sun_center
+from sunpy.coordinates.transformations import _affine_params_hcrs_to_hgs, transform_with_sun_center
 from sunpy.map import (
+    GenericMap,
+    MapSequence,
     contains_full_disk,
     coordinate_is_on_solar_disk,
     is_all_off_disk,
@@ -22,7 +24,8 @@ from sunpy.sun.constants import sidereal_rotation_rate
 from sunpy.time import parse_time
 from sunpy.util import expand_list
 
-__all__ = ['diff_rot', 'solar_rotate_coordinate', 'differential_rotate']
+__all__ = ['diff_rot', 'solar_rotate_coordinate', 'differential_rotate',
+           'differential_rotate_sequence']
 
 
 @u.quantity_input
@@ -499,6 +502,190 @@ def _warp_sun_coordinates(xy, smap, new_observer, **diff_rot_kwargs):
     return xy2
 
 
+def _observer_position(observer):
+    """
+    Returns the heliographic Stonyhurst longitude and latitude (in radians)
+    and distance from the Sun (in meters) of an observer at its obstime.
+    """
+    observer = observer.transform_to(HeliographicStonyhurst(obstime=observer.obstime))
+    return (observer.lon.to_value(u.rad), observer.lat.to_value(u.rad),
+            observer.radius.to_value(u.m))
+
+
+def _hgs_to_hcc_matrix(lon, lat):
+    """
+    Returns the rotation matrix from heliographic Stonyhurst Cartesian
+    coordinates to heliocentric Cartesian coordinates for an observer at the
+    given longitude and latitude (in radians).
+    """
+    sin_lon, cos_lon = np.sin(lon), np.cos(lon)
+    sin_lat, cos_lat = np.sin(lat), np.cos(lat)
+    return np.array([[-sin_lon, cos_lon, 0],
+                     [-sin_lat * cos_lon, -sin_lat * sin_lon, cos_lat],
+                     [cos_lat * cos_lon, cos_lat * sin_lon, sin_lat]])
+
+
+def _hgs_rotation_matrix(obstime, cache):
+    """
+    Returns the rotation matrix from HCRS to heliographic Stonyhurst at a
+    time, which is used to move heliographic Stonyhurst coordinates between
+    obstimes while ignoring the translational motion of the Sun.
+    """
+    key = ('hgs', obstime.jd1, obstime.jd2)
+    if key not in cache:
+        cache[key] = _affine_params_hcrs_to_hgs(obstime, obstime)[0]
+    return cache[key]
+
+
+def _solar_lattice(smap, wcs, observer, cache, **diff_rot_kwargs):
+    """
+    Returns the positions on the Sun seen by an observer in each of the
+    pixels of a map, and their rates of differential rotation, as plain
+    arrays.
+
+    The pixel to world transformation of the map is used with the observer
+    replaced by ``observer``, exactly as `_warp_sun_coordinates` does.  The
+    positions are returned as the heliographic Stonyhurst longitude (in
+    radians), the distance from the solar rotation axis and the height above
+    the solar equator (in meters).  Points off the disk are NaN.  The lattice
+    only depends on the pointing of the map and the observer, so it is cached
+    and shared between maps.
+    """
+    position = _observer_position(observer)
+    # The frame of the new observer uses the default solar radius
+    rsun = Helioprojective(obstime=observer.obstime).rsun.to_value(u.m)
+    key = ('lattice', smap.data.shape, wcs.wcs.crpix.tobytes(), wcs.wcs.cdelt.tobytes(),
+           wcs.wcs.crval.tobytes(), wcs.wcs.get_pc().tobytes(), tuple(wcs.wcs.ctype),
+           position, rsun, tuple(sorted(diff_rot_kwargs.items())))
+    if key in cache:
+        return cache[key]
+
+    ny, nx = smap.data.shape
+    x, y = np.meshgrid(np.arange(nx), np.arange(ny))
+    tx, ty = wcs.pixel_to_world_values(x, y)
+    tx = (tx * u.Unit(wcs.world_axis_units[0])).to_value(u.rad)
+    ty = (ty * u.Unit(wcs.world_axis_units[1])).to_value(u.rad)
+
+    lon, lat, distance = position
+    with np.errstate(invalid='ignore'):
+        # Intersect each line of sight with the solar surface, as
+        # Helioprojective.make_3d does, to get heliocentric Cartesian coordinates
+        cos_ty = np.cos(ty)
+        cos_angle = cos_ty * np.cos(tx)
+        depth = distance * cos_angle
+        depth -= np.sqrt(depth**2 - distance**2 + rsun**2)
+        hcc = np.stack([depth * cos_ty * np.sin(tx),
+                        depth * np.sin(ty),
+                        distance - depth * cos_angle])
+        hgs_x, hgs_y, hgs_z = np.tensordot(_hgs_to_hcc_matrix(lon, lat).T, hcc, axes=1)
+
+        # The amount of differential rotation is proportional to the duration,
+        # so only calculate it once for each pixel.
+        latitude = np.arctan2(hgs_z, np.hypot(hgs_x, hgs_y)) * u.rad
+        rate = diff_rot(1 * u.s, latitude, **diff_rot_kwargs).to_value(u.rad)
+
+    lattice = (np.arctan2(hgs_y, hgs_x), rate, np.hypot(hgs_x, hgs_y), hgs_z)
+    cache[key] = lattice
+    return lattice
+
+
+def _gnomonic_projection(wcs):
+    """
+    Returns the parameters of the gnomonic (TAN) projection of a WCS in terms
+    of helioprojective Cartesian vectors, or `None` if the WCS is not a plain
+    gnomonic projection.
+
+    For a vector ``v`` along a line of sight, with components towards the
+    Sun, towards positive Tx and towards positive Ty, the pixel coordinates are
+    ``matrix @ v / (reference @ v) + reference_pixel``.
+    """
+    w = wcs.wcs
+    if (wcs.naxis != 2 or wcs.has_distortion or w.lonpole != 180 or
+            not all(ctype.endswith('-TAN') for ctype in w.ctype)):
+        return None
+
+    lon, lat = [(crval * u.Unit(cunit)).to_value(u.rad) for crval, cunit in zip(w.crval, w.cunit)]
+    # The direction of the reference coordinate, and the directions of
+    # increasing longitude and latitude there
+    reference = np.array([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)])
+    tangent = np.array([[-np.sin(lon), np.cos(lon), 0],
+                        [-np.sin(lat) * np.cos(lon), -np.sin(lat) * np.sin(lon), np.cos(lat)]])
+    tangent *= [[(1 * u.rad).to_value(cunit)] for cunit in w.cunit]
+    # Intermediate world coordinates to pixel offsets
+    matrix = np.linalg.inv(w.get_cdelt()[:, np.newaxis] * w.get_pc()) @ tangent
+    return reference, matrix, w.crpix - 1
+
+
+def _rotated_pixel_coordinates(smap, new_observer, cache, **diff_rot_kwargs):
+    """
+    Calculates the pixel coordinates in a map of all the pixels in the
+    differentially rotated map, as seen by ``new_observer``.
+
+    This is equivalent to evaluating `_warp_sun_coordinates` for every pixel
+    of the map, but works on plain arrays rather than coordinate objects, and
+    reuses the lattice of solar coordinates seen by ``new_observer`` and the
+    rotation matrices stored in ``cache``.
+
+    Returns
+    -------
+    `numpy.ndarray`
+        An array of shape ``(2, ny, nx)`` holding the row and column
+        coordinates in the map, which can be passed to `skimage.transform.warp`
+        as the inverse map.
+    """
+    wcs = smap.wcs
+    lon, rate, rho, height = _solar_lattice(smap, wcs, new_observer, cache, **diff_rot_kwargs)
+
+    # The time interval between the new observer time and the map observation time.
+    new_obstime = parse_time(new_observer.obstime)
+    interval = (new_obstime - parse_time(smap.date)).to_value(u.s)
+
+    # The matrix from heliographic Stonyhurst at the new observer time to
+    # heliocentric Cartesian coordinates of the map observer, ignoring the
+    # translational motion of the Sun.
+    map_lon, map_lat, map_distance = _observer_position(smap.observer_coordinate)
+    matrix = (_hgs_to_hcc_matrix(map_lon, map_lat) @
+              _hgs_rotation_matrix(parse_time(smap.date), cache) @
+              _hgs_rotation_matrix(new_obstime, cache).T)
+
+    with np.errstate(invalid='ignore'):
+        # The change in longitude is negative because we are mapping from the
+        # new coordinates to the old.
+        rotated_lon = lon - rate * interval
+        hgs = np.stack([rho * np.cos(rotated_lon), rho * np.sin(rotated_lon), height])
+
+        projection = _gnomonic_projection(wcs)
+        if projection is not None:
+            # Project the lines of sight from the map observer straight onto
+            # the pixel grid.  The helioprojective Cartesian vector along the
+            # line of sight is (map_distance - z, x, y) in terms of the
+            # heliocentric Cartesian coordinates, so everything but the final
+            # division is linear in the heliographic Stonyhurst coordinates.
+            reference, projection_matrix, reference_pixel = projection
+            rows = np.vstack([reference, projection_matrix])
+            hpc_matrix = np.array([-matrix[2], matrix[0], matrix[1]])
+            distance, x2, y2, z = np.tensordot(np.vstack([rows @ hpc_matrix, matrix[2]]),
+                                               hgs, axes=1)
+            distance += reference[0] * map_distance
+            x2 = (x2 + projection_matrix[0, 0] * map_distance) / distance + reference_pixel[0]
+            y2 = (y2 + projection_matrix[1, 0] * map_distance) / distance + reference_pixel[1]
+            # As seen from the map observer, which coordinates are behind the Sun.
+            off_disk = (z < 0) | ~(distance > 0)
+        else:
+            x, y, z = np.tensordot(matrix, hgs, axes=1)
+            # As seen from the map observer, which coordinates are behind the Sun.
+            off_disk = z < 0
+            zeta = map_distance - z
+            tx = (np.arctan2(x, zeta) * u.rad).to_value(wcs.world_axis_units[0])
+            ty = (np.arctan2(y, np.hypot(x, zeta)) * u.rad).to_value(wcs.world_axis_units[1])
+            x2, y2 = wcs.world_to_pixel_values(tx, ty)
+
+    coordinates = np.stack([y2, x2])
+    # Set the off disk coordinates to NaN so they are not included in the output image.
+    coordinates[:, off_disk] = np.nan
+    return coordinates
+
+
 def differential_rotate(smap, observer=None, time=None, **diff_rot_kwargs):
     """
     Warp a `~sunpy.map.GenericMap` to take into account both solar differential
@@ -563,6 +750,16 @@ def differential_rotate(smap, observer=None, time=None, **diff_rot_kwargs):
     # Get the new observer
     new_observer = _get_new_observer(smap.date, observer, time)
 
+    return _differential_rotate(smap, new_observer, {}, **diff_rot_kwargs)
+
+
+def _differential_rotate(smap, new_observer, cache, **diff_rot_kwargs):
+    """
+    Differentially rotate a map to be seen by ``new_observer``.
+
+    ``cache`` is a dictionary that holds the solar lattices and rotation
+    matrices, which are shared by all the maps rotated with the same one.
+    """
     # Only this function needs scikit image
     from skimage import transform
 
@@ -632,13 +829,12 @@ def differential_rotate(smap, observer=None, time=None, **diff_rot_kwargs):
     else:
         smap_data = smap.data
 
-    # Create the arguments for the warp function.
-    warp_args = {'smap': smap, 'new_observer': new_observer}
-    warp_args.update(diff_rot_kwargs)
+    # Calculate where the pixels of the rotated map come from in the map
+    coordinates = _rotated_pixel_coordinates(smap, new_observer, cache, **diff_rot_kwargs)
 
     # Apply solar differential rotation as a scikit-image warp
-    out_data = transform.warp(smap_data, inverse_map=_warp_sun_coordinates,
-                              map_args=warp_args, preserve_range=True, cval=np.nan)
+    out_data = transform.warp(smap_data, inverse_map=coordinates,
+                              preserve_range=True, cval=np.nan)
 
     # Update the meta information with the new date and time.
     out_meta = deepcopy(smap.meta)
@@ -670,3 +866,91 @@ def differential_rotate(smap, observer=None, time=None, **diff_rot_kwargs):
         return smap._new_instance(out_data, out_meta).submap(rotated_bl, top_right=rotated_tr)
     else:
         return smap._new_instance(out_data, out_meta)
+
+
+def differential_rotate_sequence(maps, observer=None, time=None, **diff_rot_kwargs):
+    """
+    Warp several maps, or one map to several times, to take into account both
+    solar differential rotation and the changing location of the observer.
+
+    This gives the same results as calling
+    `~sunpy.physics.differential_rotation.differential_rotate` for each map,
+    but the positions on the Sun seen by each new observer are only
+    calculated once for all the maps with the same pointing, and the
+    ephemerides are only calculated once for each time.  This makes it much
+    faster to, for example, rotate a `~sunpy.map.MapSequence` to a common
+    time, or to rotate one map to many times.
+
+    Parameters
+    ----------
+    maps : `~sunpy.map.GenericMap`, `~sunpy.map.MapSequence`, `list`
+        The map, or maps, that we want to transform.
+    observer : `~astropy.coordinates.BaseCoordinateFrame`, `~astropy.coordinates.SkyCoord`, `None`, optional
+        The location of the new observer, or an array of the locations of new
+        observers.
+    time : sunpy-compatible time, `~astropy.time.TimeDelta`, `~astropy.units.Quantity`, `None`, optional
+        Used to define the duration over which the amount of solar rotation
+        is calculated, in the same way as for
+        `~sunpy.physics.differential_rotation.differential_rotate`.  This can
+        also be an array of times.
+
+    Returns
+    -------
+    `~sunpy.map.MapSequence`
+        If a single map is given, the map as seen by each of the new
+        observers.  If a single observer or time is given, each map as seen
+        by that observer.  Otherwise, there must be the same number of maps
+        and observers or times, and each map is rotated to the corresponding
+        observer or time.
+
+    Notes
+    -----
+    The translational motion of the Sun over the time interval will be ignored.
+    See :func:`~sunpy.coordinates.transform_with_sun_center`.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import astropy.units as u
+    >>> from sunpy.physics.differential_rotation import differential_rotate_sequence
+    >>> rotated = differential_rotate_sequence(sequence, time=sequence[0].date)  # doctest: +SKIP
+    >>> movie = differential_rotate_sequence(smap, time=np.arange(0, 24, 2) * u.hr)  # doctest: +SKIP
+    """
+    if isinstance(maps, GenericMap):
+        maps = [maps]
+    elif isinstance(maps, MapSequence):
+        maps = maps.maps
+    else:
+        maps = list(maps)
+
+    # If any of the maps are entirely off-disk, return an error so the user is aware.
+    for smap in maps:
+        if is_all_off_disk(smap):
+            raise ValueError("The entire map is off disk. No data to differentially rotate.")
+
+    _validate_observer_args(None, observer, time)
+    if observer is None and not isinstance(time, (TimeDelta, u.Quantity)):
+        time = parse_time(time)
+    target = time if observer is None else observer
+    n_targets = 1 if target.isscalar else len(target)
+    if len(maps) == 1:
+        maps = maps * n_targets
+    elif n_targets != 1 and n_targets != len(maps):
+        raise ValueError("The number of maps and the number of observers or times must "
+                         "be the same, unless there is only one of either.")
+
+    if observer is not None:
+        new_observers = [observer] * len(maps) if observer.isscalar else list(observer)
+    else:
+        warnings.warn("Using 'time' assumes an Earth-based observer.")
+        if isinstance(time, (TimeDelta, u.Quantity)):
+            new_observer_times = parse_time([smap.date for smap in maps]) + time
+        else:
+            new_observer_times = time + np.zeros(len(maps)) * u.s
+        # Calculate the positions of the Earth in one go
+        earth = get_earth(new_observer_times)
+        new_observers = [earth[i] for i in range(len(maps))]
+
+    cache = {}
+    return MapSequence([_differential_rotate(smap, new_observer, cache, **diff_rot_kwargs)
+                        for smap, new_observer in zip(maps, new_observers)], sortby=None)
@@ -15,14 +15,17 @@ from sunpy.coordinates.ephemeris import get_earth
 from sunpy.coordinates.metaframes import RotatedSunFrame
 from sunpy.coordinates.transformations import transform_with_sun_center
 from sunpy.map.maputils import map_edges
+from sunpy.physics import differential_rotation
 from sunpy.physics.differential_rotation import (
     _get_bounding_coordinates,
     _get_extreme_position,
     _get_new_observer,
     _rotate_submap_edge,
+    _rotated_pixel_coordinates,
     _warp_sun_coordinates,
     diff_rot,
     differential_rotate,
+    differential_rotate_sequence,
     solar_rotate_coordinate,
 )
 
@@ -301,6 +304,48 @@ def test_differential_rotate_time_off_disk(all_off_disk_map):
         differential_rotate(all_off_disk_map, time=new_time)
 
 
+# ----- Testing with several maps or times -----
+def test_differential_rotate_sequence_times(straddles_limb_map):
+    times = straddles_limb_map.date + [6, 24, -48]*u.hr
+    with pytest.warns(UserWarning, match="Using 'time' assumes an Earth-based observer"):
+        dmaps = differential_rotate_sequence(straddles_limb_map, time=times)
+    assert len(dmaps) == 3
+    for dmap, new_time in zip(dmaps, times):
+        with pytest.warns(UserWarning, match="Using 'time' assumes an Earth-based observer"):
+            expected = differential_rotate(straddles_limb_map, time=new_time)
+        assert dmap.date.isot == new_time.isot
+        assert dmap.data.shape == expected.data.shape
+        np.testing.assert_allclose(dmap.data, expected.data)
+
+
+def test_differential_rotate_sequence_maps(aia171_test_map):
+    maps = [aia171_test_map,
+            sunpy.map.Map(aia171_test_map.data,
+                          dict(aia171_test_map.meta, **{'date-obs': (aia171_test_map.date + 1*u.hr).isot}))]
+    new_observer = get_earth(aia171_test_map.date + 2*u.day)
+    dmaps = differential_rotate_sequence(sunpy.map.Map(maps, sequence=True), observer=new_observer)
+    for smap, dmap in zip(maps, dmaps):
+        expected = differential_rotate(smap, observer=new_observer)
+        assert dmap.date.isot == new_observer.obstime.isot
+        np.testing.assert_allclose(dmap.data, expected.data)
+    # The second map has rotated for an hour less
+    assert not np.allclose(dmaps[0].data, dmaps[1].data, equal_nan=True)
+
+    # Pairs of maps and observers
+    new_observers = get_earth(aia171_test_map.date + [1, 2]*u.day)
+    dmaps = differential_rotate_sequence(maps, observer=new_observers)
+    assert [dmap.date.isot for dmap in dmaps] == list(new_observers.obstime.isot)
+
+    with pytest.raises(ValueError, match="The number of maps"):
+        differential_rotate_sequence(maps * 2, observer=new_observers)
+
+
+def test_differential_rotate_sequence_off_disk(aia171_test_map, all_off_disk_map):
+    with pytest.raises(ValueError, match="The entire map is off disk"):
+        differential_rotate_sequence([aia171_test_map, all_off_disk_map],
+                                     time=aia171_test_map.date + 48*u.hr)
+
+
 # Tests of the helper functions
 def test_get_new_observer(aia171_test_map):
     initial_obstime = aia171_test_map.date
@@ -443,3 +488,19 @@ def test_differential_rotation(aia171_test_map):
     with pytest.warns(UserWarning, match="Using 'time' assumes an Earth-based observer"):
         rot_map = differential_rotate(aia171_test_map, time=2*u.day)
     return rot_map.data
+
+
+@pytest.mark.parametrize('gnomonic', [True, False])
+def test_rotated_pixel_coordinates(straddles_limb_map, gnomonic, monkeypatch):
+    if not gnomonic:
+        monkeypatch.setattr(differential_rotation, '_gnomonic_projection', lambda wcs: None)
+    new_observer = get_earth(straddles_limb_map.date + 2*u.day)
+    coordinates = _rotated_pixel_coordinates(straddles_limb_map, new_observer, {})
+    assert coordinates.shape == (2,) + straddles_limb_map.data.shape
+
+    ny, nx = straddles_limb_map.data.shape
+    x, y = np.meshgrid(np.arange(nx), np.arange(ny))
+    xy = _warp_sun_coordinates(np.stack([x.ravel(), y.ravel()], axis=1), straddles_limb_map,
+                               new_observer)
+    np.testing.assert_allclose(coordinates[1].ravel(), xy[:, 0], atol=1e-6)
+    np.testing.assert_allclose(coordinates[0].ravel(), xy[:, 1], atol=1e-6)
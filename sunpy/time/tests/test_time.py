@@ -5,7 +5,8 @@ import pandas
 import pytest
 
 import astropy.time
-from astropy.time import Time
+import astropy.units as u
+from astropy.time import Time, TimeDelta
 
 import sunpy.time as time
 from sunpy.time import is_time_equal, parse_time
@@ -343,6 +344,48 @@ def test_parse_time_list_3():
     assert np.all(parse_time(tstrings) == Time.strptime(tstrings, '%Y-%b-%d'))
 
 
+@pytest.mark.parametrize('fmt', time.time.TIME_FORMAT_LIST)
+def test_parse_time_list_formats(fmt):
+    step = (datetime(2012, 3, 1) - datetime(2011, 1, 1, 7, 3, 2)) / 7
+    tstrings = [(datetime(2012, 2, 28, 23, 59, 59, 999) + i * step).strftime(fmt) for i in range(8)]
+
+    times = parse_time(tstrings)
+
+    assert times.format == 'isot'
+    assert np.all(times.isot == [parse_time(tstring).isot for tstring in tstrings])
+    assert np.all(parse_time(np.array(tstrings)) == times)
+
+
+@pytest.mark.parametrize('tstrings', [
+    # The fields do not line up
+    ['2010/5/4', '2010/10/4', '2010/10/14'],
+    # The first format that matches the first string is not the right one
+    ['20070504T210812', '20070504T210813'],
+    ['2012:060:00:00:00', '2013:060:00:00:00', '2012:366:23:59:59'],
+    ['2007-May-04 21:08', '2007-jun-04 21:08'],
+])
+def test_parse_time_list_layouts(tstrings):
+    assert np.all(parse_time(tstrings) == Time([parse_time(tstring) for tstring in tstrings]))
+
+
+def test_parse_time_list_invalid():
+    with pytest.raises(ValueError):
+        parse_time(['2010-02-28', '2010-02-30'])
+    with pytest.raises(ValueError):
+        parse_time(['2010-02-28', '2010-02-28x'])
+
+
+def test_parse_time_str_cached():
+    t1 = parse_time('2007/05/04 21:08:12')
+    t1.format = 'jd'
+    t2 = parse_time('2007/05/04 21:08:12')
+
+    assert t2 is not t1
+    assert t2.format == 'isot'
+    assert t2 == t1
+    assert parse_time('2007/05/04 21:08:12', scale='tai').scale == 'tai'
+
+
 def test_is_time():
     assert time.is_time(datetime.utcnow()) is True
     assert time.is_time('2017-02-14 08:08:12.999') is True
@@ -355,3 +398,52 @@ def test_is_time():
 def test_is_time_in_given_format():
     assert time.is_time_in_given_format('2017-02-14 08:08:12.999', "%Y-%m-%d %H:%M:%S.%f") is True
     assert time.is_time_in_given_format('2017-02-14 08:08:12.999', "%Y-%m-%dT%H:%M:%S.%f") is False
+
+
+def test_parse_time_numpy_datetime_array_ns():
+    inputs = np.array(['2014-02-07T16:47:51.008288123', '2016-12-31T23:59:59.999999999',
+                       '1969-07-20T20:17:40'], dtype='datetime64[ns]')
+
+    dts = parse_time(inputs)
+
+    assert dts.format == 'isot'
+    assert dts.scale == 'utc'
+    assert np.all(dts == Time([str(dt) for dt in inputs]))
+
+
+@pytest.mark.parametrize('epoch', ['2011-06-07 00:00', '2016-12-31 12:00', '2001-01-01 00:00',
+                                   '2016.05.04_21:08:12_TAI'])
+def test_offsets_to_datetime64(epoch):
+    epoch = parse_time(epoch)
+    offsets = np.linspace(-0.038, 2 * 86400, 10001) * u.s
+    expected = epoch + TimeDelta(offsets)
+    expected.precision = 9
+
+    times = time.offsets_to_datetime64(epoch, offsets)
+
+    assert times.dtype == np.dtype('datetime64[ns]')
+    assert np.all(np.abs(times - expected.isot.astype('datetime64[ns]')) <= np.timedelta64(1, 'ns'))
+
+
+def test_offsets_to_datetime64_leap_seconds():
+    # The GBM mission elapsed time of 2017-01-01T00:00:00 counts the five
+    # leap seconds since 2001
+    times = time.offsets_to_datetime64('2001-01-01 00:00', [504921605] * u.s)
+    assert times[0] == np.datetime64('2017-01-01T00:00:00', 'ns')
+
+    # A time during a leap second is given as the start of the next second
+    times = time.offsets_to_datetime64('2016-12-31 23:59:59', [0.5, 1.5, 2, 2.5] * u.s)
+    assert np.all(times == np.array(['2016-12-31T23:59:59.5', '2017-01-01T00:00:00',
+                                     '2017-01-01T00:00:00', '2017-01-01T00:00:00.5'],
+                                    dtype='datetime64[ns]'))
+
+
+def test_offsets_to_datetime64_units():
+    times = time.offsets_to_datetime64('2015-01-01', np.arange(3) * u.min)
+    assert np.all(times == np.array(['2015-01-01T00:00', '2015-01-01T00:01', '2015-01-01T00:02'],
+                                    dtype='datetime64[ns]'))
+
+
+def test_offsets_to_datetime64_array_epoch():
+    with pytest.raises(ValueError, match='single time'):
+        time.offsets_to_datetime64(['2015-01-01', '2015-01-02'], [1] * u.s)
@@ -2,9 +2,10 @@
 This module provies a collection of time handing functions.
 """
 import re
+import calendar
 import textwrap
 from datetime import date, datetime
-from functools import singledispatch
+from functools import lru_cache, singledispatch
 
 import numpy as np
 
@@ -12,6 +13,11 @@ import astropy.time
 import astropy.units as u
 from astropy.time import Time, TimeDelta
 
+try:
+    import erfa
+except ModuleNotFoundError:
+    from astropy import _erfa as erfa
+
 # This is not called but imported to register it
 from sunpy.time.utime import TimeUTime  # NOQA
 from sunpy.util.decorators import add_common_docstring
@@ -19,7 +25,7 @@ from sunpy.util.decorators import add_common_docstring
 __all__ = [
     'find_time', 'parse_time', 'is_time',
     'is_time_in_given_format', 'is_time_equal',
-    'julian_centuries'
+    'julian_centuries', 'offsets_to_datetime64'
 ]
 
 # Mapping of time format codes to regular expressions.
@@ -66,6 +72,20 @@ TIME_FORMAT_LIST = [
 
 _ONE_DAY_TIMEDELTA = TimeDelta(1 * u.day)
 
+_NS_PER_SECOND = 10**9
+_ONE_SECOND = np.timedelta64(1, 's')
+
+# The number of parsed time strings, and of string layouts, that are kept
+_TIME_STRING_CACHE_SIZE = 1024
+
+_DIGITS_TO_ZERO = str.maketrans('123456789', '000000000')
+
+# The fields of the strings the bulk parser builds for astropy to parse, and
+# the position and width of each
+_ISOT_TEMPLATE = np.array(['0000-00-00T00:00:00.000000']).view(np.uint32)
+_ISOT_FIELDS = (('year', 0, 4), ('month', 5, 2), ('day', 8, 2), ('hour', 11, 2),
+                ('minute', 14, 2), ('second', 17, 2), ('microsecond', 20, 6))
+
 
 def is_time_equal(t1, t2):
     """
@@ -91,13 +111,38 @@ def _n_or_eq(a, b):
     return a is None or a == b
 
 
+@lru_cache(maxsize=_TIME_STRING_CACHE_SIZE)
+def _compile_format(format):
+    """
+    Compile the regular expression which matches a time format.
+    """
+    for key, value in REGEX.items():
+        format = format.replace(key, value)
+    return re.compile(format)
+
+
+@lru_cache(maxsize=_TIME_STRING_CACHE_SIZE)
+def _matching_formats(layout, time_formats):
+    """
+    The formats whose regular expression matches a time string.
+
+    Whether a string matches does not depend on the values of its digits, so
+    this is cached by the layout of the string, with every digit replaced by
+    a zero.
+    """
+    return tuple(time_format for time_format in time_formats
+                 if _compile_format(time_format).match(layout))
+
+
+def _candidate_formats(time_string):
+    return _matching_formats(time_string.translate(_DIGITS_TO_ZERO), tuple(TIME_FORMAT_LIST))
+
+
 def _regex_parse_time(inp, format):
     # Parser for finding out the minute value so we can adjust the string
     # from 24:00:00 to 00:00:00 the next day because strptime does not
     # understand the former.
-    for key, value in REGEX.items():
-        format = format.replace(key, value)
-    match = re.match(format, inp)
+    match = _compile_format(format).match(inp)
     if match is None:
         return None, None
     try:
@@ -120,10 +165,7 @@ def find_time(string, format):
 
     Currently supported format codes:
     """
-    re_format = format
-    for key, value in REGEX.items():
-        re_format = re_format.replace(key, value)
-    matches = re.finditer(re_format, string)
+    matches = _compile_format(format).finditer(string)
     for match in matches:
         try:
             matchstr = string[slice(*match.span())]
@@ -186,11 +228,33 @@ def convert_time_npdatetime64(time_string, **kwargs):
 
 
 @convert_time.register(np.ndarray)
-def convert_time_npndarray(time_string, **kwargs):
+def convert_time_npndarray(time_string, format=None, scale=None, **kwargs):
     if 'datetime64' in str(time_string.dtype):
-        return Time([str(dt.astype('M8[ns]')) for dt in time_string], **kwargs)
+        # Split the times into their calendar fields with integer arithmetic,
+        # rather than formatting every time as a string for astropy to parse
+        times = time_string.astype('M8[ns]')
+        days = times.astype('M8[D]')
+        months = days.astype('M8[M]')
+        nanoseconds = (times - days).astype(np.int64)
+        minutes, nanoseconds = np.divmod(nanoseconds, 60 * _NS_PER_SECOND)
+        hours, minutes = np.divmod(minutes, 60)
+        scale = scale or 'utc'
+        jd1, jd2 = erfa.dtf2d(scale.upper(),
+                              months.astype('M8[Y]').astype(int) + 1970,
+                              months.astype(int) % 12 + 1,
+                              (days - months).astype(int) + 1,
+                              hours, minutes, nanoseconds / _NS_PER_SECOND)
+        t = Time(jd1, jd2, format='jd', scale=scale, **kwargs)
+        t.format = format or 'isot'
+        return t
+    elif time_string.dtype.kind == 'U' and time_string.size and format is None:
+        try:
+            return Time(time_string, scale=scale, **kwargs)
+        except ValueError:
+            # Not one of the astropy string formats
+            return _convert_time_strings(time_string, scale=scale, **kwargs)
     else:
-        return convert_time.dispatch(object)(time_string, **kwargs)
+        return convert_time.dispatch(object)(time_string, format=format, scale=scale, **kwargs)
 
 
 @convert_time.register(astropy.time.Time)
@@ -204,15 +268,123 @@ def convert_time_list(time_list, format=None, **kwargs):
     # If we have a list of strings, need to get the correct format from our
     # list of custom formats.
     if isinstance(item, str) and format is None:
-        string_format = _get_time_fmt(item)
-        return Time.strptime(time_list, string_format, **kwargs)
+        return _convert_time_strings(time_list, **kwargs)
 
     # Otherwise return the default method
     return convert_time.dispatch(object)(time_list, format, **kwargs)
 
 
+def _convert_time_strings(time_strings, **kwargs):
+    """
+    Parse a sequence of time strings, in the first of the formats which match
+    the first string that they can all be parsed with.
+    """
+    strings = np.asarray(time_strings)
+    for time_format in _candidate_formats(str(strings.flat[0])):
+        try:
+            t = _bulk_strptime(strings, time_format, **kwargs)
+            if t is None:
+                t = Time.strptime(strings, time_format, **kwargs)
+            return t
+        except ValueError:
+            pass
+
+    # when no format matches, call default fucntion
+    return convert_time.dispatch(object)(time_strings, **kwargs)
+
+
+def _bulk_strptime(strings, time_format, **kwargs):
+    """
+    Parse time strings which all have the layout of the first one, by reading
+    their fields from a single array of characters instead of calling
+    `time.strptime` for every string.
+
+    Returns `None` if the strings can not be parsed this way, in which case
+    `astropy.time.Time.strptime` gives the result or the error.
+    """
+    if strings.dtype.kind != 'U' or strings.ndim != 1:
+        return None
+    first = str(strings[0])
+    match = _compile_format(time_format).match(first)
+    if match is None or match.end() != len(first) or 'microsecond' in match.groupdict() and \
+            len(match.group('microsecond')) > 6:
+        return None
+    try:
+        datetime.strptime(first, time_format)
+    except ValueError:
+        return None
+    if np.any(np.char.str_len(strings) != len(first)):
+        return None
+
+    chars = strings.astype(f'U{len(first)}').view(np.uint32).reshape(strings.size, len(first))
+    # Everything between the fields has to be the same in all of the strings
+    between = np.ones(len(first), dtype=bool)
+    fields = {}
+    for name in match.groupdict():
+        start, end = match.span(name)
+        between[start:end] = False
+        columns = chars[:, start:end]
+        if name == 'month_str':
+            names, inverse = np.unique(np.char.lower(columns.copy().view(f'U{end - start}').ravel()),
+                                       return_inverse=True)
+            months = {abbr.lower(): i for i, abbr in enumerate(calendar.month_abbr) if abbr}
+            if not all(abbr in months for abbr in names):
+                return None
+            fields['month'] = np.array([months[name] for name in names])[inverse]
+        else:
+            digits = columns.astype(np.int64) - ord('0')
+            if np.any((digits < 0) | (digits > 9)):
+                return None
+            fields[name] = digits @ 10 ** np.arange(end - start - 1, -1, -1)
+    if np.any(chars[:, between] != chars[0, between]):
+        return None
+
+    ones = np.ones(strings.size, dtype=np.int64)
+    years = (fields['year'] - 1970).astype('M8[Y]')
+    if 'dayofyear' in fields:
+        days = years + (fields['dayofyear'] - 1).astype('m8[D]')
+        if np.any((fields['dayofyear'] < 1) | (days.astype('M8[Y]') != years)):
+            return None
+        months = days.astype('M8[M]')
+        fields['month'] = months.astype(int) % 12 + 1
+        fields['day'] = (days - months).astype(int) + 1
+    fields.setdefault('month', ones)
+    fields.setdefault('day', ones)
+    if 'microsecond' in fields:
+        fields['microsecond'] *= 10 ** (6 - len(match.group('microsecond')))
+    months = years + (fields['month'] - 1).astype('m8[M]')
+    month_lengths = ((months + 1).astype('M8[D]') - months.astype('M8[D]')).astype(int)
+    if np.any((fields['month'] < 1) | (fields['month'] > 12) | (fields['day'] < 1) |
+              (fields['day'] > month_lengths) | (fields.get('hour', 0) > 23) |
+              (fields.get('minute', 0) > 59) | (fields.get('second', 0) > 59)):
+        return None
+
+    isot = np.tile(_ISOT_TEMPLATE, (strings.size, 1))
+    for name, start, width in _ISOT_FIELDS:
+        if name in fields:
+            for i in range(width):
+                isot[:, start + width - 1 - i] = ord('0') + fields[name] // 10**i % 10
+    return Time(isot.view('U26').ravel(), format='isot', **kwargs)
+
+
 @convert_time.register(str)
 def convert_time_str(time_string, **kwargs):
+    # Parsing the same string again, with the same arguments, gives a copy of
+    # the time from the cache
+    key = tuple(sorted(kwargs.items()))
+    try:
+        hash(key)
+    except TypeError:
+        return _convert_time_str(time_string, **kwargs)
+    return _cached_convert_time_str(time_string, key).copy()
+
+
+@lru_cache(maxsize=_TIME_STRING_CACHE_SIZE)
+def _cached_convert_time_str(time_string, kwargs):
+    return _convert_time_str(time_string, **dict(kwargs))
+
+
+def _convert_time_str(time_string, **kwargs):
     # remove trailing zeros and the final dot to allow any
     # number of zeros. This solves issue #289
     if '.' in time_string:
@@ -221,14 +393,9 @@ def convert_time_str(time_string, **kwargs):
     if 'TAI' in time_string:
         kwargs['scale'] = 'tai'
 
-    for time_format in TIME_FORMAT_LIST:
+    for time_format in _candidate_formats(time_string):
         try:
-            try:
-                ts, add_one_day = _regex_parse_time(time_string, time_format)
-            except TypeError:
-                break
-            if ts is None:
-                continue
+            ts, add_one_day = _regex_parse_time(time_string, time_format)
             t = Time.strptime(ts, time_format, **kwargs)
             if add_one_day:
                 t += _ONE_DAY_TIMEDELTA
@@ -240,17 +407,6 @@ def convert_time_str(time_string, **kwargs):
     return convert_time.dispatch(object)(time_string, **kwargs)
 
 
-def _get_time_fmt(time_string):
-    """
-    Try all the formats in TIME_FORMAT_LIST to work out which one applies to
-    the time string.
-    """
-    for time_format in TIME_FORMAT_LIST:
-        ts, _ = _regex_parse_time(time_string, time_format)
-        if ts is not None:
-            return time_format
-
-
 def _variables_for_parse_time_docstring():
     ret = {}
 
@@ -395,3 +551,79 @@ def julian_centuries(t='now'):
 
     # J1900.0 is 2415021.0
     return (parse_time(t).jd - 2415020.0) / DAYS_IN_JULIAN_CENTURY
+
+
+def _leap_second_table():
+    """
+    The starts of the periods of constant TAI-UTC since 1972, and the value of
+    TAI-UTC in each of them.
+    """
+    table = erfa.leap_seconds.get()
+    # Before 1972 TAI-UTC was not an integral number of seconds
+    table = table[table['year'] >= 1972]
+    starts = np.array([f'{year:04}-{month:02}-01' for year, month in table[['year', 'month']]],
+                      dtype='M8[ns]')
+    return starts, (table['tai_utc'] * _NS_PER_SECOND).astype(np.int64).astype('m8[ns]')
+
+
+@add_common_docstring(**_variables_for_parse_time_docstring())
+def offsets_to_datetime64(epoch, offsets):
+    """
+    Returns the times a number of offsets after an epoch, as `numpy.datetime64`
+    values with a nanosecond resolution.
+
+    This gives the same times as adding a `~astropy.time.TimeDelta` to the
+    epoch, but without going through `~astropy.time.Time` for every value, so
+    it is a much faster way to build the index of a time series.
+
+    Parameters
+    ----------
+    epoch : {parse_time_types}
+        The time the offsets are measured from.
+    offsets : `~astropy.units.Quantity`
+        The offsets from the epoch.
+
+    Returns
+    -------
+    `numpy.ndarray`
+        The times, with the ``datetime64[ns]`` dtype, in the time scale of
+        ``epoch``.
+
+    Notes
+    -----
+    Like the addition of a `~astropy.time.TimeDelta` to a time in UTC, the
+    offsets from an epoch in UTC count leap seconds since 1972. A time during
+    a leap second, which `numpy.datetime64` cannot represent, is given as the
+    start of the next second.
+
+    Examples
+    --------
+    >>> import astropy.units as u
+    >>> from sunpy.time import offsets_to_datetime64
+    >>> offsets_to_datetime64('2016-12-31 23:59:59', [0, 1.5, 2.5] * u.s)
+    array(['2016-12-31T23:59:59.000000000', '2017-01-01T00:00:00.000000000',
+           '2017-01-01T00:00:00.500000000'], dtype='datetime64[ns]')
+    """
+    epoch = parse_time(epoch)
+    if not epoch.isscalar:
+        raise ValueError("The epoch must be a single time.")
+    scale = epoch.scale
+    epoch = np.datetime64(Time(epoch, format='isot', precision=9).value, 'ns')
+
+    # Split the offsets into whole seconds and a fraction, so the offsets are
+    # not rounded to the precision of a float of nanoseconds
+    seconds = np.asanyarray(offsets.to_value(u.s), dtype=float)
+    whole = np.floor(seconds)
+    offsets = (whole.astype(np.int64) * _NS_PER_SECOND +
+               np.round((seconds - whole) * _NS_PER_SECOND).astype(np.int64)).astype('m8[ns]')
+    if scale != 'utc':
+        return epoch + offsets
+
+    # Count the offsets in TAI, and find the value of TAI-UTC at each time
+    starts, tai_utc = _leap_second_table()
+    first = max(np.searchsorted(starts, epoch, side='right') - 1, 0)
+    times = epoch + tai_utc[first] + offsets
+    period = np.clip(np.searchsorted(starts + tai_utc, times, side='right') - 1, 0, None)
+    in_leap_second = np.clip(np.searchsorted(starts + tai_utc - _ONE_SECOND, times, side='right') - 1,
+                             0, None)
+    return np.where(in_leap_second > period, starts[in_leap_second], times - tai_utc[period])
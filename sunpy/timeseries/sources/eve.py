@@ -10,10 +10,9 @@ from pandas import DataFrame, to_datetime
 from pandas.io.parsers import read_csv
 
 import astropy.units as u
-from astropy.time import TimeDelta
 
 import sunpy.io
-from sunpy.time import parse_time
+from sunpy.time import offsets_to_datetime64
 from sunpy.timeseries.timeseriesbase import GenericTimeSeries
 from sunpy.util.metadata import MetaDict
 from sunpy.visualization import peek_show
@@ -102,14 +101,12 @@ class ESPTimeSeries(GenericTimeSeries):
         # Adding telescope to MetaData
         header.update({'TELESCOP': hdulist[1].header['TELESCOP'].split()[0]})
 
-        start_time = parse_time(hdulist[1].header['T_OBS'])
-        times = start_time + TimeDelta(hdulist[1].data['SOD']*u.second)
+        times = offsets_to_datetime64(hdulist[1].header['T_OBS'], hdulist[1].data['SOD']*u.second)
 
         colnames = ['QD', 'CH_18', 'CH_26', 'CH_30', 'CH_36']
 
         all_data = [hdulist[1].data[x] for x in colnames]
-        data = DataFrame(np.array(all_data).T, index=times.isot.astype(
-            'datetime64'), columns=colnames)
+        data = DataFrame(np.array(all_data).T, index=times, columns=colnames)
         data.sort_index(inplace=True)
 
         units = OrderedDict([('QD', u.W/u.m**2),
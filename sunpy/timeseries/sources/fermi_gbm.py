@@ -8,10 +8,9 @@ import numpy as np
 import pandas as pd
 
 import astropy.units as u
-from astropy.time import TimeDelta
 
 import sunpy.io
-from sunpy.time import parse_time
+from sunpy.time import offsets_to_datetime64, parse_time
 from sunpy.timeseries.timeseriesbase import GenericTimeSeries
 from sunpy.util.metadata import MetaDict
 from sunpy.visualization import peek_show
@@ -135,9 +134,7 @@ class GBMSummaryTimeSeries(GenericTimeSeries):
 
         # get the time information in datetime format with the correct MET adjustment
         met_ref_time = parse_time('2001-01-01 00:00')  # Mission elapsed time
-        gbm_times = met_ref_time + TimeDelta(count_data['time'], format='sec')
-        gbm_times.precision = 9
-        gbm_times = gbm_times.isot.astype('datetime64')
+        gbm_times = offsets_to_datetime64(met_ref_time, count_data['time']*u.second)
 
         column_labels = ['4-15 keV', '15-25 keV', '25-50 keV', '50-100 keV',
                          '100-300 keV', '300-800 keV', '800-2000 keV']
@@ -14,12 +14,12 @@ from matplotlib import pyplot as plt
 from pandas import DataFrame
 
 import astropy.units as u
-from astropy.time import Time, TimeDelta
+from astropy.time import Time
 
 import sunpy.io
 from sunpy import log
 from sunpy.io.file_tools import UnrecognizedFileTypeError
-from sunpy.time import is_time_in_given_format, parse_time
+from sunpy.time import is_time_in_given_format, offsets_to_datetime64, parse_time
 from sunpy.timeseries.timeseriesbase import GenericTimeSeries
 from sunpy.util.metadata import MetaDict
 from sunpy.visualization import peek_show
@@ -174,8 +174,7 @@ class XRSTimeSeries(GenericTimeSeries):
         else:
             raise ValueError("Don't know how to parse this file")
 
-        times = start_time + TimeDelta(seconds_from_start*u.second)
-        times.precision = 9
+        times = offsets_to_datetime64(start_time, seconds_from_start*u.second)
 
         # remove bad values as defined in header comments
         xrsb[xrsb == -99999] = np.nan
@@ -186,7 +185,7 @@ class XRSTimeSeries(GenericTimeSeries):
         newxrsb = xrsb.byteswap().newbyteorder()
 
         data = DataFrame({'xrsa': newxrsa, 'xrsb': newxrsb},
-                         index=times.isot.astype('datetime64'))
+                         index=times)
         data.sort_index(inplace=True)
 
         # Add the units
@@ -211,17 +210,17 @@ class XRSTimeSeries(GenericTimeSeries):
                 xrsa = np.array(d["a_flux"])
                 xrsb = np.array(d["b_flux"])
                 start_time_str = d["time"].attrs["units"].astype(str).lstrip("seconds since").rstrip("UTC")
-                times = parse_time(start_time_str) + TimeDelta(d["time"], format="sec")
+                times = offsets_to_datetime64(start_time_str, np.array(d["time"])*u.second)
             elif "xrsa_flux" in d.variables:
                 xrsa = np.array(d["xrsa_flux"])
                 xrsb = np.array(d["xrsb_flux"])
                 start_time_str = d["time"].attrs["units"].astype(str).lstrip("seconds since")
-                times = parse_time(start_time_str) + TimeDelta(d["time"], format="sec")
+                times = offsets_to_datetime64(start_time_str, np.array(d["time"])*u.second)
 
             else:
                 raise ValueError(f"The file {filepath} doesn't seem to be a GOES netcdf file.")
 
-        data = DataFrame({"xrsa": xrsa, "xrsb": xrsb}, index=times.datetime)
+        data = DataFrame({"xrsa": xrsa, "xrsb": xrsb}, index=times)
         data = data.replace(-9999, np.nan)
         units = OrderedDict([("xrsa", u.W/u.m**2),
                              ("xrsb", u.W/u.m**2)])
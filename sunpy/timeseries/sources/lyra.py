@@ -7,11 +7,10 @@ from collections import OrderedDict
 import pandas
 
 import astropy.units as u
-from astropy.time import TimeDelta
 
 import sunpy.io
 from sunpy import config
-from sunpy.time import parse_time
+from sunpy.time import offsets_to_datetime64, parse_time
 from sunpy.timeseries.timeseriesbase import GenericTimeSeries
 from sunpy.util.metadata import MetaDict
 from sunpy.visualization import peek_show
@@ -134,10 +133,9 @@ class LYRATimeSeries(GenericTimeSeries):
         # First column are times.  For level 2 data, the units are [s].
         # For level 3 data, the units are [min]
         if hdulist[1].header['TUNIT1'] == 's':
-            times = start + TimeDelta(fits_record.field(0)*u.second)
+            times = offsets_to_datetime64(start, fits_record.field(0)*u.second)
         elif hdulist[1].header['TUNIT1'] == 'MIN':
-            td = [int(n) for n in fits_record.field(0)]
-            times = start + TimeDelta(td*u.minute)
+            times = offsets_to_datetime64(start, fits_record.field(0).astype(int)*u.minute)
         else:
             raise ValueError("Time unit in LYRA fits file not recognised.  "
                              "Value = {}".format(hdulist[1].header['TUNIT1']))
@@ -153,8 +151,7 @@ class LYRATimeSeries(GenericTimeSeries):
                 table[col.name] = fits_record.field(i + 1)
 
         # Return the header and the data
-        times.precision = 9
-        data = pandas.DataFrame(table, index=times.isot.astype('datetime64'))
+        data = pandas.DataFrame(table, index=times)
         data.sort_index(inplace=True)
 
         # Add the units data
@@ -9,9 +9,7 @@ import pandas as pd
 from pandas.io.parsers import read_csv
 
 import astropy.units as u
-from astropy.time import Time
 
-from sunpy.time import parse_time
 from sunpy.timeseries.timeseriesbase import GenericTimeSeries
 from sunpy.util.decorators import deprecated
 from sunpy.util.metadata import MetaDict
@@ -149,9 +147,7 @@ class NOAAIndicesTimeSeries(GenericTimeSeries):
             data = read_csv(fp, delim_whitespace=True, names=fields,
                             comment='#', dtype={'yyyy': np.str, 'mm': np.str})
             data = data.dropna(how='any')
-            timeindex = Time.strptime([x + y for x, y in zip(data['yyyy'], data['mm'])], '%Y%m')
-            timeindex.precision = 9
-            data['time'] = timeindex.isot.astype('datetime64')
+            data['time'] = pd.to_datetime(data['yyyy'] + data['mm'], format='%Y%m')
             data = data.set_index('time')
             data = data.drop('mm', 1)
             data = data.drop('yyyy', 1)
@@ -194,8 +190,6 @@ class NOAAIndicesTimeSeries(GenericTimeSeries):
         # Convoluted time index handling
         data = data.set_index('time-tag')
         data.index = pd.DatetimeIndex(data.index.values)
-        data.index = pd.DatetimeIndex(parse_time(
-            [x for x in data.index.values]).isot.astype('datetime64'))
 
         # Add the units data, reported in radio flux values (sfu) originally.
         units = OrderedDict([('sunspot RI', u.dimensionless_unscaled),
@@ -332,9 +326,7 @@ class NOAAPredictIndicesTimeSeries(GenericTimeSeries):
                             comment='#', skiprows=2, dtype={'yyyy': np.str, 'mm': np.str})
             data = data.dropna(how='any')
 
-            timeindex = Time.strptime([x + y for x, y in zip(data['yyyy'], data['mm'])], '%Y%m')
-            timeindex.precision = 9
-            data['time'] = timeindex.isot.astype('datetime64')
+            data['time'] = pd.to_datetime(data['yyyy'] + data['mm'], format='%Y%m')
 
             data = data.set_index('time')
             data = data.drop('mm', 1)
@@ -373,8 +365,6 @@ class NOAAPredictIndicesTimeSeries(GenericTimeSeries):
         # Convoluted time index handling
         data = data.set_index('time-tag')
         data.index = pd.DatetimeIndex(data.index.values)
-        data.index = pd.DatetimeIndex(parse_time(
-            [x for x in data.index.values]).isot.astype('datetime64'))
         # Add the units data, reported in radio flux values (sfu) originally.
         units = OrderedDict([('sunspot', u.dimensionless_unscaled),
                              ('sunspot high', u.dimensionless_unscaled),
@@ -9,11 +9,10 @@ import numpy as np
 import pandas
 
 import astropy.units as u
-from astropy.time import TimeDelta
 
 import sunpy.io
 from sunpy import config
-from sunpy.time import parse_time
+from sunpy.time import offsets_to_datetime64, parse_time
 from sunpy.timeseries.timeseriesbase import GenericTimeSeries
 from sunpy.util.metadata import MetaDict
 from sunpy.visualization import peek_show
@@ -123,9 +122,7 @@ class NoRHTimeSeries(GenericTimeSeries):
         cadence = float(header['CDELT1'])
         sec_array = np.linspace(0, length - 1, int(length / cadence))
 
-        norh_time = obs_start_time + TimeDelta(sec_array*u.second)
-        norh_time.precision = 9
-        norh_time = norh_time.isot.astype('datetime64')
+        norh_time = offsets_to_datetime64(obs_start_time, sec_array*u.second)
 
         # Add the units data
         units = OrderedDict([('Correlation Coefficient', u.dimensionless_unscaled)])
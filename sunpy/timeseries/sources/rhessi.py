@@ -11,10 +11,9 @@ import numpy as np
 from pandas import DataFrame
 
 import astropy.units as u
-from astropy.time import TimeDelta
 
 import sunpy.io
-from sunpy.time import parse_time
+from sunpy.time import offsets_to_datetime64, parse_time
 from sunpy.timeseries.timeseriesbase import GenericTimeSeries
 from sunpy.util.metadata import MetaDict
 from sunpy.visualization import peek_show
@@ -86,8 +85,9 @@ def parse_observing_summary_hdulist(hdulist):
     countrate = uncompress_countrate(compressed_countrate)
     dim = np.array(countrate[:, 0]).size
 
-    time_array = parse_time(reference_time_ut) + \
-        TimeDelta(time_interval_sec * np.arange(dim) * u.second)
+    # The times are built straight from the reference time and the interval,
+    # as the datetime64 values the dataframe takes
+    time_array = offsets_to_datetime64(reference_time_ut, time_interval_sec * np.arange(dim) * u.s)
 
     #  TODO generate the labels for the dict automatically from labels
     data = {'time': time_array, 'data': countrate, 'labels': labels}
@@ -215,8 +215,6 @@ class RHESSISummaryTimeSeries(GenericTimeSeries):
             A HDU list.
         """
         header, d = parse_observing_summary_hdulist(hdulist)
-        # The time of dict `d` is astropy.time, but dataframe can only take datetime
-        d['time'] = d['time'].datetime
         header = MetaDict(OrderedDict(header))
         data = DataFrame(d['data'], columns=d['labels'], index=d['time'])
         # Add the units data
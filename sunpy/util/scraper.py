@@ -3,23 +3,29 @@ This module provides a web scraper.
 """
 import os
 import re
+import html
+import time
 import calendar
 import warnings
+import functools
+import threading
 from time import sleep
 from ftplib import FTP
 from datetime import datetime
 from urllib.error import HTTPError
 from urllib.parse import urlsplit
 from urllib.request import urlopen
+from concurrent.futures import ThreadPoolExecutor
 
-from bs4 import BeautifulSoup
+import numpy as np
 from dateutil.relativedelta import relativedelta
 
 import astropy.units as u
 from astropy.time import Time, TimeDelta
 
 from sunpy import log
-from sunpy.extern.parse import parse
+from sunpy.data import listing_cache
+from sunpy.extern.parse import compile as compile_format
 from sunpy.time import TimeRange
 from sunpy.util.exceptions import SunpyUserWarning
 
@@ -34,6 +40,178 @@ TIME_CONVERSIONS = {'%Y': r'\d{4}', '%y': r'\d{2}',
                     '%M': r'\d{2}',
                     '%S': r'\d{2}', '%e': r'\d{3}', '%f': r'\d{6}'}
 
+# The names of the groups which capture the time format codes in a compiled
+# pattern. '%B' is not captured as its conversion only matches one character,
+# and '%e' is not as the milliseconds are not used for the date of a file.
+_TIME_GROUPS = {'%Y': 'year', '%y': 'year_2digit', '%b': 'month_abbr', '%m': 'month',
+                '%d': 'day', '%j': 'day_of_year', '%H': 'hour', '%I': 'hour_12',
+                '%M': 'minute', '%S': 'second', '%f': 'microsecond'}
+
+_MONTH_ABBRS = {abbr: month for month, abbr in enumerate(calendar.month_abbr) if abbr}
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_pattern(pattern):
+    """
+    Compile a scraper pattern into a regular expression, in which the first
+    occurrence of each time format code is a named group.
+    """
+    groups = set()
+    parts = []
+    for part in re.split('({})'.format('|'.join(TIME_CONVERSIONS)), pattern):
+        if part in TIME_CONVERSIONS:
+            name = _TIME_GROUPS.get(part)
+            if name is not None and name not in groups:
+                groups.add(name)
+                part = f'(?P<{name}>{TIME_CONVERSIONS[part]})'
+            else:
+                part = TIME_CONVERSIONS[part]
+        parts.append(part)
+    return re.compile(''.join(parts))
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_extractor(extractor):
+    """
+    Compile a `sunpy.extern.parse` format which extracts metadata from URLs.
+    """
+    return compile_format(extractor)
+
+
+def _dates_from_matches(matches):
+    """
+    Build the dates of URLs from the time fields captured by the matches of a
+    compiled pattern.
+
+    The fields are converted for all the URLs at once, and the dates default
+    to 1900-01-01 00:00 as in `~datetime.datetime.strptime`.
+
+    Returns
+    -------
+    `numpy.ndarray`
+        The dates as ``datetime64[us]``.
+    """
+    groups = matches[0].re.groupindex
+
+    def field(name, default=0):
+        if name not in groups:
+            return np.full(len(matches), default)
+        return np.array([match[name] for match in matches]).astype(int)
+
+    if 'year' in groups:
+        year = field('year')
+    elif 'year_2digit' in groups:
+        year = field('year_2digit')
+        year = np.where(year < 69, year + 2000, year + 1900)
+    else:
+        year = field('year', 1900)
+    if 'month_abbr' in groups:
+        month = np.array([_MONTH_ABBRS[match['month_abbr']] for match in matches])
+    else:
+        month = field('month', 1)
+
+    dates = (year - 1970).astype('datetime64[Y]').astype('datetime64[M]')
+    if 'day_of_year' in groups:
+        dates = dates.astype('datetime64[D]') + (field('day_of_year') - 1)
+    else:
+        dates = (dates + (month - 1)).astype('datetime64[D]') + (field('day', 1) - 1)
+    hour = field('hour') if 'hour' in groups else field('hour_12') % 12
+    return (dates.astype('datetime64[us]') + hour * np.timedelta64(3600000000, 'us')
+            + field('minute') * np.timedelta64(60000000, 'us')
+            + field('second') * np.timedelta64(1000000, 'us')
+            + field('microsecond') * np.timedelta64(1, 'us'))
+
+
+def _timeranges_from_exdicts(exdicts):
+    """
+    Compute the time ranges of URLs from their extracted metadata, as
+    `get_timerange_from_exdict` does for one URL, for all the URLs at once.
+
+    Returns
+    -------
+    `tuple` of `numpy.ndarray`
+        The starts and the ends of the time ranges as ``datetime64[us]``.
+    """
+    keys = set(exdicts[0])
+
+    def field(name, default):
+        return np.array([int(exdict.get(name, default)) for exdict in exdicts])
+
+    year = (field('year', 1) - 1970).astype('datetime64[Y]')
+    month = year.astype('datetime64[M]') + (field('month', 1) - 1)
+    day = month.astype('datetime64[D]') + (field('day', 1) - 1)
+    # As in get_timerange_from_exdict, the milliseconds are the microseconds
+    # of the start time
+    start = (day.astype('datetime64[us]')
+             + field('hour', 0) * np.timedelta64(3600000000, 'us')
+             + field('minute', 0) * np.timedelta64(60000000, 'us')
+             + field('second', 0) * np.timedelta64(1000000, 'us')
+             + field('millisecond', 0) * np.timedelta64(1, 'us'))
+
+    duration = np.timedelta64(1000, 'us')
+    if 'year' in keys:
+        duration = (year + 1).astype('datetime64[us]') - year.astype('datetime64[us]')
+    if 'month' in keys:
+        duration = (month + 1).astype('datetime64[us]') - month.astype('datetime64[us]')
+    for key, unit in [('day', 'D'), ('hour', 'h'), ('minute', 'm'), ('second', 's')]:
+        if key in keys:
+            duration = np.timedelta64(1, unit).astype('timedelta64[us]')
+    return start, start + duration - np.timedelta64(1000, 'us')
+
+
+# The default maximum number of directories which are listed at the same time
+_DEFAULT_WORKERS = 8
+
+# The href attributes of the anchor tags in a HTML directory listing, with the
+# value in double, single or no quotes
+_HREF_RE = re.compile(r"""<a\s[^>]*?\bhref\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""",
+                      re.IGNORECASE)
+
+
+def _extract_hrefs(page):
+    """
+    Return the href attributes of the links in a HTML page.
+
+    This only looks for the ``<a>`` tags with a regular expression, which is
+    much faster than parsing the whole page.
+    """
+    return [html.unescape(''.join(groups)) for groups in _HREF_RE.findall(page)]
+
+
+class _HostThrottle:
+    """
+    Space out the requests to each host by at least ``interval`` seconds, and
+    hold back all the requests to a host which has asked to wait, with a 429
+    response, until the time it asked for has passed.
+    """
+
+    def __init__(self, interval):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_request = {}
+
+    def wait(self, host):
+        """
+        Block until the next request to ``host`` can be made.
+        """
+        with self._lock:
+            now = time.monotonic()
+            request_time = max(now, self._next_request.get(host, now))
+            self._next_request[host] = request_time + self.interval
+        if request_time > now:
+            sleep(request_time - now)
+
+    def pause(self, host, seconds):
+        """
+        Hold back the requests to ``host`` for ``seconds``.
+        """
+        with self._lock:
+            resume = time.monotonic() + seconds
+            self._next_request[host] = max(self._next_request.get(host, resume), resume)
+
+
+_host_throttle = _HostThrottle(interval=0.02)
+
 
 class Scraper:
     """
@@ -116,18 +294,26 @@ class Scraper:
             All the possible directories valid for the time range given.
             Notice that these directories may not exist in the archive.
         """
+        return [directory for directory, _ in self._directory_periods(timerange)]
+
+    def _directory_periods(self, timerange):
+        """
+        Gets the directories for a certain range of time, with the end of the
+        period of time each of them covers, or `None` if the directories are
+        not split by time.
+        """
         # find directory structure - without file names
         if '/' in self.pattern:
             directorypattern = '/'.join(self.pattern.split('/')[:-1]) + '/'
         timestep = self._smallerPattern(directorypattern)
         if timestep is None:
-            return [directorypattern]
+            return [(directorypattern, None)]
         else:
             directories = []
             cur = self._date_floor(timerange.start, timestep)
             end = self._date_floor(timerange.end, timestep) + timestep
             while cur < end:
-                directories.append(cur.strftime(directorypattern))
+                directories.append((cur.strftime(directorypattern), cur + timestep))
                 cur = cur + timestep
 
             return directories
@@ -172,10 +358,7 @@ class Scraper:
         """
         Check whether the url provided follows the pattern.
         """
-        pattern = self.pattern
-        for k, v in TIME_CONVERSIONS.items():
-            pattern = pattern.replace(k, v)
-        matches = re.match(pattern, url)
+        matches = _compile_pattern(self.pattern).match(url)
         if matches:
             return matches.end() == matches.endpos
         return False
@@ -186,69 +369,63 @@ class Scraper:
         """
         # remove the user and passwd from files if there:
         url = url.replace("anonymous:data@sunpy.org@", "")
+        matches = _compile_pattern(self.pattern).match(url)
+        if matches is None:
+            raise ValueError(f'{url} does not follow the pattern {self.pattern}')
+        return Time(_dates_from_matches([matches])[0])
+
+    def _files_in_timerange(self, urls, timerange):
+        """
+        Return those of the URLs which follow the pattern and whose time is
+        within the given time range.
 
-        def url_to_list(txt):
-            # Substitutes '.' and '_' for '/'.
-            return re.sub(r'\.|_', '/', txt).split('/')
-
-        # create a list of all the blocks in times - assuming they are all
-        # separated with either '.', '_' or '/'.
-        pattern_list = url_to_list(self.pattern)
-        url_list = url_to_list(url)
-        time_order = ['%Y', '%y', '%b', '%B', '%m', '%d', '%j',
-                      '%H', '%I', '%M', '%S', '%e', '%f']
-        final_date = []
-        final_pattern = []
-        # Find in directory and filename
-        for pattern_elem, url_elem in zip(pattern_list, url_list):
-            time_formats = [x for x in time_order if x in pattern_elem]
-            if len(time_formats) > 0:
-                # Find whether there's text that should not be here
-                toremove = re.split('%.', pattern_elem)
-                if len(toremove) > 0:
-                    for bit in toremove:
-                        if bit != '':
-                            url_elem = url_elem.replace(bit, '', 1)
-                            pattern_elem = pattern_elem.replace(bit, '', 1)
-                final_date.append(url_elem)
-                final_pattern.append(pattern_elem)
-                for time_bit in time_formats:
-                    time_order.remove(time_bit)
-        # Find and remove repeated elements eg: %Y in ['%Y', '%Y%m%d']
-        # Make all as single strings
-        date_together = ''.join(final_date)
-        pattern_together = ''.join(final_pattern)
-        re_together = pattern_together
-        for k, v in TIME_CONVERSIONS.items():
-            re_together = re_together.replace(k, v)
-
-        # Lists to contain the unique elements of the date and the pattern
-        final_date = list()
-        final_pattern = list()
-        re_together = re_together.replace('[A-Z]', '\\[A-Z]')
-        for p, r in zip(pattern_together.split('%')[1:], re_together.split('\\')[1:]):
-            if p == 'e':
-                continue
-            regexp = fr'\{r}' if not r.startswith('[') else r
-            pattern = f'%{p}'
-            date_part = re.search(regexp, date_together)
-            date_together = date_together[:date_part.start()] \
-                + date_together[date_part.end():]
-            if pattern not in final_pattern:
-                final_pattern.append(f'%{p}')
-                final_date.append(date_part.group())
-        return Time.strptime(' '.join(final_date),
-                             ' '.join(final_pattern))
-
-    def filelist(self, timerange):
+        The pattern is compiled once into a regular expression which both
+        checks the URLs and captures their time fields, and the dates of all
+        the URLs are then compared with the time range at once.
+        """
+        regex = _compile_pattern(self.pattern)
+        matches = [regex.match(url) for url in urls]
+        matches = [match for match in matches if match and match.end() == match.endpos]
+        if not matches:
+            return []
+        if hasattr(self, 'extractor'):
+            # Only the time fields are needed, as strings, so the values of
+            # the fields are not converted by the parser
+            parser = _compile_extractor(self.extractor)
+            parsed = [parser.parse(match.string, evaluate_result=False) for match in matches]
+            matches = [match for match, result in zip(matches, parsed) if result is not None]
+            if not matches:
+                return []
+            start, end = _timeranges_from_exdicts([result.match.groupdict() for result in parsed
+                                                   if result is not None])
+        else:
+            start = end = _dates_from_matches(matches)
+        in_range = ((end >= np.datetime64(timerange.start.to_datetime(), 'us'))
+                    & (start <= np.datetime64(timerange.end.to_datetime(), 'us')))
+        return [match.string for match, keep in zip(matches, in_range) if keep]
+
+    def filelist(self, timerange, workers=_DEFAULT_WORKERS, cache=True):
         """
         Returns the list of existent files in the archive for the given time
         range.
 
+        The directories are listed concurrently. The requests to each web
+        server are spaced out, and when a server responds that there are too
+        many requests (HTTP 429) all the requests to it wait for as long as
+        it asks before they are retried.
+
         Parameters
         ----------
         timerange : `~sunpy.time.TimeRange`
             Time interval where to find the directories for a given pattern.
+        workers : `int`, optional
+            The maximum number of directories which are listed at the same
+            time. Defaults to 8, and 1 lists them one after the other.
+        cache : `bool`, optional
+            Whether to reuse the listings of remote directories which are
+            stored in `sunpy.data.listing_cache`, and to store the listings
+            of the other directories there. Defaults to `True`. The local
+            directories are always listed.
 
         Returns
         -------
@@ -279,33 +456,78 @@ class Scraper:
         on such end time.
         """
         directories = self.range(timerange)
-        filesurls = []
         if urlsplit(directories[0]).scheme == "ftp":
-            return self._ftpfileslist(timerange)
+            return self._ftpfileslist(timerange, workers, cache)
         if urlsplit(directories[0]).scheme == "file":
-            return self._localfilelist(timerange)
-        while directories:
-            directory = directories.pop(0)
+            return self._localfilelist(timerange, workers)
+
+        def list_directories(directories):
+            return self._list_directories(self._http_directory_list, directories, workers)
+
+        directories, listings = self._cached_listings(timerange, list_directories, cache)
+        fullpaths = []
+        for directory, hrefs in zip(directories, listings):
+            for href in hrefs:
+                if href.endswith(self.pattern.split('.')[-1]):
+                    if href[0] == '/':
+                        fullpaths.append(self.domain + href[1:])
+                    else:
+                        fullpaths.append(directory + href)
+        return self._files_in_timerange(fullpaths, timerange)
+
+    def _cached_listings(self, timerange, list_directories, cache):
+        """
+        Return the directories for the time range and their listings.
+
+        The listings are taken from `sunpy.data.listing_cache` if ``cache`` is
+        True, and the other directories are listed with ``list_directories``,
+        which takes and returns a list. Its listing of a directory which does
+        not exist, or could not be listed, is `None`. That directory has no
+        files, but its listing is not stored, so that it is listed again.
+        """
+        periods = self._directory_periods(timerange)
+        directories = [directory for directory, _ in periods]
+        if not cache:
+            return directories, [listing or [] for listing in list_directories(directories)]
+        listings = listing_cache.find(directories)
+        missing = [directory for directory in directories if directory not in listings]
+        if missing:
+            listings.update(zip(missing, list_directories(missing)))
+            listing_cache.store((directory, listings[directory], end)
+                                for directory, end in periods
+                                if directory in missing and listings[directory] is not None)
+        return directories, [listings[directory] or [] for directory in directories]
+
+    @staticmethod
+    def _list_directories(list_directory, directories, workers):
+        """
+        Call ``list_directory`` on each of the directories, with up to
+        ``workers`` directories listed at the same time, and return the
+        listings in the order of the directories.
+        """
+        workers = min(workers, len(directories))
+        if workers <= 1:
+            return [list_directory(directory) for directory in directories]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(list_directory, directories))
+
+    @staticmethod
+    def _http_directory_list(directory):
+        """
+        Return the links in the HTML listing of a directory, or `None` if
+        the directory does not exist.
+        """
+        host = urlsplit(directory).netloc
+        while True:
+            _host_throttle.wait(host)
             try:
-                opn = urlopen(directory)
-                try:
-                    soup = BeautifulSoup(opn, "html.parser")
-                    for link in soup.find_all("a"):
-                        href = link.get("href")
-                        if href is not None and href.endswith(self.pattern.split('.')[-1]):
-                            if href[0] == '/':
-                                fullpath = self.domain + href[1:]
-                            else:
-                                fullpath = directory + href
-                            if self._URL_followsPattern(fullpath):
-                                if self._check_timerange(fullpath, timerange):
-                                    filesurls.append(fullpath)
-                finally:
-                    opn.close()
+                with urlopen(directory) as opn:
+                    charset = opn.headers.get_content_charset() or 'utf-8'
+                    return _extract_hrefs(opn.read().decode(charset, errors='replace'))
             except HTTPError as http_err:
                 # Ignore missing directories (issue #2684).
                 if http_err.code == 404:
-                    continue
+                    return None
                 if http_err.code == 429:
                     # See if the server has told us how long to back off for
                     retry_after = http_err.hdrs.get('Retry-After', 1)
@@ -319,39 +541,46 @@ class Scraper:
                         f"Got 429 while scraping {directory}, waiting for {retry_after} seconds before retrying."
                     )
 
-                    sleep(retry_after)
-
-                    # Put this dir back on the queue
-                    directories.insert(0, directory)
+                    # Hold back the other requests to this host as well, and
+                    # then retry this directory
+                    _host_throttle.pause(host, retry_after)
                     continue
                 raise
-            except Exception:
-                raise
-        return filesurls
 
-    def _ftpfileslist(self, timerange):
-        directories = self.range(timerange)
-        filesurls = list()
-        ftpurl = urlsplit(directories[0]).netloc
-        with FTP(ftpurl, user="anonymous", passwd="data@sunpy.org") as ftp:
-            for directory in directories:
-                try:
-                    ftp.cwd(urlsplit(directory).path)
-                except Exception as e:
-                    log.debug(f"FTP CWD: {e}")
-                    continue
-                for file_i in ftp.nlst():
-                    fullpath = directory + file_i
-                    if self._URL_followsPattern(fullpath):
-                        if self._check_timerange(fullpath, timerange):
-                            filesurls.append(fullpath)
+    def _ftpfileslist(self, timerange, workers=_DEFAULT_WORKERS, cache=True):
+        ftpurl = urlsplit(self.range(timerange)[0]).netloc
+
+        def list_chunk(chunk):
+            # Each thread lists its directories over its own connection
+            listings = []
+            with FTP(ftpurl, user="anonymous", passwd="data@sunpy.org") as ftp:
+                for directory in chunk:
+                    try:
+                        ftp.cwd(urlsplit(directory).path)
+                    except Exception as e:
+                        log.debug(f"FTP CWD: {e}")
+                        listings.append(None)
+                        continue
+                    listings.append(ftp.nlst())
+            return listings
+
+        def list_directories(directories):
+            chunk_size = -(-len(directories) // min(workers, len(directories)))
+            chunks = [directories[i:i + chunk_size] for i in range(0, len(directories), chunk_size)]
+            return [listing for chunk_listings in self._list_directories(list_chunk, chunks, workers)
+                    for listing in chunk_listings]
+
+        directories, listings = self._cached_listings(timerange, list_directories, cache)
+        filesurls = self._files_in_timerange(
+            [directory + file_i for directory, listing in zip(directories, listings)
+             for file_i in listing], timerange)
 
         filesurls = [f'ftp://' + "{0.netloc}{0.path}".format(urlsplit(url))
                      for url in filesurls]
 
         return filesurls
 
-    def _localfilelist(self, timerange):
+    def _localfilelist(self, timerange, workers=_DEFAULT_WORKERS):
         pattern = self.pattern
         pattern_temp = pattern.replace('file://', '')
         if os.name == 'nt':
@@ -361,42 +590,16 @@ class Scraper:
             prefix = 'file://'
         self.pattern = pattern_temp
         directories = self.range(timerange)
-        filepaths = list()
-        for directory in directories:
-            for file_i in os.listdir(directory):
-                fullpath = directory + file_i
-                if self._URL_followsPattern(fullpath):
-                    if self._check_timerange(fullpath, timerange):
-                        filepaths.append(fullpath)
+        try:
+            listings = self._list_directories(os.listdir, directories, workers)
+            filepaths = self._files_in_timerange(
+                [directory + file_i for directory, listing in zip(directories, listings)
+                 for file_i in listing], timerange)
+        finally:
+            self.pattern = pattern
         filepaths = [prefix + path for path in filepaths]
-        self.pattern = pattern
         return filepaths
 
-    def _check_timerange(self, url, timerange):
-        """
-        Checks whether the time extracted from the URL
-        is valid according to the given time range.
-
-        Parameters
-        ----------
-        url: `str`
-            URL of the file.
-        timerange : `~sunpy.time.TimeRange`
-            Time interval for which files were searched.
-
-        Returns
-        -------
-        `bool`
-            `True` if URL's time overlaps the given timerange, else `False`.
-        """
-        if hasattr(self, 'extractor'):
-            exdict = parse(self.extractor, url).named
-            tr = get_timerange_from_exdict(exdict)
-            return (tr.end >= timerange.start and tr.start <= timerange.end)
-        else:
-            datehref = self._extractDateURL(url).to_datetime()
-            return (timerange.start.to_datetime() <= datehref <= timerange.end.to_datetime())
-
     def _smallerPattern(self, directoryPattern):
         """
         Obtain the smaller time step for the given pattern.
@@ -439,9 +642,10 @@ class Scraper:
         """
         self.extractor = extractor
         urls = self.filelist(timerange)
+        parser = _compile_extractor(extractor)
         metalist = []
         for url in urls:
-            metadict = parse(extractor, url)
+            metadict = parser.parse(url)
             if metadict is not None:
                 append = True
                 metadict = metadict.named
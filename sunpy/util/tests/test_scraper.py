@@ -1,4 +1,6 @@
+import time
 import datetime
+from http.server import BaseHTTPRequestHandler
 from unittest.mock import Mock, patch
 
 import pytest
@@ -6,7 +8,7 @@ from dateutil.relativedelta import relativedelta
 
 from sunpy.data.test import rootdir
 from sunpy.time import TimeRange, parse_time
-from sunpy.util.scraper import Scraper, get_timerange_from_exdict
+from sunpy.util.scraper import Scraper, _extract_hrefs, _HostThrottle, get_timerange_from_exdict
 
 PATTERN_EXAMPLES = [
     ('%b%y', relativedelta(months=1)),
@@ -142,6 +144,46 @@ def testExtractDates_notSeparators_andSimilar():
     assert s._extractDateURL(testURL) == timeURL
 
 
+@pytest.mark.parametrize('pattern, url, date', [
+    ('data/%Y/%j/file_%Y%j_%H%M.dat', 'data/2016/060/file_2016060_1230.dat', (2016, 2, 29, 12, 30)),
+    ('data/%y/%b/AeH%y%b.1m', 'data/98/Oct/AeH98Oct.1m', (1998, 10, 1)),
+    ('data/%y/%m%d_%I%M.dat', 'data/05/0102_1201.dat', (2005, 1, 2, 0, 1)),
+    ('data/%Y%m%d_%H%M%S_%f.dat', 'data/20200102_030405_123456.dat', '2020-01-02 03:04:05.123456'),
+    ('data/%H%M.dat', 'data/1020.dat', (1900, 1, 1, 10, 20))])
+def testExtractDates_formats(pattern, url, date):
+    s = Scraper(pattern)
+    assert s._extractDateURL(url) == parse_time(date)
+
+
+def test_extract_dates_not_following_pattern():
+    s = Scraper('data/%Y/%m/%d/fits/swap/swap_00174_fd_%Y%m%d_%H%M%S.fts.gz')
+    with pytest.raises(ValueError):
+        s._extractDateURL('data/2014/05/14/fits/eit/eit_fd_20140514_200135.fts.gz')
+
+
+def test_files_in_timerange():
+    s = Scraper('data/%Y/%m/%d/fd_%Y%m%d_%H%M%S.fts')
+    urls = [f'data/2014/05/{day:02}/fd_201405{day:02}_{hour:02}0000.fts'
+            for day in [13, 14, 15] for hour in [0, 12]]
+    urls.insert(2, 'data/2014/05/14/fd_20140514_120000.fts.gz')
+    timerange = TimeRange('2014/05/13 12:00', '2014/05/15 00:00')
+    assert s._files_in_timerange(urls, timerange) == [
+        'data/2014/05/13/fd_20140513_120000.fts',
+        'data/2014/05/14/fd_20140514_000000.fts',
+        'data/2014/05/14/fd_20140514_120000.fts',
+        'data/2014/05/15/fd_20140515_000000.fts']
+
+
+def test_files_in_timerange_extractor():
+    s = Scraper('data/%Y/%m/fd_%Y%m%d.fts')
+    # The files cover a whole day, which overlaps with the time range
+    s.extractor = 'data/{:4d}/{:2d}/fd_{year:4d}{month:2d}{day:2d}.fts'
+    urls = [f'data/2016/02/fd_201602{day:02}.fts' for day in range(26, 30)]
+    urls.append('data/2016/03/fd_20160301.fts')
+    timerange = TimeRange('2016/02/27 23:00', '2016/02/29 01:00')
+    assert s._files_in_timerange(urls, timerange) == urls[1:4]
+
+
 def testURL_pattern():
     s = Scraper('fd_%Y%m%d_%H%M%S.fts')
     assert s._URL_followsPattern('fd_20130410_231211.fts')
@@ -238,6 +280,98 @@ def test_filelist_relative_hrefs():
     assert fileurls[1] == s.domain + 'pub/archive/2016/05/18/bbso_halph_fr_20160518_160033.fts'
 
 
+class _ArchiveHandler(BaseHTTPRequestHandler):
+    """
+    Serve the listings of a daily archive of January 2020, in which the
+    directory of the 3rd is missing and the first request for the 5th gets a
+    429 response.
+    """
+    def do_GET(self):
+        self.server.requests.append(self.path)
+        year, month, day = self.path.strip('/').split('/')
+        if day == '03':
+            self.send_response(404)
+            self.end_headers()
+            return
+        if day == '05' and self.server.requests.count(self.path) == 1:
+            self.send_response(429)
+            self.send_header('Retry-After', '1')
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.end_headers()
+        name = f'file_{year}{month}{day}'
+        self.wfile.write(f"""<html><body>
+            <a href="?C=N;O=D">Name</a> <a name="top"></a>
+            <a href="{name}_0000.fits">{name}_0000.fits</a>
+            <A HREF='{self.path}{name}_1200.fits'>{name}_1200.fits</A>
+            <a class="file" href={name}_1800.fits.gz>{name}_1800.fits.gz</a>
+            </body></html>""".encode())
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def archive(http_server):
+    server = http_server(_ArchiveHandler)
+    server.requests = []
+    return server
+
+
+def test_extract_hrefs():
+    page = """<a href="a.fits">a</a><A HREF='b.fits'>b</A><a id=x href=c.fits>c</a>
+              <a name="top"></a><link href="style.css"><a\nhref="d?x=1&amp;y=2">d</a>"""
+    assert _extract_hrefs(page) == ['a.fits', 'b.fits', 'c.fits', 'd?x=1&y=2']
+
+
+@pytest.mark.parametrize('workers', [1, 4])
+def test_filelist_http(archive, listing_cache, workers):
+    root = archive.url
+    s = Scraper(root + '%Y/%m/%d/file_%Y%m%d_%H%M.fits')
+    urls = s.filelist(TimeRange('2020-01-02', '2020-01-05 23:00'), workers=workers)
+    assert urls == [root + f'2020/01/{day:02}/file_202001{day:02}_{hour}.fits'
+                    for day in [2, 4, 5] for hour in ['0000', '1200']]
+    # The directory of the 5th was requested again after the 429 response
+    assert archive.requests.count('/2020/01/05/') == 2
+
+
+def test_filelist_http_cached(archive, listing_cache):
+    root = archive.url
+    s = Scraper(root + '%Y/%m/%d/file_%Y%m%d_%H%M.fits')
+    timerange = TimeRange('2020-01-01', '2020-01-04 23:00')
+    urls = s.filelist(timerange)
+    assert len(archive.requests) == 4
+    # The missing directory is not cached
+    assert s.filelist(timerange) == urls
+    assert archive.requests[4:] == ['/2020/01/03/']
+    # Only the directories which are not cached yet are listed
+    assert len(s.filelist(TimeRange('2020-01-03', '2020-01-06 23:00'))) == 6
+    assert sorted(archive.requests[5:]) == ['/2020/01/03/', '/2020/01/05/', '/2020/01/05/', '/2020/01/06/']
+
+    assert s.filelist(timerange, cache=False) == urls
+    assert len(archive.requests) == 13
+
+
+def test_host_throttle():
+    throttle = _HostThrottle(interval=0)
+    throttle.pause('example.com', 0.2)
+    start = time.monotonic()
+    throttle.wait('example.org')
+    assert time.monotonic() - start < 0.1
+    throttle.wait('example.com')
+    assert time.monotonic() - start >= 0.2
+
+
+def test_host_throttle_interval():
+    throttle = _HostThrottle(interval=0.05)
+    start = time.monotonic()
+    for _ in range(3):
+        throttle.wait('example.com')
+    assert time.monotonic() - start >= 0.1
+
+
 @pytest.mark.parametrize('pattern, check_file', [
     (r'MyFile_%Y_%M_%e\.(\D){2}\.fits', 'MyFile_2020_55_234.aa.fits'),
     (r'(\d){5}_(\d){2}\.fts', '01122_25.fts'),